@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+작업단계 매처 벤치마크
+
+큰 합성 작업단계 목록으로 기존 선형 탐색 방식(옵션마다 키워드 dict를 다시 만들고 부분 문자열을 검사)과
+v2 `TaskMatcher`(Aho-Corasick + 목록 컴파일 + 결과 기억)를 비교하고 다음 지표를 보고합니다.
+- 호출 1회당 시간: 기존 방식 / 컴파일 매처 첫 호출(목록 컴파일 포함) / 같은 목록 반복 호출
+- 두 방식 결과 일치율, 매칭 방식별 건수와 평균 신뢰도
+
+사용법:
+    python shared/benchmark/task_matcher_benchmark.py --sizes 20 1000 10000 --repeat 3
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from collections import Counter
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BENCHMARK_DIR, '..', '..'))
+V2_CORE_DIR = os.path.join(ROOT_DIR, 'v2.0', 'core')
+
+# core 패키지(__init__)는 selenium을 불러오므로 매처 모듈만 직접 import
+sys.path.insert(0, V2_CORE_DIR)
+from task_matcher import TaskMatcher, TASK_KEYWORD_SYNONYMS  # noqa: E402
+
+
+# 농업ON 작업단계 옵션 (mock 서버와 같은 목록)
+SITE_TASK_STEPS = [
+    "파종작업", "볍씨소독작업", "이앙작업", "비료작업", "방제작업", "중간물떼기", "완전물떼기",
+    "수확작업", "출하/판매작업", "건조작업", "병해충 피해", "제초작업", "논갈이(쟁기)작업",
+    "치상작업", "로터리작업", "작기종료", "기타작업", "교육일정", "예찰활동",
+]
+
+# 스케줄 작업명 + 키워드로만 매칭되는 작업명
+QUERY_TASK_NAMES = SITE_TASK_STEPS + ["쟁기작업", "농약방제", "볍씨 소독", "모내기(이앙)", "잡초제거", "벼 판매"]
+
+SYLLABLES = "가나다라마바사아자차카타파하농작물밭논고추감자배추콩팥깨보리밀옥수수관리점검정비운반"
+
+
+def legacy_match(json_task_name, available_tasks):
+    """기존 match_task_with_gpt와 같은 선형 탐색 (출력 제외)"""
+    for task in available_tasks:
+        if json_task_name in task or task in json_task_name:
+            return task
+    for task in available_tasks:
+        keywords = dict(TASK_KEYWORD_SYNONYMS)
+        for keyword, related_terms in keywords.items():
+            if keyword in json_task_name:
+                for term in related_terms:
+                    if term in task:
+                        return task
+    return None
+
+
+def build_options(size, rng):
+    """합성 작업단계 목록 - 무작위 작업명 사이에 실제 작업단계를 흩어 넣고 일부는 목록 끝에 둡니다."""
+    options = []
+    while len(options) < size:
+        length = rng.randint(3, 8)
+        options.append("".join(rng.choice(SYLLABLES) for _ in range(length)) + rng.choice(["", "작업", " 작업", "(기타)"]))
+    real = rng.sample(SITE_TASK_STEPS, min(len(SITE_TASK_STEPS), max(1, size // 2)))
+    for position, step in enumerate(real):
+        index = size - 1 - position if position % 3 == 0 else rng.randrange(size)
+        options[index] = step
+    return options
+
+
+def time_calls(function, queries, repeat):
+    started = time.perf_counter()
+    results = None
+    for _ in range(repeat):
+        results = [function(name) for name in queries]
+    return (time.perf_counter() - started) / (repeat * len(queries)), results
+
+
+def run_size(size, repeat, seed):
+    rng = random.Random(seed + size)
+    options = build_options(size, rng)
+
+    legacy_seconds, legacy_results = time_calls(lambda name: legacy_match(name, options), QUERY_TASK_NAMES, repeat)
+
+    matcher = TaskMatcher(QUERY_TASK_NAMES)
+    started = time.perf_counter()
+    cold_results = [matcher.match(name, options) for name in QUERY_TASK_NAMES]
+    cold_seconds = (time.perf_counter() - started) / len(QUERY_TASK_NAMES)
+    warm_seconds, _ = time_calls(lambda name: matcher.match(name, options), QUERY_TASK_NAMES, repeat)
+
+    agree = sum(1 for legacy, compiled in zip(legacy_results, cold_results) if legacy == compiled["option"])
+    methods = Counter(result["method"] or 'none' for result in cold_results)
+    confidences = [result["confidence"] for result in cold_results if result["option"]]
+    return {
+        "size": size,
+        "legacy_us": legacy_seconds * 1e6,
+        "cold_us": cold_seconds * 1e6,
+        "warm_us": warm_seconds * 1e6,
+        "agreement": agree / len(QUERY_TASK_NAMES),
+        "methods": dict(methods),
+        "avg_confidence": sum(confidences) / len(confidences) if confidences else 0.0,
+    }
+
+
+def print_report(rows):
+    print("\n📊 작업단계 매처 벤치마크 (호출 1회당 μs)")
+    print(f"{'옵션 수':>8} | {'기존 방식':>10} | {'첫 호출':>10} | {'반복 호출':>10} | {'배속':>8} | {'일치율':>6} | 평균 신뢰도")
+    print("-" * 84)
+    for row in rows:
+        speedup = row["legacy_us"] / row["warm_us"] if row["warm_us"] else float('inf')
+        print(f"{row['size']:>8} | {row['legacy_us']:>10.1f} | {row['cold_us']:>10.1f} | {row['warm_us']:>10.2f} | "
+              f"{speedup:>7.0f}x | {row['agreement'] * 100:>5.0f}% | {row['avg_confidence']:.2f}")
+    for row in rows:
+        methods = ", ".join(f"{method} {count}" for method, count in sorted(row["methods"].items()))
+        print(f"   옵션 {row['size']}개 매칭 방식: {methods}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='작업단계 매처 벤치마크 (합성 옵션 목록)')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[20, 1000, 10000, 50000], help='작업단계 목록 크기')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rows = [run_size(size, args.repeat, args.seed) for size in args.sizes]
+    print_report(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+영농일지 매크로 처리량 벤치마크
+
+로컬 mock 서버(shared/mock_server)를 띄운 뒤 v1 `AgrionMacro.run_macro`와
+v2 `AgrionMacroRefactored.run_macro`(v2-async는 `run_macro_async`)를 각각 별도 프로세스로 실행하고 다음 지표를 보고합니다.
+- 시간당 등록 영농일지 수 (diaries/hour)
+- 영농일지 1건당 처리 시간 p50 / p95
+- WebDriver 왕복(round trip) 횟수 (전체 / 영농일지 1건당)
+
+사용법:
+    python shared/benchmark/throughput_benchmark.py --targets v1 v2 \
+        --start-date 2024-03-01 --end-date 2024-03-28 --xhr-latency 0.3
+
+    # HTTP 일괄 저장 모드 (동시 8주, 초당 20요청, 저장 5% 일시 실패로 재시도 확인)
+    python shared/benchmark/throughput_benchmark.py --targets v2-async \
+        --start-date 2024-01-01 --end-date 2024-12-31 --concurrency 8 --rate-limit 20 --save-fail-rate 0.05
+
+v1과 v2는 둘 다 `settings`라는 이름의 모듈을 사용하므로 같은 프로세스에서 함께 import할 수 없습니다.
+그래서 측정 대상마다 자식 프로세스(--child)를 띄우고, 결과는 JSON 파일로 주고받습니다.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from collections import Counter
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BENCHMARK_DIR, '..', '..'))
+V1_DIR = os.path.join(ROOT_DIR, 'v1.0')
+V2_DIR = os.path.join(ROOT_DIR, 'v2.0')
+MOCK_SERVER_DIR = os.path.join(ROOT_DIR, 'shared', 'mock_server')
+
+TARGETS = ('v1', 'v2', 'v2-async')
+
+
+def percentile(values, pct):
+    """선형 보간 방식의 백분위수를 계산합니다."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+# ---------------------------------------------------------------------------
+# 자식 프로세스: 매크로를 계측하며 실행
+# ---------------------------------------------------------------------------
+
+def _install_round_trip_counter(counter):
+    """모든 WebDriver 명령이 지나가는 WebDriver.execute를 감싸 왕복 횟수를 셉니다."""
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    original_execute = WebDriver.execute
+
+    def counted_execute(self, driver_command, params=None):
+        counter[driver_command] += 1
+        return original_execute(self, driver_command, params)
+
+    WebDriver.execute = counted_execute
+
+
+def _install_submit_timer(engine_class, records):
+    """HttpDiaryEngine.submit_week 호출을 감싸 건별 시간을 기록합니다. (여러 스레드에서 호출됨)"""
+    original_submit = engine_class.submit_week
+
+    def timed_submit(self, start_date, end_date):
+        started = time.perf_counter()
+        success = False
+        try:
+            result = original_submit(self, start_date, end_date)
+            success = True
+            return result
+        finally:
+            records.append({
+                'start_date': start_date,
+                'end_date': end_date,
+                'seconds': time.perf_counter() - started,
+                'round_trips': 0,
+                'success': success,
+            })
+
+    engine_class.submit_week = timed_submit
+
+
+def _install_diary_timer(macro_class, counter, records):
+    """process_single_diary_with_schedule 호출(최상위 호출만)을 감싸 건별 시간/왕복 수를 기록합니다."""
+    original_process = macro_class.process_single_diary_with_schedule
+    depth = {'value': 0}
+
+    def timed_process(self, start_date, end_date, *args):
+        # 에러 복구 중 재귀 호출은 바깥 호출 시간에 포함되므로 따로 기록하지 않음
+        if depth['value'] > 0:
+            return original_process(self, start_date, end_date, *args)
+
+        depth['value'] += 1
+        round_trips_before = sum(counter.values())
+        started = time.perf_counter()
+        success = False
+        try:
+            success = bool(original_process(self, start_date, end_date, *args))
+            return success
+        finally:
+            depth['value'] -= 1
+            records.append({
+                'start_date': start_date,
+                'end_date': end_date,
+                'seconds': time.perf_counter() - started,
+                'round_trips': sum(counter.values()) - round_trips_before,
+                'success': success,
+            })
+
+    macro_class.process_single_diary_with_schedule = timed_process
+
+
+def run_child(target, result_path):
+    """측정 대상 매크로를 현재 프로세스에서 실행하고 결과를 JSON으로 저장합니다."""
+    counter = Counter()
+    records = []
+    _install_round_trip_counter(counter)
+
+    # 시작일 자동 업데이트는 settings.py/.env를 수정하므로 벤치마크에서는 환경 변수 값을 그대로 사용
+    start_date = os.environ['START_DATE']
+
+    if target == 'v1':
+        sys.path.insert(0, V1_DIR)
+        from auto_diary_writer import AgrionMacro
+        AgrionMacro.auto_update_start_date = lambda self: start_date
+        macro_class = AgrionMacro
+    else:
+        sys.path.insert(0, V2_DIR)
+        from core.config_manager import ConfigManager
+        from main.agrion_macro_refactored import AgrionMacroRefactored
+        ConfigManager.auto_update_start_date = lambda self: start_date
+        macro_class = AgrionMacroRefactored
+
+    if target == 'v2-async':
+        from services.http_diary_engine import HttpDiaryEngine
+        _install_submit_timer(HttpDiaryEngine, records)
+    else:
+        _install_diary_timer(macro_class, counter, records)
+
+    started = time.perf_counter()
+    macro = macro_class()
+    setup_seconds = time.perf_counter() - started
+    setup_round_trips = sum(counter.values())
+
+    if target == 'v2-async':
+        macro.run_macro_async()
+    else:
+        macro.run_macro()
+    elapsed = time.perf_counter() - started
+
+    result = {
+        'target': target,
+        'elapsed_seconds': elapsed,
+        'setup_seconds': setup_seconds,
+        'setup_round_trips': setup_round_trips,
+        'round_trips_total': sum(counter.values()),
+        'round_trips_by_command': dict(counter.most_common()),
+        'diaries': records,
+    }
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+# ---------------------------------------------------------------------------
+# 부모 프로세스: mock 서버 실행 및 결과 집계
+# ---------------------------------------------------------------------------
+
+def summarize(result, server_stats):
+    """자식 프로세스 결과를 보고용 지표로 요약합니다."""
+    diaries = result.get('diaries', [])
+    successful = [d for d in diaries if d['success']]
+    latencies = [d['seconds'] for d in diaries]
+    per_diary_round_trips = [d['round_trips'] for d in diaries]
+    elapsed = result.get('elapsed_seconds') or 0
+
+    return {
+        'target': result['target'],
+        'weeks': len(diaries),
+        'successful': len(successful),
+        'saved_on_server': server_stats['counters']['saves'],
+        'elapsed_seconds': round(elapsed, 2),
+        'setup_seconds': round(result.get('setup_seconds', 0), 2),
+        'diaries_per_hour': round(server_stats['counters']['saves'] / elapsed * 3600, 1) if elapsed else 0.0,
+        'latency_p50_seconds': round(percentile(latencies, 50), 2) if latencies else None,
+        'latency_p95_seconds': round(percentile(latencies, 95), 2) if latencies else None,
+        'round_trips_total': result.get('round_trips_total', 0),
+        'round_trips_per_diary': round(sum(per_diary_round_trips) / len(per_diary_round_trips), 1) if per_diary_round_trips else None,
+        'server_counters': server_stats['counters'],
+    }
+
+
+def print_report(summaries):
+    """측정 결과 표를 출력합니다."""
+    print("\n📊 벤치마크 결과")
+    print("-" * 98)
+    print(f"{'대상':<8} {'주차':>5} {'성공':>5} {'저장':>5} {'총 시간(s)':>11} {'diaries/h':>10} "
+          f"{'p50(s)':>8} {'p95(s)':>8} {'RT 합계':>8} {'RT/건':>8}")
+    print("-" * 98)
+    for s in summaries:
+        p50 = f"{s['latency_p50_seconds']:.2f}" if s['latency_p50_seconds'] is not None else '-'
+        p95 = f"{s['latency_p95_seconds']:.2f}" if s['latency_p95_seconds'] is not None else '-'
+        rt_per = f"{s['round_trips_per_diary']:.1f}" if s['round_trips_per_diary'] is not None else '-'
+        print(f"{s['target']:<8} {s['weeks']:>5} {s['successful']:>5} {s['saved_on_server']:>5} "
+              f"{s['elapsed_seconds']:>11.2f} {s['diaries_per_hour']:>10.1f} {p50:>8} {p95:>8} "
+              f"{s['round_trips_total']:>8} {rt_per:>8}")
+    print("-" * 98)
+
+
+def run_target(target, server, args):
+    """임시 작업 디렉토리에서 자식 프로세스로 매크로 하나를 측정합니다."""
+    workdir = tempfile.mkdtemp(prefix=f'agrion_bench_{target}_')
+    try:
+        # v1은 작업 디렉토리 기준 data/ 경로로 스케줄을 읽음
+        shutil.copytree(os.path.join(V1_DIR, 'data'), os.path.join(workdir, 'data'))
+
+        env = os.environ.copy()
+        env.update({
+            'AGRION_BASE_URL': server.base_url,
+            'AGRION_USERNAME': 'benchmark',
+            'AGRION_PASSWORD': 'benchmark',
+            'START_DATE': args.start_date,
+            'END_DATE': args.end_date,
+            'USE_GPT': 'false',
+            'OPENAI_API_KEY': '',
+            'PYTHONIOENCODING': 'utf-8',
+            # 이전 실행에서 저장된 로그인 세션이 측정에 섞이지 않도록 임시 디렉토리 사용
+            'SESSION_STORE_DIR': os.path.join(workdir, 'sessions'),
+            # 이전 실행의 등록 계획(완료 표시된 주차)을 재사용하지 않도록 임시 경로 사용
+            'DIARY_PLAN_PATH': os.path.join(workdir, 'plan', 'diary_plan.json'),
+            'ASYNC_CONCURRENCY': str(args.concurrency),
+            'ASYNC_RATE_LIMIT': str(args.rate_limit),
+        })
+
+        result_path = os.path.join(workdir, 'result.json')
+        stdout = None if args.verbose else subprocess.DEVNULL
+        print(f"🚀 {target} 측정 시작 ({args.start_date} ~ {args.end_date})")
+        server.state.reset()
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', target, '--result', result_path],
+            cwd=workdir, env=env, stdout=stdout, timeout=args.timeout, check=False,
+        )
+
+        if not os.path.exists(result_path):
+            print(f"❌ {target} 측정 실패: 결과 파일이 생성되지 않았습니다. (--verbose로 로그 확인)")
+            return None
+
+        with open(result_path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+        return summarize(result, server.stats())
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='영농일지 매크로 처리량 벤치마크 (로컬 mock 서버)')
+    parser.add_argument('--targets', nargs='+', choices=TARGETS, default=list(TARGETS))
+    parser.add_argument('--start-date', default='2024-03-01')
+    parser.add_argument('--end-date', default='2024-03-28')
+    parser.add_argument('--page-latency', type=float, default=0.2, help='페이지 응답 지연 (초)')
+    parser.add_argument('--xhr-latency', type=float, default=0.3, help='목록 XHR 응답 지연 (초)')
+    parser.add_argument('--save-latency', type=float, default=0.5, help='저장 XHR 응답 지연 (초)')
+    parser.add_argument('--save-fail-rate', type=float, default=0.0, help='저장 일시 실패 비율 (0~1)')
+    parser.add_argument('--concurrency', type=int, default=4, help='v2-async 동시 처리 주차 수')
+    parser.add_argument('--rate-limit', type=float, default=5, help='v2-async 초당 최대 HTTP 요청 수 (0이면 제한 없음)')
+    parser.add_argument('--timeout', type=float, default=3600, help='대상별 최대 실행 시간 (초)')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('--verbose', action='store_true', help='매크로 출력 표시')
+    parser.add_argument('--child', choices=TARGETS, help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.result)
+        return
+
+    sys.path.insert(0, MOCK_SERVER_DIR)
+    from agrion_mock_server import AgrionMockServer
+
+    server = AgrionMockServer(
+        page_latency=args.page_latency,
+        xhr_latency=args.xhr_latency,
+        save_latency=args.save_latency,
+        save_fail_rate=args.save_fail_rate,
+    ).start()
+
+    summaries = []
+    try:
+        for target in args.targets:
+            summary = run_target(target, server, args)
+            if summary:
+                summaries.append(summary)
+    except KeyboardInterrupt:
+        print("\n⚠️ 사용자에 의해 중단되었습니다.")
+    finally:
+        server.stop()
+
+    if summaries:
+        print_report(summaries)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(summaries, f, ensure_ascii=False, indent=2)
+            print(f"📝 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
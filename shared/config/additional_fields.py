@@ -0,0 +1,22 @@
+import random
+
+
+def build_additional_field_values(task_step):
+    """작업 단계별 추가 입력 필드 값을 만듭니다. (v1 일괄 입력과 v2 멀티탭/HTTP/등록 계획이 함께 사용)
+
+    Args:
+        task_step (str): 작성 페이지의 작업단계 이름
+
+    Returns:
+        dict: {필드 id: 입력값}
+    """
+    if "수확작업" in task_step:
+        # 벼 수확량은 보통 1평당 0.5~0.8kg 정도, 300평 기준으로 계산
+        return {"amount3": str(random.randint(150, 240)), "unit": "kg"}
+    if "파종작업" in task_step:
+        # 벼 파종량은 보통 1평당 0.2~0.3kg 정도, 300평 기준으로 계산
+        return {"amount2": str(random.randint(60, 90)), "unit": "kg"}
+    if "이앙작업" in task_step:
+        # 평당 주수 15~20주, 모판 수량은 300평 기준 15~20개
+        return {"perPyeongAmount": str(random.randint(15, 20)), "seedbedAmount": str(random.randint(15, 20))}
+    return {}
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+농업ON 로컬 mock 서버
+
+매크로가 다루는 세 페이지(로그인, 영농일지 메인, 영농일지 등록)와 등록 페이지가 호출하는
+XHR 엔드포인트를 로컬에서 흉내 냅니다. 실제 사이트 없이 속도 개선 효과를 측정하기 위한 용도입니다.
+
+사용법:
+    python shared/mock_server/agrion_mock_server.py --port 8765 --xhr-latency 0.3
+
+매크로를 mock 서버로 향하게 하려면 AGRION_BASE_URL 환경 변수를 지정합니다.
+    AGRION_BASE_URL=http://127.0.0.1:8765 python v2.0/main/start_diary_writer_v2.py
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import secrets
+import argparse
+import threading
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from http.cookies import SimpleCookie
+from urllib.parse import urlparse, parse_qs
+
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+
+SESSION_COOKIE = 'JSESSIONID'
+
+# 품목 코드 → 품목명
+CROPS = {
+    'CR001': '벼',
+    'CR002': '감자',
+    'CR003': '고구마',
+}
+
+# 품목별 필지 목록
+LANDS = {
+    'CR001': [
+        {'code': 'LD001', 'name': '1필지 (논 1,200평)'},
+        {'code': 'LD002', 'name': '2필지 (논 800평)'},
+        {'code': 'LD003', 'name': '3필지 (논 600평)'},
+    ],
+    'CR002': [{'code': 'LD101', 'name': '밭 1필지 (400평)'}],
+    'CR003': [{'code': 'LD201', 'name': '밭 2필지 (300평)'}],
+}
+
+# 품목별 품종 목록
+SCROPS = {
+    'CR001': [
+        {'code': 'SC001', 'name': '신동진'},
+        {'code': 'SC002', 'name': '추청'},
+    ],
+    'CR002': [{'code': 'SC101', 'name': '수미'}],
+    'CR003': [{'code': 'SC201', 'name': '호박고구마'}],
+}
+
+# 작업단계 목록 (실제 사이트의 벼 작업단계 옵션명 기준)
+TASKS = [
+    '논갈이(쟁기)작업', '로터리작업', '비료작업', '볍씨소독작업', '파종작업', '치상작업',
+    '이앙작업', '제초작업', '방제작업', '중간물떼기', '완전물떼기', '병해충 피해',
+    '수확작업', '건조작업', '출하/판매작업', '작기종료', '기타작업', '교육일정', '예찰활동',
+]
+TASK_CODES = {f'TK{index + 1:03d}': name for index, name in enumerate(TASKS)}
+
+WEATHER_TYPES = ['맑음', '구름많음', '흐림', '비', '눈']
+
+# 저장 시 필수 항목 (폼 필드명 → 표시명)
+REQUIRED_FIELDS = {
+    'startDate': '시작일',
+    'endDate': '종료일',
+    'cropCode': '품목',
+    'landCode': '필지',
+    'scropCode': '품종',
+    'taskCode': '작업단계',
+    'memo': '작업내용',
+}
+
+
+class MockState:
+    """세션, 저장된 영농일지, 요청 통계를 보관하는 스레드 안전 상태 객체"""
+
+    def __init__(self, username=None, password=None, session_ttl=3600,
+                 page_latency=0.0, xhr_latency=0.0, save_latency=0.0, save_fail_rate=0.0):
+        self.username = username
+        self.password = password
+        self.session_ttl = session_ttl
+        self.page_latency = page_latency
+        self.xhr_latency = xhr_latency
+        self.save_latency = save_latency
+        self.save_fail_rate = save_fail_rate
+
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.diaries = []
+        self.counters = {
+            'logins': 0,
+            'page_loads': 0,
+            'xhr_requests': 0,
+            'saves': 0,
+            'save_failures': 0,
+        }
+
+    def create_session(self, member_id):
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.sessions[token] = {'member_id': member_id, 'expires_at': time.time() + self.session_ttl}
+            self.counters['logins'] += 1
+        return token
+
+    def get_session(self, token):
+        if not token:
+            return None
+        with self.lock:
+            session = self.sessions.get(token)
+            if not session:
+                return None
+            if session['expires_at'] < time.time():
+                del self.sessions[token]
+                return None
+            # 요청이 있을 때마다 세션 만료 시간 연장 (서버 세션과 동일한 동작)
+            session['expires_at'] = time.time() + self.session_ttl
+            return session
+
+    def expire_all_sessions(self):
+        with self.lock:
+            self.sessions.clear()
+
+    def count(self, key):
+        with self.lock:
+            self.counters[key] += 1
+
+    def record_diary(self, diary):
+        with self.lock:
+            self.diaries.append(diary)
+            self.counters['saves'] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'counters': dict(self.counters),
+                'active_sessions': len(self.sessions),
+                'diaries': list(self.diaries),
+            }
+
+    def reset(self):
+        with self.lock:
+            self.diaries.clear()
+            for key in self.counters:
+                self.counters[key] = 0
+
+
+def _read_static(filename):
+    with open(os.path.join(STATIC_DIR, filename), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _weather_for_date(date_str):
+    """날짜별로 항상 같은 값을 돌려주는 가짜 날씨 데이터"""
+    seed = int(hashlib.md5(date_str.encode('utf-8')).hexdigest()[:8], 16)
+    rng = random.Random(seed)
+    try:
+        month = datetime.strptime(date_str, '%Y-%m-%d').month
+    except ValueError:
+        month = 6
+    base_temp = {1: -5, 2: -2, 3: 4, 4: 10, 5: 15, 6: 20, 7: 24, 8: 25, 9: 19, 10: 12, 11: 5, 12: -2}[month]
+    low_temp = base_temp + rng.randint(-3, 3)
+    return {
+        'wfKor': rng.choice(WEATHER_TYPES[:4] if month not in (12, 1, 2) else WEATHER_TYPES),
+        'lowTemp': str(low_temp),
+        'highTemp': str(low_temp + rng.randint(6, 11)),
+        'r12': str(rng.choice([0, 0, 0, 1, 5, 12])),
+        'reh': str(rng.randint(40, 90)),
+    }
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """mock 서버 요청 처리기"""
+
+    server_version = 'AgrionMock/1.0'
+    state = None  # make_handler에서 주입
+
+    # ---------- 공통 헬퍼 ----------
+
+    def log_message(self, format, *args):
+        # 기본 stderr 접근 로그는 벤치마크 출력을 어지럽히므로 끕니다.
+        pass
+
+    def _session_token(self):
+        cookie_header = self.headers.get('Cookie')
+        if not cookie_header:
+            return None
+        cookie = SimpleCookie()
+        cookie.load(cookie_header)
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def _current_session(self):
+        return self.state.get_session(self._session_token())
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8', headers=None):
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Cache-Control', 'no-store')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, payload, status=200):
+        self._send(status, json.dumps(payload, ensure_ascii=False), 'application/json; charset=utf-8')
+
+    def _redirect(self, location, headers=None):
+        all_headers = {'Location': location}
+        all_headers.update(headers or {})
+        self._send(302, '', headers=all_headers)
+
+    def _read_form(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ''
+        return parse_qs(body, keep_blank_values=True)
+
+    def _render_page(self, filename, **values):
+        time.sleep(self.state.page_latency)
+        self.state.count('page_loads')
+        html = _read_static(filename)
+        for key, value in values.items():
+            html = html.replace('{{' + key + '}}', value)
+        self._send(200, html)
+
+    # ---------- 라우팅 ----------
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path
+        query = parse_qs(parsed.query)
+
+        if path.startswith('/mock/static/'):
+            return self._serve_static(path[len('/mock/static/'):])
+        if path == '/mock/stats':
+            return self._send_json(self.state.snapshot())
+        if path == '/portal/gc/ml/mberLoginForm.do':
+            return self._render_page('login.html', error='')
+        if path in ('/', '/portal/main.do'):
+            session = self._current_session()
+            if not session:
+                return self._redirect('/portal/gc/ml/mberLoginForm.do')
+            return self._render_page('main.html', member_id=session['member_id'])
+        if path == '/portal/farm/diaryMain.do':
+            if not self._current_session():
+                return self._redirect('/portal/gc/ml/mberLoginForm.do')
+            return self._render_page('diary_main.html')
+        if path == '/portal/farm/diaryDetail.do':
+            if not self._current_session():
+                return self._redirect('/portal/gc/ml/mberLoginForm.do')
+            crop_options = '\n'.join(
+                f'<option value="{code}">{name}</option>' for code, name in CROPS.items()
+            )
+            return self._render_page('diary_detail.html', crop_options=crop_options)
+        if path.startswith('/portal/farm/select'):
+            return self._handle_list_xhr(path, query)
+
+        self._send(404, 'Not Found', 'text/plain; charset=utf-8')
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path == '/portal/gc/ml/mberLogin.do':
+            return self._handle_login()
+        if path == '/portal/farm/upsertDiary.do':
+            return self._handle_save()
+        if path == '/mock/reset':
+            self.state.reset()
+            return self._send_json({'result': 'success'})
+        if path == '/mock/expire-sessions':
+            self.state.expire_all_sessions()
+            return self._send_json({'result': 'success'})
+        self._send(404, 'Not Found', 'text/plain; charset=utf-8')
+
+    # ---------- 핸들러 ----------
+
+    def _serve_static(self, filename):
+        if filename not in ('jquery-mini.js', 'diary.js'):
+            return self._send(404, 'Not Found', 'text/plain; charset=utf-8')
+        self._send(200, _read_static(filename), 'application/javascript; charset=utf-8')
+
+    def _handle_login(self):
+        form = self._read_form()
+        member_id = form.get('memberId', [''])[0]
+        password = form.get('pwd', [''])[0]
+        time.sleep(self.state.page_latency)
+
+        valid = bool(member_id and password)
+        if self.state.username is not None:
+            valid = valid and member_id == self.state.username
+        if self.state.password is not None:
+            valid = valid and password == self.state.password
+
+        if not valid:
+            self.state.count('page_loads')
+            html = _read_static('login.html').replace('{{error}}', '아이디 또는 비밀번호가 올바르지 않습니다.')
+            return self._send(200, html)
+
+        token = self.state.create_session(member_id)
+        self._redirect('/portal/main.do', headers={
+            'Set-Cookie': f'{SESSION_COOKIE}={token}; Path=/; HttpOnly'
+        })
+
+    def _handle_list_xhr(self, path, query):
+        self.state.count('xhr_requests')
+        time.sleep(self.state.xhr_latency)
+        if not self._current_session():
+            return self._send_json({'result': 'fail', 'message': '세션이 만료되었습니다.'}, status=401)
+
+        crop_code = query.get('cropCode', [''])[0]
+        if path == '/portal/farm/selectLandList.do':
+            return self._send_json({'result': 'success', 'list': LANDS.get(crop_code, [])})
+        if path == '/portal/farm/selectScropList.do':
+            land_codes = query.get('landCode', [])
+            scrops = SCROPS.get(crop_code, []) if land_codes else []
+            return self._send_json({'result': 'success', 'list': scrops})
+        if path == '/portal/farm/selectTaskList.do':
+            scrop_codes = query.get('scropCode', [])
+            tasks = [{'code': code, 'name': name} for code, name in TASK_CODES.items()] if scrop_codes else []
+            return self._send_json({'result': 'success', 'list': tasks})
+        if path == '/portal/farm/selectWeather.do':
+            return self._send_json(_weather_for_date(query.get('date', [''])[0]))
+        self._send_json({'result': 'fail', 'message': '알 수 없는 요청입니다.'}, status=404)
+
+    def _handle_save(self):
+        self.state.count('xhr_requests')
+        form = self._read_form()
+        time.sleep(self.state.save_latency)
+        if not self._current_session():
+            return self._send_json({'result': 'fail', 'message': '세션이 만료되었습니다.'}, status=401)
+
+        missing = [label for field, label in REQUIRED_FIELDS.items()
+                   if not any(value.strip() for value in form.get(field, []))]
+        if missing:
+            self.state.count('save_failures')
+            return self._send_json({'result': 'fail', 'message': f"필수 항목이 누락되었습니다: {', '.join(missing)}"})
+
+        if self.state.save_fail_rate and random.random() < self.state.save_fail_rate:
+            self.state.count('save_failures')
+            return self._send_json({'result': 'fail', 'message': '일시적인 오류로 저장에 실패했습니다.'})
+
+        task_code = form['taskCode'][0]
+        diary = {
+            'startDate': form['startDate'][0],
+            'endDate': form['endDate'][0],
+            'crop': CROPS.get(form['cropCode'][0], form['cropCode'][0]),
+            'lands': form['landCode'],
+            'scrops': form['scropCode'],
+            'task': TASK_CODES.get(task_code, task_code),
+            'memo': form['memo'][0],
+            'saved_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        self.state.record_diary(diary)
+        self._send_json({'result': 'success'})
+
+
+class AgrionMockServer:
+    """mock 서버를 백그라운드 스레드에서 실행하는 래퍼 (벤치마크에서 사용)"""
+
+    def __init__(self, host='127.0.0.1', port=0, **state_options):
+        self.state = MockState(**state_options)
+        handler = type('BoundMockRequestHandler', (MockRequestHandler,), {'state': self.state})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='agrion-mock-server', daemon=True)
+        self.thread.start()
+        print(f"✅ 농업ON mock 서버 시작: {self.base_url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join(timeout=5)
+        print("✅ 농업ON mock 서버 종료")
+
+    def stats(self):
+        return self.state.snapshot()
+
+
+def main():
+    """mock 서버 단독 실행"""
+    parser = argparse.ArgumentParser(description='농업ON 로컬 mock 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--username', default=None, help='지정 시 이 아이디만 로그인 허용')
+    parser.add_argument('--password', default=None, help='지정 시 이 비밀번호만 로그인 허용')
+    parser.add_argument('--session-ttl', type=float, default=3600, help='세션 만료 시간 (초)')
+    parser.add_argument('--page-latency', type=float, default=0.0, help='페이지 응답 지연 (초)')
+    parser.add_argument('--xhr-latency', type=float, default=0.0, help='목록 XHR 응답 지연 (초)')
+    parser.add_argument('--save-latency', type=float, default=0.0, help='저장 XHR 응답 지연 (초)')
+    parser.add_argument('--save-fail-rate', type=float, default=0.0, help='저장 실패 확률 (0.0-1.0)')
+    args = parser.parse_args()
+
+    server = AgrionMockServer(
+        host=args.host,
+        port=args.port,
+        username=args.username,
+        password=args.password,
+        session_ttl=args.session_ttl,
+        page_latency=args.page_latency,
+        xhr_latency=args.xhr_latency,
+        save_latency=args.save_latency,
+        save_fail_rate=args.save_fail_rate,
+    )
+    server.start()
+    print(f"💡 AGRION_BASE_URL={server.base_url} 로 매크로를 실행하세요. (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n⚠️ 사용자에 의해 중단되었습니다.")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
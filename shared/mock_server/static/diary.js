@@ -0,0 +1,143 @@
+/*
+ * 농업ON mock 영농일지 등록 페이지 스크립트
+ *
+ * 품목(selectCrops) → 필지(#checkLand) → 품종(#checkScrop) → 작업단계(selectTask) 순서로
+ * 서버 XHR을 거쳐 목록이 채워지고, 저장 버튼(upsert_diary)은 확인창 → 저장 XHR → 완료 알럿
+ * 두 번의 알럿을 띄웁니다.
+ */
+(function ($) {
+    'use strict';
+
+    var ADDITIONAL_FIELDS = {
+        '파종작업': 'seedingFields',
+        '수확작업': 'harvestFields',
+        '이앙작업': 'transplantingFields'
+    };
+
+    function checkedValues(name) {
+        var values = [];
+        $('input[name="' + name + '"]:checked').each(function () { values.push(this.value); });
+        return values;
+    }
+
+    function renderCheckboxes(containerSelector, name, items) {
+        var html = '';
+        items.forEach(function (item) {
+            html += '<label><input type="checkbox" name="' + name + '" value="' + item.code + '"> ' +
+                item.name + '</label>';
+        });
+        $(containerSelector).html(html);
+    }
+
+    function resetTaskSelect() {
+        $('#selectTask').html('<option value="">작업단계 선택</option>');
+        toggleAdditionalFields();
+    }
+
+    function loadLands() {
+        renderCheckboxes('#checkLand', 'landCode', []);
+        renderCheckboxes('#checkScrop', 'scropCode', []);
+        resetTaskSelect();
+        var cropCode = $('#selectCrops').val();
+        if (!cropCode) {
+            return;
+        }
+        $.get('/portal/farm/selectLandList.do', { cropCode: cropCode }, function (res) {
+            renderCheckboxes('#checkLand', 'landCode', res.list || []);
+        });
+    }
+
+    function loadScrops() {
+        renderCheckboxes('#checkScrop', 'scropCode', []);
+        resetTaskSelect();
+        var landCodes = checkedValues('landCode');
+        if (!landCodes.length) {
+            return;
+        }
+        $.get('/portal/farm/selectScropList.do', {
+            cropCode: $('#selectCrops').val(),
+            landCode: landCodes
+        }, function (res) {
+            renderCheckboxes('#checkScrop', 'scropCode', res.list || []);
+        });
+    }
+
+    function loadTasks() {
+        resetTaskSelect();
+        var scropCodes = checkedValues('scropCode');
+        if (!scropCodes.length) {
+            return;
+        }
+        $.get('/portal/farm/selectTaskList.do', {
+            cropCode: $('#selectCrops').val(),
+            scropCode: scropCodes
+        }, function (res) {
+            var html = '<option value="">작업단계 선택</option>';
+            (res.list || []).forEach(function (item) {
+                html += '<option value="' + item.code + '">' + item.name + '</option>';
+            });
+            $('#selectTask').html(html);
+        });
+    }
+
+    function loadWeather(dateText) {
+        $.get('/portal/farm/selectWeather.do', { date: dateText }, function (res) {
+            $('#wfKor').val(res.wfKor);
+            $('#low_temp').val(res.lowTemp);
+            $('#high_temp').val(res.highTemp);
+            $('#r12').val(res.r12);
+            $('#reh').val(res.reh);
+        });
+    }
+
+    function toggleAdditionalFields() {
+        var select = document.getElementById('selectTask');
+        var taskName = select.selectedIndex >= 0 ? select.options[select.selectedIndex].text : '';
+        Object.keys(ADDITIONAL_FIELDS).forEach(function (name) {
+            var section = document.getElementById(ADDITIONAL_FIELDS[name]);
+            section.style.display = taskName.indexOf(name) >= 0 ? 'block' : 'none';
+        });
+    }
+
+    function saveDiary() {
+        if (!window.confirm('영농일지를 저장하시겠습니까?')) {
+            return;
+        }
+        var payload = new URLSearchParams(new FormData(document.getElementById('diaryForm'))).toString();
+        $.ajax({
+            url: '/portal/farm/upsertDiary.do',
+            type: 'POST',
+            data: payload,
+            success: function (res) {
+                if (res && res.result === 'success') {
+                    window.alert('저장되었습니다.');
+                    window.location.href = '/portal/farm/diaryDetail.do';
+                } else {
+                    window.alert((res && res.message) || '저장에 실패했습니다.');
+                }
+            },
+            error: function (xhr, status, res) {
+                window.alert((res && res.message) || '저장 중 오류가 발생했습니다.');
+            }
+        });
+    }
+
+    $(function () {
+        $('#now_date_s').datepicker({
+            onSelect: function (dateText) {
+                $('#now_date_e').datepicker('option', 'minDate', dateText);
+                loadWeather(dateText);
+            }
+        });
+        $('#now_date_e').datepicker({});
+
+        $('#selectCrops').on('change', loadLands);
+        $('#checkLand').on('change', loadScrops);
+        $('#checkScrop').on('change', loadTasks);
+        $('#selectTask').on('change', toggleAdditionalFields);
+        $('#upsert_diary').on('click', function (event) {
+            event.preventDefault();
+            saveDiary();
+        });
+    });
+})(window.jQuery);
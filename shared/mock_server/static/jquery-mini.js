@@ -0,0 +1,321 @@
+/*
+ * 농업ON mock 서버용 최소 jQuery 호환 스크립트
+ *
+ * 실제 사이트가 사용하는 jQuery / jQuery UI datepicker 중 매크로가 건드리는 부분만 구현합니다.
+ * - $(selector), .val(), .prop(), .on(), .trigger(), .each()
+ * - $.ajax / $.get / $.post 와 진행 중인 요청 수(jQuery.active)
+ * - datepicker: 달력 DOM(.ui-datepicker-year/.ui-datepicker-month/td[data-handler='selectDay'] a),
+ *   'setDate' / 'getDate' / 'option' API, onSelect 훅
+ */
+(function (window) {
+    'use strict';
+
+    var document = window.document;
+
+    function Wrapped(elements) {
+        this.elements = elements;
+        this.length = elements.length;
+        for (var i = 0; i < elements.length; i++) {
+            this[i] = elements[i];
+        }
+    }
+
+    function jQuery(selector) {
+        if (typeof selector === 'function') {
+            if (document.readyState === 'loading') {
+                document.addEventListener('DOMContentLoaded', selector);
+            } else {
+                selector();
+            }
+            return undefined;
+        }
+        if (typeof selector === 'string') {
+            return new Wrapped(Array.prototype.slice.call(document.querySelectorAll(selector)));
+        }
+        if (selector && (selector.nodeType || selector === window)) {
+            return new Wrapped([selector]);
+        }
+        return new Wrapped([]);
+    }
+
+    Wrapped.prototype.each = function (callback) {
+        for (var i = 0; i < this.elements.length; i++) {
+            callback.call(this.elements[i], i, this.elements[i]);
+        }
+        return this;
+    };
+
+    Wrapped.prototype.val = function (value) {
+        if (value === undefined) {
+            return this.elements.length ? this.elements[0].value : undefined;
+        }
+        return this.each(function () { this.value = value; });
+    };
+
+    Wrapped.prototype.prop = function (name, value) {
+        if (value === undefined) {
+            return this.elements.length ? this.elements[0][name] : undefined;
+        }
+        return this.each(function () { this[name] = value; });
+    };
+
+    Wrapped.prototype.html = function (markup) {
+        return this.each(function () { this.innerHTML = markup; });
+    };
+
+    Wrapped.prototype.on = function (eventName, handler) {
+        return this.each(function () { this.addEventListener(eventName, handler); });
+    };
+
+    Wrapped.prototype.trigger = function (eventName) {
+        return this.each(function () {
+            this.dispatchEvent(new Event(eventName, { bubbles: true }));
+        });
+    };
+
+    Wrapped.prototype.change = function () {
+        return this.trigger('change');
+    };
+
+    /* ---------- AJAX ---------- */
+
+    jQuery.active = 0;
+
+    function encodeParams(data) {
+        if (!data) {
+            return '';
+        }
+        if (typeof data === 'string') {
+            return data;
+        }
+        var parts = [];
+        Object.keys(data).forEach(function (key) {
+            var value = data[key];
+            var values = Array.isArray(value) ? value : [value];
+            values.forEach(function (item) {
+                parts.push(encodeURIComponent(key) + '=' + encodeURIComponent(item));
+            });
+        });
+        return parts.join('&');
+    }
+
+    jQuery.ajax = function (options) {
+        var type = (options.type || 'GET').toUpperCase();
+        var url = options.url;
+        var body = encodeParams(options.data);
+        if (type === 'GET' && body) {
+            url += (url.indexOf('?') >= 0 ? '&' : '?') + body;
+            body = null;
+        }
+
+        var xhr = new XMLHttpRequest();
+        xhr.open(type, url, true);
+        if (type !== 'GET') {
+            xhr.setRequestHeader('Content-Type', 'application/x-www-form-urlencoded; charset=UTF-8');
+        }
+        xhr.setRequestHeader('X-Requested-With', 'XMLHttpRequest');
+
+        jQuery.active++;
+        xhr.onloadend = function () {
+            var payload = null;
+            try {
+                payload = JSON.parse(xhr.responseText);
+            } catch (e) {
+                payload = xhr.responseText;
+            }
+            try {
+                if (xhr.status >= 200 && xhr.status < 300) {
+                    if (options.success) { options.success(payload); }
+                } else if (options.error) {
+                    options.error(xhr, xhr.status, payload);
+                }
+                if (options.complete) { options.complete(xhr); }
+            } finally {
+                jQuery.active--;
+            }
+        };
+        xhr.send(body);
+        return xhr;
+    };
+
+    jQuery.get = function (url, data, success) {
+        return jQuery.ajax({ url: url, type: 'GET', data: data, success: success });
+    };
+
+    jQuery.post = function (url, data, success) {
+        return jQuery.ajax({ url: url, type: 'POST', data: data, success: success });
+    };
+
+    /* ---------- datepicker ---------- */
+
+    var DEFAULT_SETTINGS = {
+        dateFormat: 'yy-mm-dd',
+        changeYear: true,
+        changeMonth: true,
+        yearRange: '2015:2030',
+        onSelect: null
+    };
+
+    var popup = null;
+    var activeInput = null;
+
+    function pad(value) {
+        return (value < 10 ? '0' : '') + value;
+    }
+
+    function formatDate(date) {
+        return date.getFullYear() + '-' + pad(date.getMonth() + 1) + '-' + pad(date.getDate());
+    }
+
+    function parseDate(value) {
+        if (value instanceof Date) {
+            return new Date(value.getFullYear(), value.getMonth(), value.getDate());
+        }
+        var match = /^(\d{4})-(\d{2})-(\d{2})$/.exec(value || '');
+        if (!match) {
+            return null;
+        }
+        return new Date(parseInt(match[1], 10), parseInt(match[2], 10) - 1, parseInt(match[3], 10));
+    }
+
+    function ensurePopup() {
+        if (!popup) {
+            popup = document.createElement('div');
+            popup.id = 'ui-datepicker-div';
+            popup.className = 'ui-datepicker';
+            popup.style.display = 'none';
+            popup.style.position = 'absolute';
+            document.body.appendChild(popup);
+        }
+        return popup;
+    }
+
+    function renderCalendar(input, year, month) {
+        var state = input._datepicker;
+        var range = state.settings.yearRange.split(':');
+        var html = '<div class="ui-datepicker-header">';
+
+        html += '<select class="ui-datepicker-month" data-handler="selectMonth">';
+        for (var m = 0; m < 12; m++) {
+            html += '<option value="' + m + '"' + (m === month ? ' selected' : '') + '>' + (m + 1) + '월</option>';
+        }
+        html += '</select><select class="ui-datepicker-year" data-handler="selectYear">';
+        for (var y = parseInt(range[0], 10); y <= parseInt(range[1], 10); y++) {
+            html += '<option value="' + y + '"' + (y === year ? ' selected' : '') + '>' + y + '</option>';
+        }
+        html += '</select></div><table class="ui-datepicker-calendar"><tbody><tr>';
+
+        var firstDay = new Date(year, month, 1).getDay();
+        var daysInMonth = new Date(year, month + 1, 0).getDate();
+        for (var blank = 0; blank < firstDay; blank++) {
+            html += '<td class="ui-datepicker-other-month">&#xa0;</td>';
+        }
+        for (var day = 1; day <= daysInMonth; day++) {
+            if ((firstDay + day - 1) % 7 === 0 && day !== 1) {
+                html += '</tr><tr>';
+            }
+            html += '<td data-handler="selectDay" data-event="click" data-month="' + month +
+                '" data-year="' + year + '"><a class="ui-state-default" href="#">' + day + '</a></td>';
+        }
+        html += '</tr></tbody></table>';
+
+        var container = ensurePopup();
+        container.innerHTML = html;
+        container.querySelector('.ui-datepicker-month').addEventListener('change', function () {
+            renderCalendar(input, year, parseInt(this.value, 10));
+        });
+        container.querySelector('.ui-datepicker-year').addEventListener('change', function () {
+            renderCalendar(input, parseInt(this.value, 10), month);
+        });
+        Array.prototype.forEach.call(container.querySelectorAll("td[data-handler='selectDay'] a"), function (link) {
+            link.addEventListener('click', function (event) {
+                event.preventDefault();
+                selectDate(input, new Date(year, month, parseInt(link.textContent, 10)));
+            });
+        });
+    }
+
+    function showCalendar(input) {
+        var current = parseDate(input.value) || new Date();
+        activeInput = input;
+        renderCalendar(input, current.getFullYear(), current.getMonth());
+        var rect = input.getBoundingClientRect();
+        var container = ensurePopup();
+        container.style.left = (rect.left + window.scrollX) + 'px';
+        container.style.top = (rect.bottom + window.scrollY) + 'px';
+        container.style.display = 'block';
+    }
+
+    function hideCalendar() {
+        if (popup) {
+            popup.style.display = 'none';
+        }
+        activeInput = null;
+    }
+
+    function selectDate(input, date) {
+        var state = input._datepicker;
+        state.date = date;
+        input.value = formatDate(date);
+        hideCalendar();
+        if (typeof state.settings.onSelect === 'function') {
+            state.settings.onSelect.call(input, input.value, state);
+        }
+        input.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+
+    Wrapped.prototype.datepicker = function (command, name, value) {
+        if (typeof command === 'string') {
+            var input = this.elements[0];
+            if (!input || !input._datepicker) {
+                return undefined;
+            }
+            var state = input._datepicker;
+            if (command === 'setDate') {
+                var date = parseDate(name);
+                state.date = date;
+                input.value = date ? formatDate(date) : '';
+                return this;
+            }
+            if (command === 'getDate') {
+                return state.date ? new Date(state.date.getTime()) : parseDate(input.value);
+            }
+            if (command === 'option') {
+                if (value === undefined) {
+                    return state.settings[name];
+                }
+                state.settings[name] = value;
+                return this;
+            }
+            if (command === 'hide') {
+                hideCalendar();
+                return this;
+            }
+            return this;
+        }
+
+        var settings = {};
+        Object.keys(DEFAULT_SETTINGS).forEach(function (key) { settings[key] = DEFAULT_SETTINGS[key]; });
+        Object.keys(command || {}).forEach(function (key) { settings[key] = command[key]; });
+
+        return this.each(function () {
+            var element = this;
+            element._datepicker = { settings: settings, date: parseDate(element.value) };
+            element.classList.add('hasDatepicker');
+            element.addEventListener('click', function () { showCalendar(element); });
+            element.addEventListener('focus', function () { showCalendar(element); });
+        });
+    };
+
+    document.addEventListener('mousedown', function (event) {
+        if (!activeInput || !popup) {
+            return;
+        }
+        if (event.target === activeInput || popup.contains(event.target)) {
+            return;
+        }
+        hideCalendar();
+    });
+
+    window.jQuery = window.$ = jQuery;
+})(window);
@@ -3,6 +3,7 @@ import random
 import json
 import re
 import os
+import sys
 import signal
 import atexit
 from datetime import datetime, timedelta
@@ -11,6 +12,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -20,6 +22,278 @@ from webdriver_manager.chrome import ChromeDriverManager
 from settings import Config
 from ai_GPT_diary_content_generator import ContentGenerator
 
+# 작업 단계별 추가 필드 값 규칙은 v2와 함께 쓰는 shared/config 모듈 사용
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'shared', 'config'))
+from additional_fields import build_additional_field_values
+
+# 작업단계 목록에서 제외할 작업들
+EXCLUDED_TASK_KEYWORDS = ["출하/판매작업", "병해충 피해"]
+
+# 페이지의 XHR/fetch 진행 상태를 추적하는 추적기 설치 코드 (페이지마다 한 번만 설치됨)
+AJAX_TRACKER_INSTALL_JS = """
+if (!window.__agrionAjaxTracker) {
+    var tracker = window.__agrionAjaxTracker = {pending: 0};
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        tracker.pending++;
+        this.addEventListener('loadend', function () { tracker.pending--; });
+        return originalSend.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            tracker.pending++;
+            return originalFetch.apply(this, arguments).finally(function () { tracker.pending--; });
+        };
+    }
+}
+function agrionPendingRequests() {
+    return window.__agrionAjaxTracker.pending + ((window.jQuery && window.jQuery.active) || 0);
+}
+"""
+
+# 추적기 설치 후 진행 중인 요청 수(jQuery.active 포함)와 selector에 해당하는 요소 수를 반환합니다.
+AJAX_CASCADE_STATE_SCRIPT = AJAX_TRACKER_INSTALL_JS + """
+var selector = arguments[0];
+return {pending: agrionPendingRequests(), count: selector ? document.querySelectorAll(selector).length : 0};
+"""
+
+# 현재 폼 상태(날짜, 선택된 품목/작업단계, 체크된 필지/품종 수, 작업 내용 길이, 추가 입력 필드 값)를 모으는 함수
+FORM_STATE_JS = """
+function agrionFormState() {
+    function value(id) {
+        var element = document.getElementById(id);
+        return element ? element.value : '';
+    }
+    function selectedText(id) {
+        var select = document.getElementById(id);
+        return select && select.selectedIndex >= 0 ? select.options[select.selectedIndex].text.trim() : '';
+    }
+    function checkedCount(selector) {
+        return document.querySelectorAll(selector + " input[type='checkbox']:checked").length;
+    }
+    var memo = value('memo');
+    return {
+        startDate: value('now_date_s'),
+        endDate: value('now_date_e'),
+        crop: selectedText('selectCrops'),
+        task: selectedText('selectTask'),
+        lands: checkedCount('#checkLand'),
+        scrops: checkedCount('#checkScrop'),
+        memoLength: memo.length,
+        memoTrimmedLength: memo.trim().length,
+        fields: {
+            amount2: value('amount2'),
+            amount3: value('amount3'),
+            perPyeongAmount: value('perPyeongAmount'),
+            seedbedAmount: value('seedbedAmount'),
+            unit: value('unit')
+        }
+    };
+}
+"""
+
+FORM_STATE_SNAPSHOT_SCRIPT = FORM_STATE_JS + """
+return agrionFormState();
+"""
+
+# datepicker API로 날짜를 설정하는 함수
+# setDate는 onSelect/change를 발생시키지 않으므로 사이트가 의존하는 훅(종료일 minDate, 날씨 조회)을 직접 호출하고,
+# getDate로 다시 읽은 날짜(YYYY-MM-DD)를 돌려줍니다.
+DATEPICKER_JS = """
+function agrionSetPickerDate(id, dateText) {
+    var $ = window.jQuery;
+    var input = document.getElementById(id);
+    if (!input || !$ || !$(input).datepicker) {
+        return null;
+    }
+    var parts = dateText.split('-');
+    $(input).datepicker('setDate', new Date(+parts[0], +parts[1] - 1, +parts[2]));
+    var onSelect = $(input).datepicker('option', 'onSelect');
+    if (typeof onSelect === 'function') {
+        var inst = $.datepicker && $.datepicker._getInst ? $.datepicker._getInst(input) : undefined;
+        onSelect.call(input, input.value, inst);
+    }
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+    var date = $(input).datepicker('getDate');
+    if (!date) {
+        return null;
+    }
+    function pad(number) { return (number < 10 ? '0' : '') + number; }
+    return date.getFullYear() + '-' + pad(date.getMonth() + 1) + '-' + pad(date.getDate());
+}
+"""
+
+# 시작일/종료일을 datepicker API로 한 번에 설정하고 실제 설정된 날짜를 돌려줍니다.
+SET_DATE_RANGE_SCRIPT = DATEPICKER_JS + """
+return {
+    startDate: agrionSetPickerDate('now_date_s', arguments[0]),
+    endDate: agrionSetPickerDate('now_date_e', arguments[1])
+};
+"""
+
+# 일괄 입력 1단계 (execute_async_script)
+# 날짜(datepicker API) → 품목 → 필지 전체 → 품종 전체를 AJAX 응답에 맞춰 차례로 설정하고
+# 작업단계 옵션 목록과 날씨 정보를 한 번에 돌려줍니다.
+BULK_PREPARE_FORM_SCRIPT = AJAX_TRACKER_INSTALL_JS + DATEPICKER_JS + """
+var startDate = arguments[0], endDate = arguments[1], cropType = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var $ = window.jQuery;
+var started = Date.now();
+
+function fire(element, eventName) {
+    element.dispatchEvent(new Event(eventName, {bubbles: true}));
+}
+function value(id) {
+    var element = document.getElementById(id);
+    return element ? element.value : '';
+}
+function checkAll(selector) {
+    var boxes = document.querySelectorAll(selector);
+    for (var i = 0; i < boxes.length; i++) {
+        if (!boxes[i].checked) {
+            boxes[i].click();
+        }
+    }
+    return boxes.length;
+}
+function waitFor(selector, stage, next) {
+    (function poll() {
+        if (agrionPendingRequests() === 0 && document.querySelectorAll(selector).length > 0) {
+            next();
+        } else if (Date.now() - started > timeoutMs) {
+            done({ok: false, stage: stage, elapsed: Date.now() - started});
+        } else {
+            setTimeout(poll, 50);
+        }
+    })();
+}
+
+try {
+    if (agrionSetPickerDate('now_date_s', startDate) !== startDate ||
+            agrionSetPickerDate('now_date_e', endDate) !== endDate) {
+        done({ok: false, stage: '날짜'});
+        return;
+    }
+
+    var cropSelect = document.getElementById('selectCrops');
+    var cropOption = null;
+    for (var i = 0; i < cropSelect.options.length; i++) {
+        var option = cropSelect.options[i];
+        if (option.value && option.text.indexOf(cropType) >= 0) { cropOption = option; break; }
+        if (option.value && !cropOption) { cropOption = option; }
+    }
+    if (!cropOption) {
+        done({ok: false, stage: '품목'});
+        return;
+    }
+    cropSelect.value = cropOption.value;
+    fire(cropSelect, 'change');
+} catch (e) {
+    done({ok: false, stage: '날짜/품목', error: String(e)});
+    return;
+}
+
+var result = {ok: true, crop: cropOption.text};
+waitFor("#checkLand input[type='checkbox']", '필지', function () {
+    result.lands = checkAll("#checkLand input[type='checkbox']");
+    waitFor("#checkScrop input[type='checkbox']", '품종', function () {
+        result.scrops = checkAll("#checkScrop input[type='checkbox']");
+        waitFor("#selectTask option:not([value=''])", '작업단계', function () {
+            var options = document.querySelectorAll('#selectTask option');
+            result.tasks = [];
+            for (var j = 0; j < options.length; j++) {
+                result.tasks.push({text: options[j].text.trim(), value: options[j].value});
+            }
+            result.startDate = value('now_date_s');
+            result.endDate = value('now_date_e');
+            result.weather = {
+                weather: value('wfKor'),
+                low_temp: value('low_temp'),
+                high_temp: value('high_temp'),
+                rainfall: value('r12'),
+                humidity: value('reh')
+            };
+            result.elapsed = Date.now() - started;
+            done(result);
+        });
+    });
+});
+"""
+
+# 일괄 입력 2단계 (execute_script)
+# 작업단계 선택 → 추가 입력 필드/단위 → 작업 내용을 입력하고 최종 폼 상태를 돌려줍니다.
+BULK_FILL_FORM_SCRIPT = FORM_STATE_JS + """
+var taskStep = arguments[0], fields = arguments[1], memo = arguments[2];
+
+function fire(element, eventName) {
+    element.dispatchEvent(new Event(eventName, {bubbles: true}));
+}
+
+var taskSelect = document.getElementById('selectTask');
+var exact = null, partial = null;
+for (var i = 0; i < taskSelect.options.length; i++) {
+    var option = taskSelect.options[i];
+    var text = option.text.trim();
+    if (!option.value) { continue; }
+    if (text === taskStep) { exact = option; break; }
+    if (!partial && (text.indexOf(taskStep) >= 0 || taskStep.indexOf(text) >= 0)) { partial = option; }
+}
+var taskOption = exact || partial;
+if (taskOption) {
+    taskSelect.value = taskOption.value;
+    fire(taskSelect, 'change');
+}
+
+Object.keys(fields).forEach(function (id) {
+    var element = document.getElementById(id);
+    if (!element) { return; }
+    element.value = fields[id];
+    fire(element, 'input');
+    fire(element, 'change');
+});
+
+var memoInput = document.getElementById('memo');
+memoInput.value = memo;
+fire(memoInput, 'input');
+fire(memoInput, 'change');
+fire(memoInput, 'keyup');
+
+var state = agrionFormState();
+state.ok = !!taskOption && memoInput.value === memo;
+return state;
+"""
+
+# 입력 필드 값을 한 번에 설정하고 input/change/keyup 이벤트를 발생시킨 뒤 설정된 값을 돌려줍니다.
+SET_INPUT_VALUE_SCRIPT = """
+var element = arguments[0];
+element.value = arguments[1];
+['input', 'change', 'keyup'].forEach(function (eventName) {
+    element.dispatchEvent(new Event(eventName, {bubbles: true}));
+});
+return element.value;
+"""
+
+# 작업단계 드롭다운 전체를 [{text, value, selected}] 목록으로 한 번에 읽어옵니다.
+SELECT_OPTIONS_SNAPSHOT_SCRIPT = """
+var select = document.querySelector(arguments[0]);
+if (!select) { return null; }
+var options = [];
+for (var i = 0; i < select.options.length; i++) {
+    var option = select.options[i];
+    options.push({text: option.text.trim(), value: option.value, selected: option.selected});
+}
+return options;
+"""
+
+# value로 옵션을 선택하고 change 이벤트를 발생시킨 뒤 선택된 옵션 텍스트를 돌려줍니다.
+SELECT_OPTION_BY_VALUE_SCRIPT = """
+var select = document.querySelector(arguments[0]);
+select.value = arguments[1];
+select.dispatchEvent(new Event('change', {bubbles: true}));
+return select.selectedIndex >= 0 ? select.options[select.selectedIndex].text.trim() : '';
+"""
+
 class AgrionMacro:
     def __init__(self):
         self.driver = None
@@ -29,6 +303,7 @@ class AgrionMacro:
         self.log_file = None
         self.log_filename = None
         self.is_cleanup_done = False  # cleanup 중복 방지
+        self.last_form_snapshot = None  # 마지막으로 확인한 폼 상태 (누락 항목 재설정에 사용)
         self.setup_driver()
         self.load_schedule_data()
         self.setup_signal_handlers()
@@ -171,12 +446,10 @@ class AgrionMacro:
         self.driver = None
         self.wait = None
         
-        # Firefox 먼저 시도 (더 안정적)
-        if self._try_firefox():
-            return
-        
-        # Firefox 실패 시 Chrome 시도
-        if self._try_chrome():
+        # Firefox 먼저 시도 (더 안정적), 실패 시 Chrome 시도
+        if self._try_firefox() or self._try_chrome():
+            # 일괄 입력 스크립트가 AJAX 연쇄 로딩을 기다릴 수 있도록 비동기 스크립트 제한 시간 설정
+            self.driver.set_script_timeout(Config.BULK_FILL_TIMEOUT + 5)
             return
         
         # 모든 브라우저 실패 시 오류 발생
@@ -353,10 +626,33 @@ class AgrionMacro:
             raise
             
     def set_date_range(self, start_date, end_date):
-        """시작일과 종료일을 설정합니다."""
+        """시작일과 종료일을 설정합니다. (datepicker API 우선, 실패 시 달력 클릭 방식)"""
+        print(f"날짜 설정: {start_date} ~ {end_date}")
+        if self.set_date_range_with_api(start_date, end_date):
+            return
+        
+        print("🔄 달력 클릭 방식으로 날짜를 설정합니다.")
+        self.set_date_range_with_calendar(start_date, end_date)
+    
+    def set_date_range_with_api(self, start_date, end_date):
+        """datepicker 'setDate' API로 시작일과 종료일을 한 번의 스크립트 호출로 설정합니다.
+
+        Returns:
+            bool: getDate로 다시 읽은 날짜가 요청한 날짜와 일치하면 True
+        """
+        try:
+            result = self.driver.execute_script(SET_DATE_RANGE_SCRIPT, start_date, end_date) or {}
+            if result.get("startDate") == start_date and result.get("endDate") == end_date:
+                print("날짜 설정 완료! (datepicker API)")
+                return True
+            print(f"⚠️ datepicker API 날짜 확인 실패: {result.get('startDate')} ~ {result.get('endDate')}")
+        except Exception as e:
+            print(f"⚠️ datepicker API 날짜 설정 실패: {e}")
+        return False
+    
+    def set_date_range_with_calendar(self, start_date, end_date):
+        """달력을 열어 연/월/일을 클릭하는 방식으로 시작일과 종료일을 설정합니다."""
         try:
-            print(f"날짜 설정: {start_date} ~ {end_date}")
-            
             # 시작일 설정
             start_date_input = self.wait.until(
                 EC.presence_of_element_located((By.ID, "now_date_s"))
@@ -439,11 +735,150 @@ class AgrionMacro:
                 print(f"날짜 설정 완전 실패: {fallback_error}")
                 raise
             
+    def install_ajax_tracker(self):
+        """현재 페이지에 XHR/fetch 추적기를 설치합니다. (이미 설치된 경우 무시)"""
+        try:
+            self.driver.execute_script(AJAX_CASCADE_STATE_SCRIPT, None)
+        except Exception as e:
+            print(f"⚠️ AJAX 추적기 설치 실패: {e}")
+
+    def wait_for_cascade(self, selector, label, timeout=None):
+        """진행 중인 AJAX 요청이 끝나고 selector 목록이 채워지는 즉시 반환합니다.
+
+        Args:
+            selector (str): 채워져야 하는 요소의 CSS selector
+            label (str): 출력용 이름 (예: "필지 목록")
+            timeout (float): 최대 대기 시간 (기본값: Config.AJAX_WAIT_TIMEOUT)
+
+        Returns:
+            int: 대기 종료 시점의 요소 수 (시간 초과 시 마지막으로 확인된 수)
+        """
+        timeout = timeout if timeout is not None else Config.AJAX_WAIT_TIMEOUT
+        last_state = {"pending": 0, "count": 0}
+
+        def cascade_ready(driver):
+            state = driver.execute_script(AJAX_CASCADE_STATE_SCRIPT, selector)
+            last_state.update(state)
+            return state["pending"] == 0 and state["count"] > 0
+
+        started = time.time()
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=Config.AJAX_POLL_INTERVAL).until(cascade_ready)
+            print(f"⏱️ {label} 로드 완료 ({time.time() - started:.2f}초, {last_state['count']}개)")
+        except TimeoutException:
+            print(f"⚠️ {label} 로드 대기 시간 초과 ({timeout}초, 진행 중인 요청 {last_state['pending']}개)")
+        return last_state["count"]
+
+    def prepare_form_bulk(self, start_date, end_date):
+        """날짜/품목/필지/품종 설정과 작업단계·날씨 읽기를 한 번의 스크립트 호출로 처리합니다.
+
+        Returns:
+            dict: {"tasks": 사용 가능한 작업단계 목록, "weather": 날씨 정보} (실패 시 None)
+        """
+        try:
+            print(f"⚡ 일괄 입력 준비: {start_date} ~ {end_date}, 품목 {Config.CROP_TYPE}")
+            result = self.driver.execute_async_script(
+                BULK_PREPARE_FORM_SCRIPT, start_date, end_date, Config.CROP_TYPE,
+                int(Config.BULK_FILL_TIMEOUT * 1000)
+            )
+            if not result or not result.get("ok"):
+                print(f"⚠️ 일괄 입력 준비 실패 (단계: {(result or {}).get('stage', '알 수 없음')})")
+                return None
+
+            available_tasks = []
+            for task in result["tasks"]:
+                if not task["value"] or not task["text"] or task["text"] == "작업단계 선택":
+                    continue
+                if any(excluded in task["text"] for excluded in EXCLUDED_TASK_KEYWORDS):
+                    continue
+                available_tasks.append(task["text"])
+
+            weather_data = result["weather"]
+            print(f"⚡ 일괄 입력 준비 완료 ({result['elapsed'] / 1000:.2f}초): {result['crop']}, "
+                  f"필지 {result['lands']}개, 품종 {result['scrops']}개, 작업단계 {len(available_tasks)}개")
+            print(f"🌤️ 날씨 정보 수집: {weather_data['weather']}, 기온: {weather_data['low_temp']}°C~{weather_data['high_temp']}°C")
+            return {"tasks": available_tasks, "weather": weather_data}
+
+        except Exception as e:
+            print(f"⚠️ 일괄 입력 준비 중 오류 발생: {e}")
+            return None
+
+    def fill_form_bulk(self, task_step, content):
+        """작업단계 선택, 추가 입력 필드, 작업 내용 입력을 한 번의 스크립트 호출로 처리합니다.
+
+        Returns:
+            dict: 입력 후 최종 폼 상태 (실패 시 None)
+        """
+        try:
+            fields = self.generate_additional_field_values(task_step)
+            state = self.driver.execute_script(BULK_FILL_FORM_SCRIPT, task_step, fields, content)
+            if not state or not state.get("ok"):
+                print(f"⚠️ 일괄 입력 실패: {state}")
+                return None
+
+            print(f"⚡ 일괄 입력 완료: {state['startDate']} ~ {state['endDate']}, {state['crop']}, "
+                  f"필지 {state['lands']}개, 품종 {state['scrops']}개, {state['task']}, "
+                  f"추가 필드 {state['fields']}, 작업 내용 {state['memoLength']}자")
+            return state
+
+        except Exception as e:
+            print(f"⚠️ 일괄 입력 중 오류 발생: {e}")
+            return None
+
+    def prepare_diary_form(self, start_date, end_date):
+        """날짜/품목/필지/품종을 설정하고 사용 가능한 작업단계 목록과 날씨 정보를 가져옵니다.
+
+        FORM_FILL_MODE가 'bulk'이면 일괄 입력을 먼저 시도하고, 실패하면 항목별 입력으로 진행합니다.
+
+        Returns:
+            tuple: (사용 가능한 작업단계 목록, 날씨 정보, 일괄 입력 사용 여부)
+        """
+        if Config.FORM_FILL_MODE == 'bulk':
+            prepared = self.prepare_form_bulk(start_date, end_date)
+            if prepared and prepared["tasks"]:
+                return prepared["tasks"], prepared["weather"], True
+            print("🔄 항목별 입력 방식으로 다시 시도합니다.")
+
+        self.set_date_range(start_date, end_date)
+
+        # 품목, 필지, 품종 선택 (항상 처음부터 시작)
+        try:
+            self.select_crop()
+            self.select_all_lands()
+            self.select_all_crops()
+        except Exception as e:
+            print(f"❌ 품목/필지/품종 선택 실패: {e}")
+            return [], None, False
+
+        # 사용 가능한 작업단계 목록 가져오기
+        try:
+            self.wait.until(
+                EC.presence_of_element_located((By.ID, "selectTask"))
+            )
+            available_tasks = self.get_available_task_steps()
+        except Exception as e:
+            print(f"❌ 작업단계 목록 가져오기 실패: {e}")
+            return [], None, False
+
+        return available_tasks, self.get_weather_data(), False
+
+    def fill_task_and_memo(self, task_step, content, bulk_filled):
+        """작업단계, 추가 입력 필드, 작업 내용을 입력합니다. (일괄 입력 실패 시 항목별 입력)"""
+        if bulk_filled and self.fill_form_bulk(task_step, content):
+            return
+
+        self.select_task_step(task_step)
+        self.handle_additional_fields(task_step)
+        self.enter_memo_with_content(content)
+
     def select_crop(self):
         """품목을 선택합니다."""
         try:
             print(f"품목 선택: {Config.CROP_TYPE}")
-            
+
+            # 품목 변경으로 시작되는 필지 목록 요청을 추적하기 위해 추적기 설치
+            self.install_ajax_tracker()
+
             # 품목 선택 드롭다운 클릭
             crop_select = self.wait.until(
                 EC.element_to_be_clickable((By.ID, "selectCrops"))
@@ -473,9 +908,7 @@ class AgrionMacro:
                 else:
                     print("선택 가능한 품목이 없습니다.")
             
-            # 서버 전송을 위한 대기
-            print("서버에서 필지 목록을 로드하는 중...")
-            time.sleep(random.uniform(Config.SERVER_LOAD_DELAY_MIN, Config.SERVER_LOAD_DELAY_MAX))
+            # 필지 목록 로딩은 select_all_lands에서 AJAX 완료 시점까지 대기
             print("품목 선택 완료!")
             
         except Exception as e:
@@ -487,10 +920,10 @@ class AgrionMacro:
         """모든 필지를 선택합니다."""
         try:
             print("모든 필지 선택 중...")
-            
-            # 필지 목록 대기
-            time.sleep(Config.FAST_WAIT_TIME)
-            
+
+            # 필지 목록 대기 (품목 선택 XHR 완료 즉시 진행)
+            self.wait_for_cascade("#checkLand input[type='checkbox']", "필지 목록")
+
             # 필지 체크박스들 찾기
             land_checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "#checkLand input[type='checkbox']")
             print(f"발견된 필지 체크박스 수: {len(land_checkboxes)}")
@@ -500,12 +933,7 @@ class AgrionMacro:
                     if not checkbox.is_selected():
                         self.driver.execute_script("arguments[0].click();", checkbox)
                         print(f"필지 {i+1} 선택됨")
-                        time.sleep(random.uniform(Config.INPUT_DELAY_MIN, Config.INPUT_DELAY_MAX))
                 print(f"{len(land_checkboxes)}개 필지 선택 완료!")
-                
-                # 서버 전송을 위한 대기
-                print("서버에서 품종 목록을 로드하는 중...")
-                time.sleep(random.uniform(Config.SERVER_LOAD_DELAY_MIN, Config.SERVER_LOAD_DELAY_MAX))
             else:
                 print("선택 가능한 필지가 없습니다.")
                 print("필지 목록이 로드되지 않았을 수 있습니다.")
@@ -517,10 +945,10 @@ class AgrionMacro:
         """모든 품종을 선택합니다."""
         try:
             print("모든 품종 선택 중...")
-            
-            # 품목 목록 대기
-            time.sleep(Config.FAST_WAIT_TIME)
-            
+
+            # 품종 목록 대기 (필지 선택 XHR이 모두 끝난 뒤 진행)
+            self.wait_for_cascade("#checkScrop input[type='checkbox']", "품종 목록")
+
             # 품종 체크박스들 찾기
             crop_checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "#checkScrop input[type='checkbox']")
             print(f"발견된 품종 체크박스 수: {len(crop_checkboxes)}")
@@ -530,12 +958,7 @@ class AgrionMacro:
                     if not checkbox.is_selected():
                         self.driver.execute_script("arguments[0].click();", checkbox)
                         print(f"품종 {i+1} 선택됨")
-                        time.sleep(random.uniform(Config.INPUT_DELAY_MIN, Config.INPUT_DELAY_MAX))
                 print(f"{len(crop_checkboxes)}개 품종 선택 완료!")
-                
-                # 서버 전송을 위한 대기 (단축)
-                print("서버에서 작업단계 목록을 로드하는 중...")
-                time.sleep(0.5)
             else:
                 print("선택 가능한 품종이 없습니다.")
                 print("품종 목록이 로드되지 않았을 수 있습니다.")
@@ -630,69 +1053,50 @@ class AgrionMacro:
         
         return matching_tasks
     
+    def get_select_options(self, selector):
+        """셀렉트 박스의 옵션 목록을 한 번의 스크립트 호출로 가져옵니다.
+
+        Returns:
+            list: [{"text", "value", "selected"}] 옵션 목록 (셀렉트 박스가 없으면 빈 목록)
+        """
+        return self.driver.execute_script(SELECT_OPTIONS_SNAPSHOT_SCRIPT, selector) or []
+
+    def select_option_by_value(self, selector, value):
+        """셀렉트 박스에서 value로 옵션을 선택하고 change 이벤트를 발생시킵니다.
+
+        Returns:
+            str: 선택된 옵션 텍스트
+        """
+        return self.driver.execute_script(SELECT_OPTION_BY_VALUE_SCRIPT, selector, value)
+
     def get_available_task_steps(self):
         """웹페이지에서 사용 가능한 작업단계 목록을 가져옵니다."""
         try:
-            # 페이지 안정화를 위한 대기 (단축)
-            time.sleep(1)
-            
-            # 작업단계 선택 드롭다운 찾기
-            task_select = self.wait.until(
-                EC.presence_of_element_located((By.ID, "selectTask"))
-            )
-            
-            # 드롭다운 클릭하여 옵션 로드 (빠른 방식)
-            try:
-                task_select.click()
-                time.sleep(0.3)  # 빠른 대기
-                print("✅ 작업단계 드롭다운 클릭 성공")
-            except Exception as click_error:
-                print(f"⚠️ 드롭다운 클릭 실패, JavaScript로 시도: {click_error}")
-                self.driver.execute_script("arguments[0].click();", task_select)
-                time.sleep(0.3)  # 빠른 대기
-            
-            # 작업단계 옵션들 찾기 (빠른 시도)
-            max_retries = 2  # 시도 횟수 줄임
-            options = []
-            
-            for retry in range(max_retries):
-                try:
-                    options = self.driver.find_elements(By.CSS_SELECTOR, "#selectTask option")
-                    if options:
-                        print(f"✅ 작업단계 옵션 로드 성공 (시도 {retry + 1})")
-                        break
-                    else:
-                        print(f"⚠️ 작업단계 옵션 없음 (시도 {retry + 1})")
-                        time.sleep(0.5)  # 대기 시간 단축
-                except Exception as find_error:
-                    print(f"⚠️ 작업단계 옵션 찾기 실패 (시도 {retry + 1}): {find_error}")
-                    time.sleep(0.5)  # 대기 시간 단축
-            
+            # 작업단계 목록 대기 (품종 선택 XHR 완료 즉시 진행)
+            self.wait_for_cascade("#selectTask option:not([value=''])", "작업단계 목록")
+
+            # 작업단계 옵션 전체를 한 번에 읽기
+            options = self.get_select_options("#selectTask")
             print(f"발견된 작업단계 옵션 수: {len(options)}")
             
             # 모든 옵션 가져오기 (제외할 작업 필터링)
             available_tasks = []
-            excluded_tasks = ["출하/판매작업", "병해충 피해"]  # 제외할 작업들
             
             for i, option in enumerate(options):
-                option_text = option.text.strip()
-                option_value = option.get_attribute("value")
-                if option_text and option_text != "작업단계 선택" and option_value:
+                if option["text"] and option["text"] != "작업단계 선택" and option["value"]:
                     # 제외할 작업인지 확인
-                    if any(excluded in option_text for excluded in excluded_tasks):
-                        print(f"   ⚠️  제외됨: {option_text}")
+                    if any(excluded in option["text"] for excluded in EXCLUDED_TASK_KEYWORDS):
+                        print(f"   ⚠️  제외됨: {option['text']}")
                         continue
                     
-                    available_tasks.append(option_text)
-                    print(f"작업단계 옵션 {i}: {option_text} (value: {option_value})")
+                    available_tasks.append(option["text"])
+                    print(f"작업단계 옵션 {i}: {option['text']} (value: {option['value']})")
             
             # 디버깅: 모든 옵션 출력
             if not available_tasks:
                 print("⚠️ 사용 가능한 작업단계가 없습니다. 모든 옵션을 확인합니다:")
                 for i, option in enumerate(options):
-                    option_text = option.text.strip()
-                    option_value = option.get_attribute("value")
-                    print(f"  옵션 {i}: '{option_text}' (value: '{option_value}')")
+                    print(f"  옵션 {i}: '{option['text']}' (value: '{option['value']}')")
             
             print(f"📋 사용 가능한 작업단계 {len(available_tasks)}개:")
             for i, task in enumerate(available_tasks, 1):
@@ -898,55 +1302,37 @@ class AgrionMacro:
         try:
             print(f"작업 단계 선택: {task_step}")
             
-            # 작업 단계 선택 드롭다운 클릭
-            task_select = self.wait.until(
-                EC.element_to_be_clickable((By.ID, "selectTask"))
-            )
-            task_select.click()
-            time.sleep(0.3)  # 빠른 대기
-            
-            # 작업 단계 옵션들 찾기
-            options = self.driver.find_elements(By.CSS_SELECTOR, "#selectTask option")
+            # 작업 단계 옵션 전체를 한 번에 읽기
+            options = self.get_select_options("#selectTask")
+            valid_options = [option for option in options
+                             if option["text"] and option["text"] != "작업단계 선택" and option["value"]]
             print(f"발견된 작업 단계 옵션 수: {len(options)}")
             
-            # 작업 단계 옵션 찾기 (빠른 매칭)
-            found = False
-            for i, option in enumerate(options):
-                option_text = option.text.strip()
-                option_value = option.get_attribute("value")
-                
-                # 정확한 매칭 시도
-                if task_step == option_text:
-                    option.click()
-                    found = True
-                    print(f"작업 단계 정확 매칭 선택됨: {option_text}")
-                    break
-                elif task_step in option_text or option_text in task_step:
-                    option.click()
-                    found = True
-                    print(f"작업 단계 부분 매칭 선택됨: {option_text}")
-                    break
-                # value 속성으로도 매칭 시도
-                elif option_value and task_step in option_value:
-                    option.click()
-                    found = True
-                    print(f"작업 단계 value 매칭 선택됨: {option_text} (value: {option_value})")
+            # 작업 단계 옵션 찾기 (정확 매칭 → 부분 매칭 → value 매칭 순)
+            target = None
+            for option in valid_options:
+                if task_step == option["text"]:
+                    target, match_type = option, "정확"
                     break
+            else:
+                for option in valid_options:
+                    if task_step in option["text"] or option["text"] in task_step:
+                        target, match_type = option, "부분"
+                        break
+                    elif task_step in option["value"]:
+                        target, match_type = option, "value"
+                        break
             
-            if not found:
+            if target:
+                selected_text = self.select_option_by_value("#selectTask", target["value"])
+                print(f"작업 단계 {match_type} 매칭 선택됨: {selected_text} (value: {target['value']})")
+            elif valid_options:
                 # 기본값 선택 (첫 번째 유효한 옵션)
-                for option in options:
-                    option_text = option.text.strip()
-                    option_value = option.get_attribute("value")
-                    if option_text and option_text != "작업단계 선택" and option_value:
-                        option.click()
-                        print(f"'{task_step}'을 찾을 수 없어 첫 번째 유효한 옵션을 선택했습니다: {option_text}")
-                        break
-                else:
-                    print("선택 가능한 작업 단계가 없습니다.")
+                selected_text = self.select_option_by_value("#selectTask", valid_options[0]["value"])
+                print(f"'{task_step}'을 찾을 수 없어 첫 번째 유효한 옵션을 선택했습니다: {selected_text}")
+            else:
+                print("선택 가능한 작업 단계가 없습니다.")
             
-            # 서버 전송을 위한 대기 (단축)
-            time.sleep(0.5)
             print("작업 단계 선택 완료!")
             
         except Exception as e:
@@ -972,13 +1358,7 @@ class AgrionMacro:
             # Config에서 GPT 사용 여부 설정 (결제 완료로 GPT 활성화)
             content = self.content_generator.generate_diary_content(selected_task, selected_crop, True, None)  # GPT 사용
             
-            memo_input.clear()
-            time.sleep(random.uniform(Config.INPUT_DELAY_MIN, Config.INPUT_DELAY_MAX))
-            
-            # 자연스러운 타이핑 시뮬레이션 (속도 향상)
-            for char in content:
-                memo_input.send_keys(char)
-                time.sleep(random.uniform(0.02, 0.08))  # 타이핑 속도 향상
+            self.type_memo(memo_input, content)
             
             print(f"작업 내용 입력 완료: {content[:50]}...")
             
@@ -986,6 +1366,44 @@ class AgrionMacro:
             print(f"작업 내용 입력 중 오류 발생: {e}")
             raise
             
+    def type_memo(self, memo_input, content, mode=None):
+        """설정된 입력 방식으로 작업 내용을 입력합니다.
+
+        Args:
+            memo_input: 메모 입력 필드 요소
+            content (str): 입력할 내용
+            mode (str): 'instant' (값 설정 + input/change 이벤트), 'chunked' (단어 단위 send_keys),
+                        'human' (한 글자씩 타이핑) 중 하나 (기본값: Config.MEMO_INPUT_MODE)
+        """
+        mode = mode or Config.MEMO_INPUT_MODE
+        
+        if mode == 'instant':
+            entered = self.driver.execute_script(SET_INPUT_VALUE_SCRIPT, memo_input, content)
+        else:
+            memo_input.clear()
+            if mode == 'human':
+                time.sleep(random.uniform(Config.INPUT_DELAY_MIN, Config.INPUT_DELAY_MAX))
+                # 자연스러운 타이핑 시뮬레이션
+                for char in content:
+                    memo_input.send_keys(char)
+                    time.sleep(random.uniform(0.02, 0.08))
+            else:
+                # 단어 단위로 나누어 입력하고, 전체 대기 시간은 MEMO_CHUNK_TIME_BUDGET 이내로 제한
+                chunks = re.findall(r'\S+\s*|\s+', content)
+                delay = Config.MEMO_CHUNK_TIME_BUDGET / len(chunks) if chunks else 0
+                for chunk in chunks:
+                    memo_input.send_keys(chunk)
+                    time.sleep(random.uniform(delay * 0.5, delay * 1.5))
+            entered = memo_input.get_attribute("value")
+        
+        # 입력 결과가 다르면 (maxlength, IME 문제 등) 값 설정 방식으로 한 번 더 입력
+        if entered != content and mode != 'instant':
+            print(f"⚠️ {mode} 방식 입력 결과가 다릅니다. 값 설정 방식으로 다시 입력합니다.")
+            entered = self.driver.execute_script(SET_INPUT_VALUE_SCRIPT, memo_input, content)
+        
+        print(f"⌨️ 작업 내용 입력 방식: {mode} ({len(entered or '')}자)")
+        return entered
+
     def handle_additional_fields(self, task_step):
         """작업 단계별 추가 입력 필드를 처리합니다."""
         try:
@@ -1004,6 +1422,14 @@ class AgrionMacro:
         except Exception as e:
             print(f"추가 입력 필드 처리 중 오류 발생: {e}")
             
+    def generate_additional_field_values(self, task_step):
+        """작업 단계별 추가 입력 필드 값을 만듭니다. (일괄 입력용, 항목별 입력과 같은 범위 사용)
+
+        Returns:
+            dict: {필드 id: 입력값}
+        """
+        return build_additional_field_values(task_step)
+
     def handle_harvest_fields(self):
         """수확작업 관련 추가 필드를 처리합니다."""
         try:
@@ -1126,85 +1552,43 @@ class AgrionMacro:
             print(f"작업 단계 텍스트 가져오기 실패: {e}")
             return "작업단계 선택"
     
+    def get_form_snapshot(self):
+        """현재 폼 상태를 한 번의 스크립트 호출로 가져옵니다.
+
+        Returns:
+            dict: {"startDate", "endDate", "crop", "task", "lands", "scrops",
+                   "memoLength", "memoTrimmedLength", "fields"} (실패 시 None)
+        """
+        try:
+            snapshot = self.driver.execute_script(FORM_STATE_SNAPSHOT_SCRIPT)
+            self.last_form_snapshot = snapshot
+            return snapshot
+        except Exception as e:
+            print(f"폼 상태 읽기 실패: {e}")
+            self.last_form_snapshot = None
+            return None
+
     def check_input_fields(self):
         """입력 항목들이 올바르게 설정되었는지 확인합니다."""
         try:
             print("입력 항목 체크 중...")
-            missing_fields = []
-            
-            # 1. 날짜 체크
-            try:
-                start_date = self.driver.find_element(By.ID, "now_date_s").get_attribute("value")
-                end_date = self.driver.find_element(By.ID, "now_date_e").get_attribute("value")
-                if not start_date or not end_date:
-                    missing_fields.append("날짜")
-                    print("❌ 날짜가 설정되지 않았습니다.")
-                else:
-                    print(f"✅ 날짜 설정됨: {start_date} ~ {end_date}")
-            except Exception as e:
-                missing_fields.append("날짜")
-                print(f"❌ 날짜 체크 실패: {e}")
-            
-            # 2. 품목 체크
-            try:
-                selected_crop = self.get_selected_crop_text()
-                if not selected_crop or selected_crop == "품목선택":
-                    missing_fields.append("품목")
-                    print("❌ 품목이 선택되지 않았습니다.")
-                else:
-                    print(f"✅ 품목 선택됨: {selected_crop}")
-            except Exception as e:
-                missing_fields.append("품목")
-                print(f"❌ 품목 체크 실패: {e}")
-            
-            # 3. 필지 체크
-            try:
-                land_checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "#checkLand input[type='checkbox']:checked")
-                if not land_checkboxes:
-                    missing_fields.append("필지")
-                    print("❌ 필지가 선택되지 않았습니다.")
-                else:
-                    print(f"✅ 필지 선택됨: {len(land_checkboxes)}개")
-            except Exception as e:
-                missing_fields.append("필지")
-                print(f"❌ 필지 체크 실패: {e}")
-            
-            # 4. 품종 체크
-            try:
-                crop_checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "#checkScrop input[type='checkbox']:checked")
-                if not crop_checkboxes:
-                    missing_fields.append("품종")
-                    print("❌ 품종이 선택되지 않았습니다.")
-                else:
-                    print(f"✅ 품종 선택됨: {len(crop_checkboxes)}개")
-            except Exception as e:
-                missing_fields.append("품종")
-                print(f"❌ 품종 체크 실패: {e}")
-            
-            # 5. 작업 단계 체크
-            try:
-                selected_task = self.get_selected_task_text()
-                if not selected_task or selected_task == "작업단계 선택":
-                    missing_fields.append("작업 단계")
-                    print("❌ 작업 단계가 선택되지 않았습니다.")
-                else:
-                    print(f"✅ 작업 단계 선택됨: {selected_task}")
-            except Exception as e:
-                missing_fields.append("작업 단계")
-                print(f"❌ 작업 단계 체크 실패: {e}")
-            
-            # 6. 작업 내용 체크
-            try:
-                memo_input = self.driver.find_element(By.ID, "memo")
-                memo_content = memo_input.get_attribute("value")
-                if not memo_content or len(memo_content.strip()) < 10:
-                    missing_fields.append("작업 내용")
-                    print("❌ 작업 내용이 입력되지 않았거나 너무 짧습니다.")
-                else:
-                    print(f"✅ 작업 내용 입력됨: {len(memo_content)}자")
-            except Exception as e:
-                missing_fields.append("작업 내용")
-                print(f"❌ 작업 내용 체크 실패: {e}")
+            snapshot = self.get_form_snapshot()
+            missing_fields = self.get_missing_fields(snapshot)
+            
+            if snapshot:
+                checks = [
+                    ("날짜", f"날짜 설정됨: {snapshot['startDate']} ~ {snapshot['endDate']}", "날짜가 설정되지 않았습니다."),
+                    ("품목", f"품목 선택됨: {snapshot['crop']}", "품목이 선택되지 않았습니다."),
+                    ("필지", f"필지 선택됨: {snapshot['lands']}개", "필지가 선택되지 않았습니다."),
+                    ("품종", f"품종 선택됨: {snapshot['scrops']}개", "품종이 선택되지 않았습니다."),
+                    ("작업 단계", f"작업 단계 선택됨: {snapshot['task']}", "작업 단계가 선택되지 않았습니다."),
+                    ("작업 내용", f"작업 내용 입력됨: {snapshot['memoLength']}자", "작업 내용이 입력되지 않았거나 너무 짧습니다."),
+                ]
+                for field, ok_message, missing_message in checks:
+                    if field in missing_fields:
+                        print(f"❌ {missing_message}")
+                    else:
+                        print(f"✅ {ok_message}")
             
             if missing_fields:
                 print(f"\n⚠️  누락된 항목: {', '.join(missing_fields)}")
@@ -1217,80 +1601,50 @@ class AgrionMacro:
             print(f"입력 항목 체크 중 오류 발생: {e}")
             return False, []
     
-    def get_missing_fields(self):
-        """누락된 입력 항목들을 확인하고 목록을 반환합니다."""
-        try:
-            missing_fields = []
-            
-            # 1. 날짜 체크
-            try:
-                start_date = self.driver.find_element(By.ID, "now_date_s").get_attribute("value")
-                end_date = self.driver.find_element(By.ID, "now_date_e").get_attribute("value")
-                if not start_date or not end_date:
-                    missing_fields.append("날짜")
-            except:
-                missing_fields.append("날짜")
-            
-            # 2. 품목 체크
-            try:
-                selected_crop = self.get_selected_crop_text()
-                if not selected_crop or selected_crop == "품목선택":
-                    missing_fields.append("품목")
-            except:
-                missing_fields.append("품목")
-            
-            # 3. 필지 체크
-            try:
-                land_checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "#checkLand input[type='checkbox']:checked")
-                if not land_checkboxes:
-                    missing_fields.append("필지")
-            except:
-                missing_fields.append("필지")
-            
-            # 4. 품종 체크
-            try:
-                crop_checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "#checkScrop input[type='checkbox']:checked")
-                if not crop_checkboxes:
-                    missing_fields.append("품종")
-            except:
-                missing_fields.append("품종")
-            
-            # 5. 작업 단계 체크
-            try:
-                selected_task = self.get_selected_task_text()
-                if not selected_task or selected_task == "작업단계 선택":
-                    missing_fields.append("작업 단계")
-            except:
-                missing_fields.append("작업 단계")
-            
-            # 6. 작업 내용 체크
-            try:
-                memo_input = self.driver.find_element(By.ID, "memo")
-                memo_content = memo_input.get_attribute("value")
-                if not memo_content or len(memo_content.strip()) < 10:
-                    missing_fields.append("작업 내용")
-            except:
-                missing_fields.append("작업 내용")
-            
-            return missing_fields
-                
-        except Exception as e:
-            print(f"누락된 항목 확인 중 오류 발생: {e}")
-            return []
+    def get_missing_fields(self, snapshot=None):
+        """누락된 입력 항목들을 확인하고 목록을 반환합니다.
+
+        Args:
+            snapshot (dict): get_form_snapshot() 결과 (없으면 새로 읽음)
+        """
+        if snapshot is None:
+            snapshot = self.get_form_snapshot()
+        if not snapshot:
+            return ["날짜", "품목", "필지", "품종", "작업 단계", "작업 내용"]
+        
+        missing_fields = []
+        if not snapshot["startDate"] or not snapshot["endDate"]:
+            missing_fields.append("날짜")
+        if not snapshot["crop"] or snapshot["crop"] == "품목선택":
+            missing_fields.append("품목")
+        if not snapshot["lands"]:
+            missing_fields.append("필지")
+        if not snapshot["scrops"]:
+            missing_fields.append("품종")
+        if not snapshot["task"] or snapshot["task"] == "작업단계 선택":
+            missing_fields.append("작업 단계")
+        if snapshot["memoTrimmedLength"] < 10:
+            missing_fields.append("작업 내용")
+        return missing_fields
     
-    def retry_input_fields(self, missing_fields):
-        """누락된 입력 항목들을 다시 설정합니다."""
+    def retry_input_fields(self, missing_fields, snapshot=None):
+        """누락된 입력 항목들을 다시 설정합니다.
+
+        Args:
+            missing_fields (list): 누락된 항목 목록
+            snapshot (dict): 누락 항목을 확인한 폼 상태 (기본값: 마지막 check_input_fields 결과)
+        """
         try:
             print(f"\n누락된 항목 재설정 시작: {', '.join(missing_fields)}")
+            snapshot = snapshot or self.last_form_snapshot or self.get_form_snapshot() or {}
+            selected_task = snapshot.get("task", "")
             
             for field in missing_fields:
                 print(f"\n--- {field} 재설정 ---")
                 
                 if field == "날짜":
                     # 날짜 재설정 (현재 설정된 날짜 사용)
-                    start_date = self.driver.find_element(By.ID, "now_date_s").get_attribute("value")
-                    end_date = self.driver.find_element(By.ID, "now_date_e").get_attribute("value")
-                    if not start_date or not end_date:
+                    if not snapshot.get("startDate") or not snapshot.get("endDate"):
                         # 기본 날짜 설정
                         from datetime import datetime
                         today = datetime.now().strftime('%Y-%m-%d')
@@ -1307,13 +1661,11 @@ class AgrionMacro:
                 
                 elif field == "작업 단계":
                     # 현재 선택된 작업 단계 다시 선택
-                    selected_task = self.get_selected_task_text()
                     if selected_task and selected_task != "작업단계 선택":
                         self.select_task_step(selected_task)
                 
                 elif field == "작업 내용":
                     # 작업 내용 재입력
-                    selected_task = self.get_selected_task_text()
                     if selected_task and selected_task != "작업단계 선택":
                         self.enter_memo(selected_task)
                 
@@ -1324,45 +1676,137 @@ class AgrionMacro:
         except Exception as e:
             print(f"누락된 항목 재설정 중 오류 발생: {e}")
             
+    def accept_alert(self, timeout):
+        """알럿이 나타날 때까지 짧은 간격으로 대기한 뒤 텍스트를 읽고 확인합니다.
+
+        Returns:
+            str: 알럿 텍스트 (시간 안에 알럿이 나타나지 않으면 None)
+        """
+        try:
+            alert = WebDriverWait(self.driver, timeout, poll_frequency=Config.ALERT_POLL_INTERVAL).until(
+                EC.alert_is_present()
+            )
+            alert_text = alert.text
+            alert.accept()
+            return alert_text
+        except TimeoutException:
+            return None
+
+    def wait_for_form_reset(self, timeout):
+        """저장 후 페이지가 새로 로드되어 작업 내용이 비워질 때까지 대기합니다.
+
+        Returns:
+            bool: 폼이 비워졌으면 True, 입력 내용이 그대로 남아 있으면 False
+        """
+        def form_reset(driver):
+            try:
+                snapshot = driver.execute_script(FORM_STATE_SNAPSHOT_SCRIPT)
+                return bool(snapshot) and snapshot["memoLength"] == 0
+            except Exception:
+                # 페이지 전환 중에는 스크립트가 실패할 수 있으므로 계속 확인
+                return False
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=Config.ALERT_POLL_INTERVAL).until(form_reset)
+            return True
+        except TimeoutException:
+            return False
+
     def save_diary(self):
-        """영농일지를 저장합니다."""
+        """영농일지를 저장합니다.
+
+        저장 버튼 클릭 후 확인창과 저장 결과 알럿이 나타나는 즉시 처리하고,
+        결과 알럿 문구와 폼 초기화 여부로 저장 성공을 판단합니다.
+        첫 알럿이 저장 확인창(Config.SAVE_CONFIRM_MESSAGES)일 때만 submitted를 True로 표시하고,
+        그 뒤에는 서버가 이미 저장했을 수 있으므로 오류가 나도 예외 대신 결과를 돌려줍니다.
+
+        Returns:
+            dict: {"success", "submitted", "confirm_message", "result_message", "form_reset", "elapsed", "error"}
+        """
+        print("영농일지 저장 중...")
+        started = time.time()
+        result = {
+            "success": False,
+            "submitted": False,
+            "confirm_message": None,
+            "result_message": None,
+            "form_reset": False,
+            "elapsed": 0.0,
+            "error": None,
+        }
+        
         try:
-            print("영농일지 저장 중...")
-            
             # 저장 버튼 클릭
             save_button = self.wait.until(
                 EC.element_to_be_clickable((By.ID, "upsert_diary"))
             )
             save_button.click()
             
-            # 저장 후 대기 시간 단축
-            time.sleep(random.uniform(2, 4))
-            
-            # 첫 번째 알럿 확인
-            time.sleep(1)
-            try:
-                alert = self.driver.switch_to.alert
-                alert.accept()
-                print("첫 번째 알럿 확인 완료")
-            except:
-                print("첫 번째 알럿이 없습니다.")
+            # 첫 번째 알럿 (저장 확인창)
+            result["confirm_message"] = self.accept_alert(Config.SAVE_CONFIRM_TIMEOUT)
+            if result["confirm_message"] is None:
+                result["error"] = "저장 확인창이 나타나지 않았습니다."
+            elif not any(message in result["confirm_message"] for message in Config.SAVE_CONFIRM_MESSAGES):
+                # 입력값 검증 알럿 등은 저장 요청 전에 나타나므로 전송되지 않은 것으로 처리
+                result["error"] = f"저장 확인창 대신 다른 알럿이 나타났습니다: {result['confirm_message']}"
+            else:
+                print(f"첫 번째 알럿 확인 완료: {result['confirm_message']}")
+                result["submitted"] = True
                 
-            # 두 번째 알럿 확인
-            time.sleep(random.uniform(1, 2))
-            try:
-                alert = self.driver.switch_to.alert
-                alert.accept()
-                print("두 번째 알럿 확인 완료")
-            except:
-                print("두 번째 알럿이 없습니다.")
+                # 두 번째 알럿 (저장 결과)
+                result["result_message"] = self.accept_alert(Config.SAVE_RESULT_TIMEOUT)
+                if result["result_message"] is not None:
+                    print(f"두 번째 알럿 확인 완료: {result['result_message']}")
                 
-            print("영농일지 저장 완료!")
+                expected_message = result["result_message"] is None or any(
+                    message in result["result_message"] for message in Config.SAVE_SUCCESS_MESSAGES
+                )
+                if not expected_message:
+                    result["error"] = f"예상하지 못한 저장 결과: {result['result_message']}"
+                else:
+                    # 저장에 성공하면 페이지가 새로 로드되어 폼이 비워짐
+                    result["form_reset"] = self.wait_for_form_reset(Config.SAVE_RESULT_TIMEOUT)
+                    if result["form_reset"]:
+                        result["success"] = True
+                    else:
+                        result["error"] = "저장 후에도 입력 내용이 그대로 남아 있습니다."
             
         except Exception as e:
             print(f"영농일지 저장 중 오류 발생: {e}")
-            raise
+            if not result["submitted"]:
+                raise
+            result["error"] = str(e)
+        
+        result["elapsed"] = time.time() - started
+        if result["success"]:
+            print(f"영농일지 저장 완료! ({result['elapsed']:.2f}초)")
+        else:
+            print(f"❌ 영농일지 저장 실패 ({result['elapsed']:.2f}초): {result['error']}")
+        return result
+    
+    def check_save_result(self, save_result):
+        """저장 결과를 확인합니다.
+
+        저장 요청 전에 실패했으면 예외를 발생시켜 복구 경로에서 다시 등록하게 하고,
+        저장 요청이 이미 전송된 뒤의 예상하지 못한 결과는 중복 등록을 막기 위해 다시 저장하지 않습니다.
+
+        Returns:
+            str: 'saved' (저장 확인) 또는 'unconfirmed' (전송되었지만 저장 확인 불가)
+        """
+        if save_result["success"]:
+            return 'saved'
+        if not save_result["submitted"]:
+            raise Exception(f"영농일지 저장 실패: {save_result['error']}")
+        return 'unconfirmed'
+
+    def log_unconfirmed_save(self, label, save_result):
+        """저장 요청은 전송되었지만 결과를 확인하지 못한 주차를 기록합니다.
+
+        시작일 자동 업데이트(get_last_success_date)가 이 줄을 완료로 읽지 않도록 '등록 완료' 문구를 쓰지 않습니다.
+        """
+        self.log_message(f"⚠️ {label} 영농일지 저장 확인 불가: {save_result['error']} (중복 등록을 막기 위해 다시 저장하지 않음)")
             
-    def process_single_diary(self, date, task_step, is_first=False):
+    def process_single_diary(self, date, task_step, is_first=False, recovery_attempt=0):
         """단일 영농일지를 처리합니다."""
         try:
             print(f"\n=== {date} {task_step} 영농일지 등록 시작 ===")
@@ -1420,9 +1864,11 @@ class AgrionMacro:
                         print("❌ 최대 재시도 횟수를 초과했습니다. 저장을 진행합니다.")
             
             # 저장
-            self.save_diary()
-            
-            print(f"=== {date} {task_step} 영농일지 등록 완료 ===\n")
+            save_result = self.save_diary()
+            if self.check_save_result(save_result) == 'saved':
+                print(f"=== {date} {task_step} 영농일지 등록 완료 ===\n")
+            else:
+                self.log_unconfirmed_save(f"{date} {task_step}", save_result)
             
             # 다음 작업을 위한 대기 (서버 감지 방지를 위해 적절한 시간)
             time.sleep(random.uniform(5, 10))
@@ -1430,9 +1876,9 @@ class AgrionMacro:
         except Exception as e:
             print(f"영농일지 등록 중 오류 발생: {e}")
             print("🔄 에러 복구 시도: 메인 페이지로 돌아가서 영농일지 등록 재시작...")
-            return self.recover_from_error(date, task_step)
+            return self.recover_from_error(date, task_step, recovery_attempt)
             
-    def process_single_diary_with_schedule(self, start_date, end_date):
+    def process_single_diary_with_schedule(self, start_date, end_date, recovery_attempt=0):
         """JSON 스케줄 데이터를 기반으로 주간 영농일지를 처리합니다."""
         try:
             print(f"\n=== {start_date} ~ {end_date} 영농일지 등록 시작 (스케줄 기반) ===")
@@ -1453,35 +1899,10 @@ class AgrionMacro:
             else:
                 print("이미 영농일지 작성 페이지에 있습니다.")
             
-            # 3. 날짜 범위 설정
-            self.set_date_range(start_date, end_date)
-            
-            # 4. 품목, 필지, 품종 선택 (항상 처음부터 시작)
-            try:
-                self.select_crop()
-                self.select_all_lands()
-                self.select_all_crops()
-            except Exception as e:
-                print(f"❌ 품목/필지/품종 선택 실패: {e}")
-                return False
-            
-            # 5. 사용 가능한 작업단계 목록 가져오기 (빠른 방식)
-            try:
-                # 페이지 안정화를 위한 대기 (단축)
-                time.sleep(1)
-                
-                # 작업단계 드롭다운이 로드될 때까지 대기
-                self.wait.until(
-                    EC.presence_of_element_located((By.ID, "selectTask"))
-                )
-                
-                available_tasks = self.get_available_task_steps()
-                
-                if not available_tasks:
-                    print("❌ 사용 가능한 작업단계를 가져올 수 없습니다.")
-                    return False
-            except Exception as e:
-                print(f"❌ 작업단계 목록 가져오기 실패: {e}")
+            # 3~5. 날짜 범위, 품목, 필지, 품종 설정 후 사용 가능한 작업단계 목록과 날씨 정보 가져오기
+            available_tasks, weather_data, bulk_filled = self.prepare_diary_form(start_date, end_date)
+            if not available_tasks:
+                print("❌ 사용 가능한 작업단계를 가져올 수 없습니다.")
                 return False
             
             # 6. 랜덤으로 작업 선택하여 매칭 시도
@@ -1494,16 +1915,7 @@ class AgrionMacro:
                 print(f"❌ '{selected_task['작업명']}'에 해당하는 작업단계를 찾을 수 없습니다.")
                 return False
             
-            # 7. 작업단계 선택
-            self.select_task_step(matched_task)
-            
-            # 8. 작업 단계별 추가 필드 처리
-            self.handle_additional_fields(matched_task)
-            
-            # 9. 날씨 정보 수집
-            weather_data = self.get_weather_data()
-            
-            # 10. 날씨를 고려한 작업 내용 생성
+            # 7. 날씨를 고려한 작업 내용 생성
             content = self.generate_weather_aware_content(
                 selected_task["작업명"], 
                 start_date, 
@@ -1519,10 +1931,10 @@ class AgrionMacro:
                     start_date
                 )
             
-            # 11. 작업 내용 입력
-            self.enter_memo_with_content(content)
+            # 8. 작업단계 선택, 작업 단계별 추가 필드 처리, 작업 내용 입력
+            self.fill_task_and_memo(matched_task, content, bulk_filled)
             
-            # 11. 저장 전 입력 항목 체크
+            # 9. 저장 전 입력 항목 체크
             print("\n=== 저장 전 입력 항목 체크 ===")
             max_retry_count = 3
             retry_count = 0
@@ -1542,16 +1954,19 @@ class AgrionMacro:
                     else:
                         print("❌ 최대 재시도 횟수를 초과했습니다. 저장을 진행합니다.")
             
-            # 12. 영농일지 저장
-            self.save_diary()
-            
-            self.log_message(f"✅ {start_date} {selected_task['작업명']} 영농일지 등록 완료!")
-            return True
+            # 10. 영농일지 저장
+            save_result = self.save_diary()
+            save_status = self.check_save_result(save_result)
+            if save_status == 'saved':
+                self.log_message(f"✅ {start_date} {selected_task['작업명']} 영농일지 등록 완료!")
+            else:
+                self.log_unconfirmed_save(f"{start_date} {selected_task['작업명']}", save_result)
+            return save_status
             
         except Exception as e:
             self.log_message(f"❌ {start_date} 영농일지 등록 중 오류 발생: {e}")
             self.log_message("🔄 에러 복구 시도: 메인 페이지로 돌아가서 영농일지 등록 재시작...")
-            return self.recover_from_error_with_schedule(start_date, end_date)
+            return self.recover_from_error_with_schedule(start_date, end_date, recovery_attempt)
             
     def process_basic_diary(self, start_date, end_date):
         """작업이 없는 주의 기본 관리 영농일지를 등록합니다."""
@@ -1566,35 +1981,10 @@ class AgrionMacro:
             else:
                 print("이미 영농일지 작성 페이지에 있습니다.")
             
-            # 2. 날짜 범위 설정
-            self.set_date_range(start_date, end_date)
-            
-            # 3. 품목, 필지, 품종 선택 (항상 처음부터 시작)
-            try:
-                self.select_crop()
-                self.select_all_lands()
-                self.select_all_crops()
-            except Exception as e:
-                print(f"❌ 품목/필지/품종 선택 실패: {e}")
-                return False
-            
-            # 4. 사용 가능한 작업단계 목록 가져오기 (빠른 방식)
-            try:
-                # 페이지 안정화를 위한 대기 (단축)
-                time.sleep(1)
-                
-                # 작업단계 드롭다운이 로드될 때까지 대기
-                self.wait.until(
-                    EC.presence_of_element_located((By.ID, "selectTask"))
-                )
-                
-                available_tasks = self.get_available_task_steps()
-                
-                if not available_tasks:
-                    print("❌ 사용 가능한 작업단계를 가져올 수 없습니다.")
-                    return False
-            except Exception as e:
-                print(f"❌ 작업단계 목록 가져오기 실패: {e}")
+            # 2~4. 날짜 범위, 품목, 필지, 품종 설정 후 사용 가능한 작업단계 목록과 날씨 정보 가져오기
+            available_tasks, weather_data, bulk_filled = self.prepare_diary_form(start_date, end_date)
+            if not available_tasks:
+                print("❌ 사용 가능한 작업단계를 가져올 수 없습니다.")
                 return False
             
             # 5. 기본 관리 작업 선택 (기타작업 또는 비료작업)
@@ -1610,22 +2000,13 @@ class AgrionMacro:
             
             print(f"선택된 기본 작업: {basic_task}")
             
-            # 6. 작업단계 선택
-            self.select_task_step(basic_task)
-            
-            # 7. 작업 단계별 추가 필드 처리
-            self.handle_additional_fields(basic_task)
-            
-            # 8. 날씨 정보 수집
-            weather_data = self.get_weather_data()
-            
-            # 9. 기본 관리 내용 생성
+            # 6. 기본 관리 내용 생성
             content = self.generate_basic_diary_content(start_date, weather_data)
             
-            # 10. 작업 내용 입력
-            self.enter_memo_with_content(content)
+            # 7. 작업단계 선택, 작업 단계별 추가 필드 처리, 작업 내용 입력
+            self.fill_task_and_memo(basic_task, content, bulk_filled)
             
-            # 11. 저장 전 입력 항목 체크
+            # 8. 저장 전 입력 항목 체크
             print("\n=== 저장 전 입력 항목 체크 ===")
             max_retry_count = 3
             retry_count = 0
@@ -1645,11 +2026,14 @@ class AgrionMacro:
                     else:
                         print("❌ 최대 재시도 횟수를 초과했습니다. 저장을 진행합니다.")
             
-            # 12. 영농일지 저장
-            self.save_diary()
-            
-            print(f"✅ {start_date} 기본 관리 영농일지 등록 완료!")
-            return True
+            # 9. 영농일지 저장
+            save_result = self.save_diary()
+            save_status = self.check_save_result(save_result)
+            if save_status == 'saved':
+                print(f"✅ {start_date} 기본 관리 영농일지 등록 완료!")
+            else:
+                self.log_unconfirmed_save(f"{start_date} 기본 관리", save_result)
+            return save_status
             
         except Exception as e:
             print(f"❌ {start_date} 기본 관리 영농일지 등록 중 오류 발생: {e}")
@@ -1757,8 +2141,12 @@ class AgrionMacro:
 
 
             
-    def recover_from_error(self, date, task_step):
-        """에러 발생 시 메인 페이지로 돌아가서 영농일지 등록을 재시작합니다."""
+    def recover_from_error(self, date, task_step, recovery_attempt=0):
+        """에러 발생 시 메인 페이지로 돌아가서 영농일지 등록을 재시작합니다. (최대 Config.MAX_RECOVERY_ATTEMPTS회)"""
+        if recovery_attempt >= Config.MAX_RECOVERY_ATTEMPTS:
+            print(f"❌ {date} {task_step} 복구 시도 {Config.MAX_RECOVERY_ATTEMPTS}회 초과, 다음 작업으로 진행합니다.")
+            return False
+        
         try:
             print("🔄 에러 복구 프로세스 시작...")
             
@@ -1812,14 +2200,18 @@ class AgrionMacro:
             
             # 3. 영농일지 등록 재시작
             print(f"🔄 {date} {task_step} 영농일지 등록 재시작...")
-            return self.process_single_diary(date, task_step, is_first=True)
+            return self.process_single_diary(date, task_step, is_first=True, recovery_attempt=recovery_attempt + 1)
             
         except Exception as e:
             print(f"❌ 에러 복구 실패: {e}")
             return False
             
-    def recover_from_error_with_schedule(self, start_date, end_date=None):
-        """스케줄 기반 에러 발생 시 메인 페이지로 돌아가서 영농일지 등록을 재시작합니다."""
+    def recover_from_error_with_schedule(self, start_date, end_date=None, recovery_attempt=0):
+        """스케줄 기반 에러 발생 시 메인 페이지로 돌아가서 영농일지 등록을 재시작합니다. (최대 Config.MAX_RECOVERY_ATTEMPTS회)"""
+        if recovery_attempt >= Config.MAX_RECOVERY_ATTEMPTS:
+            self.log_message(f"❌ {start_date} 복구 시도 {Config.MAX_RECOVERY_ATTEMPTS}회 초과, 다음 주로 진행합니다.")
+            return False
+        
         try:
             print("🔄 스케줄 기반 에러 복구 프로세스 시작...")
             
@@ -1875,10 +2267,10 @@ class AgrionMacro:
             # 3. 영농일지 등록 재시작
             if end_date:
                 print(f"🔄 {start_date} ~ {end_date} 영농일지 등록 재시작 (스케줄 기반)...")
-                return self.process_single_diary_with_schedule(start_date, end_date)
+                return self.process_single_diary_with_schedule(start_date, end_date, recovery_attempt + 1)
             else:
                 print(f"🔄 {start_date} 영농일지 등록 재시작 (스케줄 기반)...")
-                return self.process_single_diary_with_schedule(start_date, start_date)
+                return self.process_single_diary_with_schedule(start_date, start_date, recovery_attempt + 1)
             
         except Exception as e:
             print(f"❌ 스케줄 기반 에러 복구 실패: {e}")
@@ -1894,13 +2286,8 @@ class AgrionMacro:
                 EC.presence_of_element_located((By.ID, "memo"))
             )
             
-            # 기존 내용 삭제
-            memo_input.clear()
-            time.sleep(random.uniform(Config.INPUT_DELAY_MIN, Config.INPUT_DELAY_MAX))
-            
-            # 새로운 내용 입력
-            memo_input.send_keys(content)
-            time.sleep(random.uniform(Config.INPUT_DELAY_MIN, Config.INPUT_DELAY_MAX))
+            # 기존 내용을 지우고 새로운 내용 입력
+            self.type_memo(memo_input, content)
             
             print("✅ 작업 내용 입력 완료")
             
@@ -1955,7 +2342,9 @@ class AgrionMacro:
                 
                 try:
                     success = self.process_single_diary_with_schedule(week_start_str, week_end_str)
-                    if success:
+                    if success == 'unconfirmed':
+                        self.log_message(f"⚠️ {week_start_str} ~ {week_end_str} 저장 확인 불가 (다음 주로 진행)")
+                    elif success:
                         self.log_message(f"✅ {week_start_str} ~ {week_end_str} 영농일지 등록 완료")
                     else:
                         self.log_message(f"⚠️ {week_start_str} ~ {week_end_str} 해당 작업 없음 (건너뜀)")
@@ -30,10 +30,11 @@ class Config:
     GPT_MAX_TOKENS = int(os.getenv('GPT_MAX_TOKENS', '50'))  # 최대 토큰 수
     GPT_TEMPERATURE = float(os.getenv('GPT_TEMPERATURE', '0.7'))  # 창의성 수준 (0.0-1.0)
     
-    # 웹사이트 URL
-    LOGIN_URL = 'https://www.agrion.kr/portal/gc/ml/mberLoginForm.do'
-    DIARY_MAIN_URL = 'https://www.agrion.kr/portal/farm/diaryMain.do'
-    DIARY_DETAIL_URL = 'https://www.agrion.kr/portal/farm/diaryDetail.do'
+    # 웹사이트 URL (AGRION_BASE_URL로 로컬 mock 서버 등 다른 호스트 지정 가능)
+    BASE_URL = os.getenv('AGRION_BASE_URL', 'https://www.agrion.kr').rstrip('/')
+    LOGIN_URL = f'{BASE_URL}/portal/gc/ml/mberLoginForm.do'
+    DIARY_MAIN_URL = f'{BASE_URL}/portal/farm/diaryMain.do'
+    DIARY_DETAIL_URL = f'{BASE_URL}/portal/farm/diaryDetail.do'
     
     # 대기 시간 설정 (서버 안정성을 위해 증가)
     WAIT_TIME = 8  # 기본 대기 시간 (초) - 서버 안정성 향상
@@ -54,3 +55,24 @@ class Config:
     # 서버 로딩 대기 시간 (초)
     SERVER_LOAD_DELAY_MIN = 0.8  # 최소 서버 로딩 대기
     SERVER_LOAD_DELAY_MAX = 1.5  # 최대 서버 로딩 대기
+    
+    # AJAX 연쇄 로딩 대기 (품목 → 필지 → 품종 → 작업단계)
+    AJAX_WAIT_TIMEOUT = 10  # 목록 로딩 최대 대기 시간 (초)
+    AJAX_POLL_INTERVAL = 0.1  # 진행 중인 요청 확인 간격 (초)
+    
+    # 폼 입력 방식 ('bulk': 스크립트 한 번으로 일괄 입력, 'step': 항목별 입력)
+    # bulk 입력이 실패하면 자동으로 step 방식으로 다시 시도합니다.
+    FORM_FILL_MODE = os.getenv('FORM_FILL_MODE', 'bulk').lower()
+    BULK_FILL_TIMEOUT = 30  # 일괄 입력 스크립트 최대 실행 시간 (초)
+    
+    # 작업 내용 입력 방식 ('instant': 값 설정, 'chunked': 단어 단위 입력, 'human': 한 글자씩 타이핑)
+    MEMO_INPUT_MODE = os.getenv('MEMO_INPUT_MODE', 'chunked').lower()
+    MEMO_CHUNK_TIME_BUDGET = 3.0  # chunked 방식의 전체 입력 대기 시간 (초)
+    
+    # 저장 확인 대기 (알럿이 나타나는 즉시 처리)
+    SAVE_CONFIRM_TIMEOUT = 5  # 저장 확인창 최대 대기 시간 (초)
+    SAVE_RESULT_TIMEOUT = 20  # 저장 결과 알럿/페이지 초기화 최대 대기 시간 (초)
+    ALERT_POLL_INTERVAL = 0.1  # 알럿 확인 간격 (초)
+    SAVE_CONFIRM_MESSAGES = ['저장하시겠습니까', '등록하시겠습니까']  # 저장 확인창으로 판단할 첫 알럿 문구 (그 외 알럿은 입력값 검증 등)
+    SAVE_SUCCESS_MESSAGES = ['저장되었습니다', '등록되었습니다', '저장 되었습니다']  # 저장 성공으로 판단할 알럿 문구
+    MAX_RECOVERY_ATTEMPTS = 2  # 한 주차를 메인 페이지로 돌아가 다시 등록하는 최대 횟수
@@ -1,12 +1,107 @@
+import time
+import json
+import threading
 import openai
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
 from settings import Config
+from utils.llm_cache import LLMResponseCache
+from utils.llm_guard import LLMCallGuard, LLMCircuitOpen, BREAKER_STATE_LABELS
+from utils.local_diary_generator import LocalDiaryGenerator
+
+
+# GPT 시스템 프롬프트
+SYSTEM_PROMPT = "농업인 영농일지 작성. 200자 이내."
+
+# 여러 주 일괄 생성용 시스템 프롬프트 (JSON 객체 하나로 응답)
+BATCH_SYSTEM_PROMPT = (
+    "농업인 영농일지 작성. 항목마다 해당 날짜/작업/날씨에 맞는 영농일지를 200자 이내로 작성. "
+    '{"entries": [{"id": 번호, "content": "일지 내용"}]} 형식의 JSON으로만 응답.'
+)
+
+DIARY_MAX_LENGTH = 200  # 작업 내용 최대 길이 (자)
+# 로컬 생성기가 스케줄 설명 문장을 가져올 농작업 일정 데이터
+SCHEDULE_DATA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'data', 'rice_schedule_data.json')
+
+BATCH_DEADLINE_FACTOR = 3  # 일괄 요청 제한 시간 = GPT_REQUEST_TIMEOUT × 이 값 (예비 요청 없음)
+
+# 작업 단계별 기본 템플릿 (GPT 사용하지 않을 때, 100자 제한) - {crop_type}에 작물 이름이 들어갑니다.
+TASK_PROMPT_TEMPLATES = {
+    # 기본 작업
+    "씨뿌리기": "{crop_type} 씨뿌리기 작업을 진행했습니다. 토양 상태를 확인하고 적절한 깊이로 씨를 뿌렸습니다.",
+    "모내기": "{crop_type} 모내기 작업을 완료했습니다. 모의 상태가 양호하여 정식 작업을 진행했습니다.",
+    "비료주기": "{crop_type} 비료주기 작업을 실시했습니다. 작물 생육에 필요한 영양분을 공급했습니다.",
+    "농약살포": "{crop_type} 농약살포 작업을 진행했습니다. 병해충 방제를 위해 적절한 농약을 살포했습니다.",
+    "물관리": "{crop_type} 물관리 작업을 실시했습니다. 작물 생육에 적합한 수분을 유지하도록 관리했습니다.",
+    "수확": "{crop_type} 수확 작업을 완료했습니다. 적절한 시기에 수확하여 품질을 확보했습니다.",
+    
+    # 실제 웹 옵션 기반 (100자 이내로 간결하게)
+    "파종작업": "{crop_type} 파종작업을 진행했습니다. 토양 상태를 확인하고 적절한 깊이로 종자를 파종했습니다.",
+    "볍씨소독작업": "{crop_type} 볍씨소독작업을 실시했습니다. 종자 소독을 통해 병해충을 예방했습니다.",
+    "이앙작업": "{crop_type} 이앙작업을 완료했습니다. 모의 상태가 양호하여 정식 작업을 진행했습니다.",
+    "비료작업": "{crop_type} 비료작업을 실시했습니다. 작물 생육에 필요한 영양분을 공급했습니다.",
+    "방제작업": "{crop_type} 방제작업을 진행했습니다. 병해충 방제를 위해 적절한 농약을 살포했습니다.",
+    "중간물떼기": "{crop_type} 중간물떼기 작업을 실시했습니다. 작물 생육에 적합한 수분을 유지하도록 관리했습니다.",
+    "완전물떼기": "{crop_type} 완전물떼기 작업을 완료했습니다. 수확 전 적절한 시기에 물을 완전히 뗐습니다.",
+    "수확작업": "{crop_type} 수확작업을 완료했습니다. 적절한 시기에 수확하여 품질을 확보했습니다.",
+    "출하/판매작업": "{crop_type} 출하/판매작업을 진행했습니다. 수확한 작물을 정리하여 출하 준비를 완료했습니다.",
+    "건조작업": "{crop_type} 건조작업을 실시했습니다. 수확한 작물을 적절한 수분으로 건조했습니다.",
+    "병해충 피해": "{crop_type} 병해충 피해 상황을 확인했습니다. 피해 정도를 파악하고 대응 방안을 마련했습니다.",
+    "제초작업": "{crop_type} 제초작업을 진행했습니다. 잡초를 제거하여 작물 생육 환경을 개선했습니다.",
+    "논갈이(쟁기)작업": "{crop_type} 논갈이(쟁기)작업을 실시했습니다. 토양을 갈아엎어 작물 재배 환경을 준비했습니다.",
+    "치상작업": "{crop_type} 치상작업을 진행했습니다. 모를 키우기 위한 치상 작업을 완료했습니다.",
+    "로터리작업": "{crop_type} 로터리작업을 실시했습니다. 토양을 부숴서 작물 재배에 적합한 환경을 만들었습니다.",
+    "작기종료": "{crop_type} 작기종료 작업을 완료했습니다. 이번 작기의 모든 작업을 마무리했습니다.",
+    "기타작업": "{crop_type} 기타작업을 진행했습니다. 농장 관리에 필요한 추가 작업을 실시했습니다.",
+    "교육일정": "{crop_type} 교육일정에 참여했습니다. 농업 기술 향상을 위한 교육을 받았습니다.",
+    "예찰활동": "{crop_type} 예찰활동을 진행했습니다. 병해충 발생 상황을 모니터링했습니다."
+}
+
+# 작물별로 한 번만 만든 템플릿 (작물 → {작업 단계: 내용})
+_task_prompt_cache = {}
+
+
+def get_task_prompts(crop_type):
+    """작물 이름을 넣은 작업 단계별 기본 템플릿을 반환합니다. (작물별로 한 번만 생성)"""
+    task_prompts = _task_prompt_cache.get(crop_type)
+    if task_prompts is None:
+        task_prompts = {task: template.format(crop_type=crop_type) for task, template in TASK_PROMPT_TEMPLATES.items()}
+        _task_prompt_cache[crop_type] = task_prompts
+    return task_prompts
+
 
 class ContentGenerator:
-    def __init__(self):
+    def __init__(self, logger_manager=None):
         # openai.api_key 설정 제거 (OpenAI 클라이언트에서 직접 설정)
-        pass
+        self.logger_manager = logger_manager
         
-    def generate_diary_content(self, task_step, crop_type, use_gpt=True, current_date=None):
+        # GPT 호출 제한 시간/예비 요청/회로 차단기 (API가 느리거나 멈추면 기본 템플릿으로 전환)
+        self.guard = LLMCallGuard(
+            deadline=Config.GPT_REQUEST_TIMEOUT,
+            slow_call_seconds=Config.GPT_SLOW_CALL_SECONDS,
+            failure_threshold=Config.GPT_BREAKER_FAILURES,
+            cooldown_seconds=Config.GPT_BREAKER_COOLDOWN,
+            hedge=Config.GPT_HEDGE_ENABLED,
+            log=self.log,
+        )
+        
+        # 작물별 로컬 생성기 (GPT를 쓰지 않거나 쓸 수 없을 때 고정 템플릿 대신 사용)
+        self.local_generators = {}
+        self.local_lock = threading.Lock()
+        
+        # GPT 응답 캐시 (재실행/복구/재입력 때 같은 프롬프트로 API를 다시 호출하지 않음)
+        self.cache = None
+        if Config.LLM_CACHE_ENABLED:
+            self.cache = LLMResponseCache(
+                Config.LLM_CACHE_PATH,
+                max_entries=Config.LLM_CACHE_MAX_ENTRIES,
+                ttl_seconds=Config.LLM_CACHE_TTL_DAYS * 24 * 60 * 60,
+                variants=Config.LLM_CACHE_VARIANTS,
+            )
+        
+    def generate_diary_content(self, task_step, crop_type, use_gpt=True, current_date=None, weather_data=None):
         """작업 단계에 따른 영농일지 내용을 생성합니다.
         
         Args:
@@ -14,50 +109,14 @@ class ContentGenerator:
             crop_type (str): 작물 종류 (예: "벼", "감자")
             use_gpt (bool): GPT 사용 여부 (기본값: True)
             current_date (str): 현재 날짜 (예: "2024-01-01")
+            weather_data (dict): 작성 페이지 날씨 (GPT를 쓰지 않을 때 로컬 생성기에 사용)
         """
         
-        # 작업 단계별 기본 템플릿 (GPT 사용하지 않을 때, 100자 제한)
-        task_prompts = {
-            # 기본 작업
-            "씨뿌리기": f"{crop_type} 씨뿌리기 작업을 진행했습니다. 토양 상태를 확인하고 적절한 깊이로 씨를 뿌렸습니다.",
-            "모내기": f"{crop_type} 모내기 작업을 완료했습니다. 모의 상태가 양호하여 정식 작업을 진행했습니다.",
-            "비료주기": f"{crop_type} 비료주기 작업을 실시했습니다. 작물 생육에 필요한 영양분을 공급했습니다.",
-            "농약살포": f"{crop_type} 농약살포 작업을 진행했습니다. 병해충 방제를 위해 적절한 농약을 살포했습니다.",
-            "물관리": f"{crop_type} 물관리 작업을 실시했습니다. 작물 생육에 적합한 수분을 유지하도록 관리했습니다.",
-            "수확": f"{crop_type} 수확 작업을 완료했습니다. 적절한 시기에 수확하여 품질을 확보했습니다.",
-            
-            # 실제 웹 옵션 기반 (100자 이내로 간결하게)
-            "파종작업": f"{crop_type} 파종작업을 진행했습니다. 토양 상태를 확인하고 적절한 깊이로 종자를 파종했습니다.",
-            "볍씨소독작업": f"{crop_type} 볍씨소독작업을 실시했습니다. 종자 소독을 통해 병해충을 예방했습니다.",
-            "이앙작업": f"{crop_type} 이앙작업을 완료했습니다. 모의 상태가 양호하여 정식 작업을 진행했습니다.",
-            "비료작업": f"{crop_type} 비료작업을 실시했습니다. 작물 생육에 필요한 영양분을 공급했습니다.",
-            "방제작업": f"{crop_type} 방제작업을 진행했습니다. 병해충 방제를 위해 적절한 농약을 살포했습니다.",
-            "중간물떼기": f"{crop_type} 중간물떼기 작업을 실시했습니다. 작물 생육에 적합한 수분을 유지하도록 관리했습니다.",
-            "완전물떼기": f"{crop_type} 완전물떼기 작업을 완료했습니다. 수확 전 적절한 시기에 물을 완전히 뗐습니다.",
-            "수확작업": f"{crop_type} 수확작업을 완료했습니다. 적절한 시기에 수확하여 품질을 확보했습니다.",
-            "출하/판매작업": f"{crop_type} 출하/판매작업을 진행했습니다. 수확한 작물을 정리하여 출하 준비를 완료했습니다.",
-            "건조작업": f"{crop_type} 건조작업을 실시했습니다. 수확한 작물을 적절한 수분으로 건조했습니다.",
-            "병해충 피해": f"{crop_type} 병해충 피해 상황을 확인했습니다. 피해 정도를 파악하고 대응 방안을 마련했습니다.",
-            "제초작업": f"{crop_type} 제초작업을 진행했습니다. 잡초를 제거하여 작물 생육 환경을 개선했습니다.",
-            "논갈이(쟁기)작업": f"{crop_type} 논갈이(쟁기)작업을 실시했습니다. 토양을 갈아엎어 작물 재배 환경을 준비했습니다.",
-            "치상작업": f"{crop_type} 치상작업을 진행했습니다. 모를 키우기 위한 치상 작업을 완료했습니다.",
-            "로터리작업": f"{crop_type} 로터리작업을 실시했습니다. 토양을 부숴서 작물 재배에 적합한 환경을 만들었습니다.",
-            "작기종료": f"{crop_type} 작기종료 작업을 완료했습니다. 이번 작기의 모든 작업을 마무리했습니다.",
-            "기타작업": f"{crop_type} 기타작업을 진행했습니다. 농장 관리에 필요한 추가 작업을 실시했습니다.",
-            "교육일정": f"{crop_type} 교육일정에 참여했습니다. 농업 기술 향상을 위한 교육을 받았습니다.",
-            "예찰활동": f"{crop_type} 예찰활동을 진행했습니다. 병해충 발생 상황을 모니터링했습니다."
-        }
-        
-        # GPT 사용하지 않거나 API 키가 없는 경우 기본 템플릿 사용
+        # GPT 사용하지 않거나 API 키가 없는 경우 로컬 생성기/기본 템플릿 사용
         if not use_gpt or not Config.OPENAI_API_KEY:
-            print(f"기본 템플릿을 사용합니다. (GPT 사용: {use_gpt}, API 키: {'있음' if Config.OPENAI_API_KEY else '없음'})")
-            content = task_prompts.get(task_step, f"{crop_type} {task_step} 작업을 진행했습니다.")
-            
-            # 100자로 제한
-            if len(content) > 200:
-                content = content[:197] + "..."
-            
-            print(f"기본 템플릿 내용 ({len(content)}자): {content}")
+            print(f"GPT 없이 작성합니다. (GPT 사용: {use_gpt}, API 키: {'있음' if Config.OPENAI_API_KEY else '없음'})")
+            content = self.fallback_content(task_step, crop_type, current_date, weather_data)
+            print(f"작성 내용 ({len(content)}자): {content}")
             return content
         
         # GPT를 사용하여 더 상세한 내용 생성 (토큰 비용 최소화)
@@ -65,22 +124,29 @@ class ContentGenerator:
             print(f"ChatGPT API를 사용하여 '{task_step}' 작업 내용을 생성합니다...")
             
             # 날짜 정보가 있으면 프롬프트에 포함
-            if current_date:
-                prompt = f"{current_date} {crop_type} {task_step} 영농인에 대입하여 작성. 작업 영농일지 200자 이내로 작성. 날짜를 정확히 사용하세요."
-            else:
-                prompt = f"{crop_type} {task_step} 영농인에 대입하여 작성. 작업 영농일지 200자 이내로 작성"
+            prompt = self.build_prompt(task_step, crop_type, current_date)
+            
+            # 같은 프롬프트로 생성한 내용이 캐시에 있으면 API 호출 없이 사용
+            cache_prompt = f"{SYSTEM_PROMPT}\n{prompt}"
+            if self.cache:
+                cached_content = self.cache.get(Config.GPT_MODEL, cache_prompt, Config.GPT_TEMPERATURE, crop_type)
+                if cached_content:
+                    print(f"💾 캐시된 GPT 내용 사용 ({len(cached_content)}자): {cached_content}")
+                    return cached_content
             
-            # OpenAI API 호출 (Config 설정 사용)
+            # OpenAI API 호출 (Config 설정 사용, 제한 시간/회로 차단기 적용)
+            started = time.perf_counter()
             openai.api_key = Config.OPENAI_API_KEY
-            response = openai.ChatCompletion.create(
+            response = self.guard.call(lambda: openai.ChatCompletion.create(
                 model=Config.GPT_MODEL,
                 messages=[
-                    {"role": "system", "content": "농업인 영농일지 작성. 200자 이내."},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=Config.GPT_MAX_TOKENS,
-                temperature=Config.GPT_TEMPERATURE
-            )
+                temperature=Config.GPT_TEMPERATURE,
+                request_timeout=Config.GPT_REQUEST_TIMEOUT
+            ))
             
             # GPT가 생성한 내용 반환 (200자 제한)
             generated_content = response.choices[0].message.content.strip()
@@ -89,11 +155,226 @@ class ContentGenerator:
             if len(generated_content) > 200:
                 generated_content = generated_content[:197] + "..."
             
+            if self.cache:
+                self.cache.put(
+                    Config.GPT_MODEL, cache_prompt, Config.GPT_TEMPERATURE, crop_type,
+                    generated_content, time.perf_counter() - started,
+                )
+            
             print(f"GPT가 생성한 내용 ({len(generated_content)}자): {generated_content}")
             return generated_content
             
+        except LLMCircuitOpen as e:
+            print(f"⚡ {e} - GPT 없이 작성합니다.")
+            return self.fallback_content(task_step, crop_type, current_date, weather_data)
         except Exception as e:
             print(f"ChatGPT API 호출 중 오류 발생: {e}")
-            print("기본 템플릿을 사용합니다.")
-            # API 오류 시 기본 내용 반환
-            return task_prompts.get(task_step, f"{crop_type} {task_step} 작업을 진행했습니다.")
+            print("GPT 없이 작성합니다.")
+            # API 오류 시 로컬 생성기/기본 템플릿 내용 반환
+            return self.fallback_content(task_step, crop_type, current_date, weather_data)
+    
+    def get_local_generator(self, crop_type):
+        """작물별 로컬 생성기를 반환합니다. (처음 쓸 때 템플릿과 스케줄 설명으로 한 번만 생성)"""
+        with self.local_lock:
+            generator = self.local_generators.get(crop_type)
+            if generator is None:
+                schedule_data = None
+                try:
+                    with open(SCHEDULE_DATA_PATH, 'r', encoding='utf-8') as f:
+                        schedule_data = json.load(f)
+                except Exception as e:
+                    print(f"⚠️ 로컬 생성기용 스케줄 설명을 읽을 수 없습니다: {e}")
+                generator = LocalDiaryGenerator(crop_type, get_task_prompts(crop_type), schedule_data)
+                self.local_generators[crop_type] = generator
+            return generator
+    
+    def fallback_content(self, task_step, crop_type, current_date=None, weather_data=None):
+        """GPT 없이 작업 내용을 만듭니다. (LOCAL_GENERATOR_ENABLED면 로컬 생성기, 아니면 기본 템플릿)"""
+        if Config.LOCAL_GENERATOR_ENABLED:
+            return self.get_local_generator(crop_type).generate(task_step, current_date, weather_data)
+        content = get_task_prompts(crop_type).get(task_step, f"{crop_type} {task_step} 작업을 진행했습니다.")
+        if len(content) > DIARY_MAX_LENGTH:
+            content = content[:DIARY_MAX_LENGTH - 3] + "..."
+        return content
+    
+    def learn_accepted_content(self, content, task_step, crop_type):
+        """등록에 성공한 작업 내용을 로컬 생성기 문장 모음에 추가합니다."""
+        if Config.LOCAL_GENERATOR_ENABLED and content:
+            self.get_local_generator(crop_type).learn(content, task_step)
+    
+    def log(self, message):
+        if self.logger_manager:
+            self.logger_manager.log_message(message)
+        else:
+            print(message)
+    
+    def build_prompt(self, task_step, crop_type, current_date=None):
+        """한 주 작업 내용 생성 프롬프트 (일괄 생성 결과도 이 프롬프트 키로 캐시에 저장)"""
+        if current_date:
+            return f"{current_date} {crop_type} {task_step} 영농인에 대입하여 작성. 작업 영농일지 200자 이내로 작성. 날짜를 정확히 사용하세요."
+        return f"{crop_type} {task_step} 영농인에 대입하여 작성. 작업 영농일지 200자 이내로 작성"
+    
+    def generate_diary_contents_batch(self, entries, crop_type, use_gpt=True, batch_size=None):
+        """여러 주의 영농일지 내용을 GPT 요청 한 번에 batch_size개씩 생성합니다.
+        
+        응답 JSON을 항목별로 나눠 길이를 검사하고, 빠졌거나 너무 짧은/긴 항목만 한 주씩 다시 생성합니다.
+        캐시에 있는 항목은 요청에서 빼고, 새로 만든 내용은 한 주 생성과 같은 키로 캐시에 저장합니다.
+        
+        Args:
+            entries (list): [{"date": "2024-01-01", "task_step": "파종작업", "weather": "맑음"(선택)}, ...]
+            crop_type (str): 작물 종류
+            use_gpt (bool): GPT 사용 여부
+            batch_size (int): 요청 한 번에 생성할 주차 수 (기본값: Config.GPT_BATCH_SIZE)
+        
+        Returns:
+            list: entries와 같은 순서의 작업 내용
+        """
+        if not use_gpt or not Config.OPENAI_API_KEY:
+            return [
+                self.generate_diary_content(entry["task_step"], crop_type, use_gpt, entry.get("date"), entry.get("weather"))
+                for entry in entries
+            ]
+        
+        batch_size = max(1, batch_size or Config.GPT_BATCH_SIZE)
+        contents = [None] * len(entries)
+        
+        # 캐시에 있는 주차는 요청에서 제외
+        pending = []
+        for index, entry in enumerate(entries):
+            cache_prompt = f"{SYSTEM_PROMPT}\n{self.build_prompt(entry['task_step'], crop_type, entry.get('date'))}"
+            cached_content = self.cache.get(Config.GPT_MODEL, cache_prompt, Config.GPT_TEMPERATURE, crop_type) if self.cache else None
+            if cached_content:
+                contents[index] = cached_content
+            else:
+                pending.append(index)
+        
+        requests_made = 0
+        started = time.perf_counter()
+        for offset in range(0, len(pending), batch_size):
+            chunk = pending[offset:offset + batch_size]
+            requests_made += 1
+            try:
+                generated = self._request_batch([entries[index] for index in chunk], crop_type)
+            except LLMCircuitOpen as e:
+                # 남은 주차는 한 주씩 생성 단계에서 로컬 생성기/기본 템플릿으로 채움
+                print(f"⚡ {e} - 일괄 생성을 중단합니다.")
+                break
+            except Exception as e:
+                print(f"ChatGPT 일괄 생성 중 오류 발생 ({len(chunk)}주): {e}")
+                continue
+            
+            for position, index in enumerate(chunk):
+                content = generated.get(position)
+                if not content:
+                    continue
+                contents[index] = content
+                if self.cache:
+                    entry = entries[index]
+                    cache_prompt = f"{SYSTEM_PROMPT}\n{self.build_prompt(entry['task_step'], crop_type, entry.get('date'))}"
+                    self.cache.put(
+                        Config.GPT_MODEL, cache_prompt, Config.GPT_TEMPERATURE, crop_type,
+                        content, generated["seconds"] / len(chunk),
+                    )
+        
+        # 일괄 응답에서 빠졌거나 길이 검사를 통과하지 못한 주차만 한 주씩 다시 생성
+        retried = [index for index in range(len(entries)) if contents[index] is None]
+        for index in retried:
+            entry = entries[index]
+            contents[index] = self.generate_diary_content(
+                entry["task_step"], crop_type, use_gpt, entry.get("date"), entry.get("weather")
+            )
+        
+        print(
+            f"📦 일괄 생성 완료: {len(entries)}주 (캐시 {len(entries) - len(pending)}주, "
+            f"일괄 요청 {requests_made}회, 다시 생성 {len(retried)}주) - {time.perf_counter() - started:.1f}초"
+        )
+        return contents
+    
+    def _request_batch(self, entries, crop_type):
+        """GPT 요청 한 번으로 여러 주 작업 내용을 받아 항목 번호별로 검사합니다.
+        
+        Returns:
+            dict: {항목 번호: 길이 검사를 통과한 내용, "seconds": 요청 시간}
+        """
+        items = []
+        for position, entry in enumerate(entries):
+            item = {"id": position, "date": entry.get("date"), "task": entry["task_step"]}
+            if entry.get("weather"):
+                item["weather"] = entry["weather"]
+            items.append(item)
+        prompt = f"작물: {crop_type}\n항목: {json.dumps(items, ensure_ascii=False)}"
+        
+        print(f"ChatGPT API를 사용하여 {len(entries)}주 작업 내용을 한 번에 생성합니다...")
+        started = time.perf_counter()
+        deadline = Config.GPT_REQUEST_TIMEOUT * BATCH_DEADLINE_FACTOR
+        openai.api_key = Config.OPENAI_API_KEY
+        response = self.guard.call(lambda: openai.ChatCompletion.create(
+            model=Config.GPT_MODEL,
+            messages=[
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=Config.GPT_BATCH_TOKENS_PER_ENTRY * len(entries),
+            temperature=Config.GPT_TEMPERATURE,
+            response_format={"type": "json_object"},
+            request_timeout=deadline
+        ), deadline=deadline, slow_call_seconds=deadline, hedge=False)
+        seconds = time.perf_counter() - started
+        
+        data = json.loads(response.choices[0].message.content)
+        generated = {"seconds": seconds}
+        for item in data.get("entries", []) if isinstance(data, dict) else []:
+            if not isinstance(item, dict):
+                continue
+            position, content = item.get("id"), item.get("content")
+            if not isinstance(position, int) or not 0 <= position < len(entries) or not isinstance(content, str):
+                continue
+            content = content.strip()
+            if Config.DIARY_MIN_LENGTH <= len(content) <= DIARY_MAX_LENGTH:
+                generated[position] = content
+            else:
+                print(f"⚠️ {entries[position].get('date')} 일괄 생성 내용 길이 {len(content)}자 - 다시 생성합니다.")
+        return generated
+    
+    def get_cache_report(self):
+        """GPT 응답 캐시 적중/실패, 지연 시간 통계를 반환합니다. (캐시를 쓰지 않으면 None)"""
+        if not self.cache or not self.cache.is_available():
+            return None
+        return self.cache.get_stats()
+    
+    def print_cache_report(self, logger_manager=None):
+        """GPT 응답 캐시 통계를 로그에 남깁니다."""
+        report = self.get_cache_report()
+        if not report or not (report["hits"] or report["misses"]):
+            return
+        message = (
+            f"💾 GPT 응답 캐시: 적중 {report['hits']}회, 생성 {report['misses']}회 "
+            f"(적중률 {report['hit_rate'] * 100:.0f}%) | 캐시 조회 평균 {report['avg_hit_ms']:.1f}ms, "
+            f"API 호출 평균 {report['avg_miss_ms']:.0f}ms | 절약한 시간 약 {report['saved_seconds']:.1f}초 | "
+            f"저장 {report['entries']}건"
+        )
+        if logger_manager:
+            logger_manager.log_message(message)
+        else:
+            print(message)
+    
+    def get_guard_report(self):
+        """GPT 호출 제한 시간/예비 요청/회로 차단기 통계를 반환합니다."""
+        return self.guard.get_stats()
+    
+    def print_guard_report(self, logger_manager=None):
+        """GPT 호출 지연 시간과 회로 차단기 상태를 로그에 남깁니다."""
+        report = self.get_guard_report()
+        if not (report["calls"] or report["rejected"]):
+            return
+        message = (
+            f"⚡ GPT 호출: {report['calls']}회 (성공 {report['successes']}, 실패 {report['failures']}, "
+            f"시간 초과 {report['timeouts']}, 느린 응답 {report['slow_calls']}) | "
+            f"평균 {report['avg_seconds']:.1f}초, p50 {report['p50_seconds']:.1f}초, p95 {report['p95_seconds']:.1f}초 | "
+            f"예비 요청 {report['hedged']}회 (먼저 도착 {report['hedge_wins']}회) | "
+            f"회로 차단기 {BREAKER_STATE_LABELS[report['state']]}, 차단 {report['opened']}회, 차단 중 템플릿 사용 {report['rejected']}회"
+        )
+        if logger_manager:
+            logger_manager.log_message(message)
+        else:
+            self.log(message)
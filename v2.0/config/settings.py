@@ -49,10 +49,40 @@ class Config:
     GPT_MAX_TOKENS = int(os.getenv('GPT_MAX_TOKENS', '50'))  # 최대 토큰 수
     GPT_TEMPERATURE = float(os.getenv('GPT_TEMPERATURE', '0.7'))  # 창의성 수준 (0.0-1.0)
     
-    # 웹사이트 URL
-    LOGIN_URL = 'https://www.agrion.kr/portal/gc/ml/mberLoginForm.do'
-    DIARY_MAIN_URL = 'https://www.agrion.kr/portal/farm/diaryMain.do'
-    DIARY_DETAIL_URL = 'https://www.agrion.kr/portal/farm/diaryDetail.do'
+    # GPT 응답 캐시 (SQLite, 같은 모델/프롬프트/온도 구간/작물이면 API를 다시 호출하지 않음)
+    LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+    LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', os.path.join(os.path.expanduser('~'), '.agrion', 'llm_cache.sqlite3'))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '5000'))  # 최대 저장 응답 수 (넘으면 오래 안 쓴 것부터 삭제)
+    LLM_CACHE_TTL_DAYS = float(os.getenv('LLM_CACHE_TTL_DAYS', '30'))  # 응답 보관 기간 (일)
+    LLM_CACHE_VARIANTS = int(os.getenv('LLM_CACHE_VARIANTS', '1'))  # 프롬프트당 저장할 응답 수 (2 이상이면 채운 뒤 번갈아 사용)
+    
+    # GPT 일괄 생성 (여러 주 작업 내용을 요청 한 번에 JSON으로 받아 항목별로 나눔, 1이면 한 주씩 요청)
+    GPT_BATCH_SIZE = int(os.getenv('GPT_BATCH_SIZE', '10'))  # 요청 한 번에 생성할 주차 수
+    GPT_BATCH_TOKENS_PER_ENTRY = int(os.getenv('GPT_BATCH_TOKENS_PER_ENTRY', '300'))  # 주차당 최대 토큰 수 (JSON 포함)
+    DIARY_MIN_LENGTH = int(os.getenv('DIARY_MIN_LENGTH', '20'))  # 일괄 생성 내용 최소 길이 (자, 더 짧으면 다시 생성)
+    
+    # GPT 호출 제한 시간/예비 요청/회로 차단기 (API가 멈추거나 느려지면 cooldown 동안 기본 템플릿 사용)
+    GPT_REQUEST_TIMEOUT = float(os.getenv('GPT_REQUEST_TIMEOUT', '20'))  # 호출 하나의 최대 대기 시간 (초)
+    GPT_SLOW_CALL_SECONDS = float(os.getenv('GPT_SLOW_CALL_SECONDS', '10'))  # 이보다 오래 걸린 응답은 실패로 셈 (초)
+    GPT_HEDGE_ENABLED = os.getenv('GPT_HEDGE_ENABLED', 'false').lower() == 'true'  # p95보다 늦으면 같은 요청을 한 번 더 보냄
+    GPT_BREAKER_FAILURES = int(os.getenv('GPT_BREAKER_FAILURES', '3'))  # 차단까지 연속 실패/느린 응답 횟수
+    GPT_BREAKER_COOLDOWN = float(os.getenv('GPT_BREAKER_COOLDOWN', '120'))  # 차단 유지 시간 (초)
+    
+    # 로컬 작업 내용 생성기 (GPT를 쓰지 않거나 실패/차단됐을 때 고정 템플릿 대신 작업/계절/날씨에 맞춰 문장 조합)
+    LOCAL_GENERATOR_ENABLED = os.getenv('LOCAL_GENERATOR_ENABLED', 'true').lower() == 'true'
+    
+    # 웹사이트 URL (AGRION_BASE_URL로 로컬 mock 서버 등 다른 호스트 지정 가능)
+    BASE_URL = os.getenv('AGRION_BASE_URL', 'https://www.agrion.kr').rstrip('/')
+    LOGIN_URL = f'{BASE_URL}/portal/gc/ml/mberLoginForm.do'
+    DIARY_MAIN_URL = f'{BASE_URL}/portal/farm/diaryMain.do'
+    DIARY_DETAIL_URL = f'{BASE_URL}/portal/farm/diaryDetail.do'
+    
+    # 영농일지 작성 페이지가 호출하는 XHR 엔드포인트 (HTTP 직접 저장 엔진에서 사용)
+    DIARY_LAND_LIST_URL = f'{BASE_URL}/portal/farm/selectLandList.do'
+    DIARY_SCROP_LIST_URL = f'{BASE_URL}/portal/farm/selectScropList.do'
+    DIARY_TASK_LIST_URL = f'{BASE_URL}/portal/farm/selectTaskList.do'
+    DIARY_WEATHER_URL = f'{BASE_URL}/portal/farm/selectWeather.do'
+    DIARY_SAVE_URL = f'{BASE_URL}/portal/farm/upsertDiary.do'
     
     # 대기 시간 설정 (서버 안정성을 위해 증가)
     WAIT_TIME = 8  # 기본 대기 시간 (초) - 서버 안정성 향상
@@ -62,6 +92,61 @@ class Config:
     FAST_WAIT_TIME = 4  # 빠른 기본 대기 시간 (초)
     FAST_LONG_WAIT_TIME = 6  # 빠른 긴 대기 시간 (초)
     
+    # 조건 기반 페이지 대기 설정 (고정 대기 대신 페이지 준비 즉시 진행)
+    PAGE_READY_TIMEOUT = float(os.getenv('PAGE_READY_TIMEOUT', '15'))  # 페이지 준비 최대 대기 시간 (초)
+    PAGE_POLL_INTERVAL = 0.2  # 페이지 준비 상태 확인 간격 (초)
+    
+    # 브라우저 프로필 ('headed': 일반 브라우저, 'headless': 화면 없는 브라우저,
+    #                 'headless-lean': 화면 없음 + 이미지/폰트/미디어/분석 스크립트 차단 + eager 로딩)
+    BROWSER_PROFILE = os.getenv('BROWSER_PROFILE', 'headed').lower()
+    
+    # 브라우저 드라이버 캐시 (로컬 캐시 → PATH 순서로 찾고, 허용 시에만 네트워크에서 다운로드)
+    DRIVER_CACHE_DIR = os.getenv('DRIVER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.agrion', 'drivers'))
+    DRIVER_ALLOW_NETWORK = os.getenv('DRIVER_ALLOW_NETWORK', 'false').lower() == 'true'
+    
+    # 로그인 세션 재사용 (암호화된 쿠키를 사용자별로 저장해 재시작 시 로그인 생략)
+    SESSION_REUSE = os.getenv('SESSION_REUSE', 'true').lower() == 'true'
+    SESSION_SECRET = os.getenv('AGRION_SESSION_SECRET', '')  # 암호화 키 (비어 있으면 로그인 비밀번호 사용)
+    SESSION_STORE_DIR = os.getenv('SESSION_STORE_DIR', os.path.join(os.path.expanduser('~'), '.agrion', 'sessions'))
+    SESSION_MAX_AGE = int(os.getenv('SESSION_MAX_AGE', str(12 * 60 * 60)))  # 저장된 세션 최대 사용 기간 (초)
+    SESSION_CHECK_TIMEOUT = 5  # 복원한 세션 확인 최대 대기 시간 (초)
+    
+    # 병렬 워커 설정 (워커마다 브라우저/로그인 세션을 따로 열고 공유 큐에서 주차 묶음을 가져가 처리)
+    WORKER_COUNT = int(os.getenv('WORKER_COUNT', '2'))  # 동시에 실행할 브라우저 워커 수
+    WORKER_SHARD_WEEKS = int(os.getenv('WORKER_SHARD_WEEKS', '2'))  # 워커가 한 번에 가져갈 주차 수
+    WORKER_START_STAGGER = 3.0  # 워커 시작 간격 (초) - 로그인 요청이 한꺼번에 몰리지 않게 함 (세션은 워커별로 따로 사용)
+    
+    # 멀티탭 설정 (브라우저 하나에 작성 페이지 탭 여러 개를 열고 서버 응답을 기다리는 동안 다른 탭을 처리)
+    TAB_COUNT = int(os.getenv('TAB_COUNT', '3'))  # 동시에 작성할 탭 수
+    TAB_POLL_INTERVAL = 0.05  # 모든 탭이 서버 응답을 기다릴 때 다시 확인하기까지 쉬는 시간 (초)
+    TAB_WAIT_TIMEOUT = 20  # 탭 하나가 서버 응답(목록 로딩/저장 결과)을 기다리는 최대 시간 (초)
+    TAB_MEMO_WORKERS = 2  # 탭에 넣을 주차의 작업 내용을 미리 생성할 스레드 수
+    TAB_MEMO_TIMEOUT = float(os.getenv('TAB_MEMO_TIMEOUT', '10'))  # 탭이 작업 내용 생성을 기다리는 최대 시간 (초, 넘으면 GPT 없이 작성)
+    SAVE_SUCCESS_MESSAGES = ["저장되었습니다", "등록되었습니다", "저장 되었습니다"]  # 저장 완료 알럿 문구
+    
+    # HTTP 직접 저장 엔진 설정 (로그인만 브라우저로 하고 일지는 requests.Session으로 저장)
+    HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', '15'))  # 요청 하나의 최대 대기 시간 (초)
+    HTTP_POOL_SIZE = 4  # 연결 풀 크기
+    HTTP_RETRIES = 2  # 연결 오류/5xx 응답 재시도 횟수
+    HTTP_SUBMIT_DELAY = float(os.getenv('HTTP_SUBMIT_DELAY', '1.0'))  # 일지 저장 사이 대기 시간 (초) - 서버 부하 방지
+    TRANSIENT_SAVE_MESSAGES = ["일시적", "잠시 후"]  # 다시 시도하면 성공할 수 있는 저장 실패 문구
+    
+    # asyncio 일괄 저장 설정 (여러 주를 동시에 HTTP로 저장)
+    ASYNC_CONCURRENCY = int(os.getenv('ASYNC_CONCURRENCY', '4'))  # 동시에 처리할 주차 수
+    ASYNC_RATE_LIMIT = float(os.getenv('ASYNC_RATE_LIMIT', '5'))  # 초당 최대 HTTP 요청 수 (0이면 제한 없음)
+    ASYNC_MAX_RETRIES = 3  # 일시적 오류 재시도 횟수
+    ASYNC_BACKOFF_BASE = 0.5  # 재시도 대기 시작 값 (초, 시도마다 2배 + 무작위 흔들기)
+    ASYNC_BACKOFF_MAX = 8.0  # 재시도 대기 최대 값 (초)
+    
+    # 등록 계획 설정 (브라우저를 열기 전에 주차별 작업/추가 필드/작업 내용을 정해 파일로 저장하고 그대로 실행)
+    DIARY_PLAN_PATH = os.getenv('DIARY_PLAN_PATH', os.path.join(v2_dir, 'plan', 'diary_plan.json'))
+    
+    # 작업 내용 미리 생성 (전체 모드에서 브라우저가 앞 주차를 등록하는 동안 다음 주차 작업 내용을 백그라운드로 생성)
+    CONTENT_PREFETCH_ENABLED = os.getenv('CONTENT_PREFETCH_ENABLED', 'true').lower() == 'true'
+    CONTENT_PREFETCH_DEPTH = int(os.getenv('CONTENT_PREFETCH_DEPTH', '3'))  # 브라우저보다 앞서 생성할 최대 주차 수
+    CONTENT_PREFETCH_WORKERS = int(os.getenv('CONTENT_PREFETCH_WORKERS', '2'))  # 동시에 생성할 스레드 수
+    CONTENT_PREFETCH_TIMEOUT = float(os.getenv('CONTENT_PREFETCH_TIMEOUT', '10'))  # 주차 등록 시 생성 결과 최대 대기 시간 (초, 넘으면 기본 템플릿)
+    
     # 입력 간 딜레이 설정 (초)
     INPUT_DELAY_MIN = 0.3  # 최소 입력 딜레이
     INPUT_DELAY_MAX = 0.8  # 최대 입력 딜레이
@@ -3,19 +3,37 @@ v2.0 Core 모듈
 
 핵심 기능들을 담당하는 모듈들:
 - BrowserManager: 브라우저 드라이버 관리
+- PageWaiter: 조건 기반 페이지 대기 엔진
+- DriverResolver: 오프라인 브라우저 드라이버 캐시/탐색
+- SessionStore: 암호화된 로그인 세션(쿠키) 저장소
 - LoggerManager: 로깅 시스템
 - ScheduleProcessor: 스케줄 데이터 처리
+- TaskMatcher: 작업명 ↔ 작업단계 컴파일된 매처
+- DiaryPlanner: 브라우저 실행 전 주차별 등록 계획 생성
+- ContentPrefetcher: 다음 주차 작업 내용 백그라운드 미리 생성
 - ConfigManager: 설정 파일 관리
 """
 
 from .browser_manager import BrowserManager
+from .page_waiter import PageWaiter
+from .driver_resolver import DriverResolver
+from .session_store import SessionStore
 from .logger_manager import LoggerManager
 from .schedule_processor import ScheduleProcessor
+from .task_matcher import TaskMatcher
+from .diary_planner import DiaryPlanner
+from .content_prefetcher import ContentPrefetcher
 from .config_manager import ConfigManager
 
 __all__ = [
     'BrowserManager',
+    'PageWaiter',
+    'DriverResolver',
+    'SessionStore',
     'LoggerManager', 
     'ScheduleProcessor',
+    'TaskMatcher',
+    'DiaryPlanner',
+    'ContentPrefetcher',
     'ConfigManager'
 ]
@@ -11,25 +11,58 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.chrome import ChromeDriverManager
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'config'))
 
 from settings import Config
+from .page_waiter import PageWaiter
+from .driver_resolver import DriverResolver
+from .session_store import SessionStore
+
+
+# 브라우저 프로필별 설정
+# - headed: 화면이 보이는 일반 브라우저 (기존 동작)
+# - headless: 화면 없는 브라우저
+# - headless-lean: 화면 없음 + 이미지/폰트/미디어/외부 분석 스크립트 차단 + eager 페이지 로딩
+BROWSER_PROFILES = {
+    'headed': {'headless': False, 'block_resources': False, 'page_load_strategy': 'normal'},
+    'headless': {'headless': True, 'block_resources': False, 'page_load_strategy': 'normal'},
+    'headless-lean': {'headless': True, 'block_resources': True, 'page_load_strategy': 'eager'},
+}
+
+# headless-lean 프로필에서 차단할 요청 URL 패턴 (Chrome CDP Network.setBlockedURLs 형식)
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3', '*.ogg', '*.avi',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*facebook.net*', '*wcs.naver.net*', '*analytics.naver.com*', '*hotjar.com*',
+]
 
 
 class BrowserManager:
     """브라우저 드라이버 관리 및 기본 웹 네비게이션을 담당하는 클래스"""
     
-    def __init__(self, logger_manager=None):
+    def __init__(self, logger_manager=None, profile=None, register_signals=True, session_key=None):
         self.driver = None
         self.wait = None
+        self.page_waiter = None
         self.logger_manager = logger_manager
+        self.profile_name = profile or Config.BROWSER_PROFILE
+        if self.profile_name not in BROWSER_PROFILES:
+            print(f"⚠️ 알 수 없는 브라우저 프로필 '{self.profile_name}', headed 프로필을 사용합니다.")
+            self.profile_name = 'headed'
+        self.profile = BROWSER_PROFILES[self.profile_name]
+        self.page_load_timings = {}  # 페이지별 로드 시간 목록 (프로필 성능 비교용)
+        self.driver_resolver = DriverResolver()
+        # 병렬 워커는 session_key로 세션 파일을 나눠 다른 워커와 서버 세션(폼 상태)을 공유하지 않음
+        self.session_store = SessionStore(session_key=session_key)
         self.is_cleanup_done = False
         self.setup_driver()
-        self.setup_signal_handlers()
+        # 시그널 핸들러는 메인 스레드에서만 등록할 수 있으므로 병렬 워커는 코디네이터가 정리를 담당
+        if register_signals:
+            self.setup_signal_handlers()
     
     def setup_signal_handlers(self):
         """시그널 핸들러를 설정하여 프로그램 중단 시 로그를 안전하게 저장합니다."""
@@ -59,6 +92,7 @@ class BrowserManager:
         
         self.is_cleanup_done = True
         print("\n🔄 리소스 정리 중...")
+        self.print_page_load_report()
         
         try:
             # 로그 파일 정리
@@ -97,13 +131,17 @@ class BrowserManager:
         """브라우저 드라이버를 설정합니다. Firefox를 우선 사용합니다."""
         self.driver = None
         self.wait = None
+        self.page_waiter = None
         
-        # Firefox 먼저 시도 (더 안정적)
-        if self._try_firefox():
-            return
+        print(f"🧭 브라우저 프로필: {self.profile_name}")
         
-        # Firefox 실패 시 Chrome 시도
-        if self._try_chrome():
+        # Firefox 먼저 시도 (더 안정적), 실패 시 Chrome 시도
+        if self._try_firefox() or self._try_chrome():
+            # eager 로딩에서는 DOM 구성이 끝난 시점(interactive)부터 페이지 준비로 인정
+            if self.profile['page_load_strategy'] == 'eager':
+                self.page_waiter = PageWaiter(self.driver, ready_states=("interactive", "complete"))
+            else:
+                self.page_waiter = PageWaiter(self.driver)
             return
         
         # 모든 브라우저 실패 시 오류 발생
@@ -114,29 +152,56 @@ class BrowserManager:
         try:
             print("Chrome 드라이버 설정 시도 중...")
             chrome_options = ChromeOptions()
-            # chrome_options.add_argument('--headless')  # 헤드리스 모드 (필요시 주석 해제)
+            chrome_options.page_load_strategy = self.profile['page_load_strategy']
+            if self.profile['headless']:
+                chrome_options.add_argument('--headless=new')
             chrome_options.add_argument('--no-sandbox')
             chrome_options.add_argument('--disable-dev-shm-usage')
             chrome_options.add_argument('--disable-gpu')
             chrome_options.add_argument('--window-size=1920,1080')
             chrome_options.add_argument('--disable-extensions')
             chrome_options.add_argument('--disable-plugins')
-            chrome_options.add_argument('--disable-images')
             chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+            if self.profile['block_resources']:
+                # --disable-images는 최신 Chrome에서 동작하지 않으므로 콘텐츠 설정으로 이미지 차단
+                chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+                chrome_options.add_argument('--mute-audio')
+                chrome_options.add_experimental_option('prefs', {
+                    'profile.managed_default_content_settings.images': 2,
+                })
             
+            resolved = self.driver_resolver.resolve('chrome')
             try:
-                # ChromeDriverManager 사용
-                service = ChromeService(ChromeDriverManager().install())
+                # 로컬 캐시/PATH에서 찾은 드라이버 사용
+                if not resolved:
+                    raise Exception("로컬 chromedriver 없음")
+                service = ChromeService(resolved["path"])
                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
             except Exception as e1:
-                print(f"ChromeDriverManager 실패: {e1}")
-                # 시스템 Chrome 드라이버 사용 시도
+                print(f"로컬 chromedriver 사용 실패: {e1}")
+                if not Config.DRIVER_ALLOW_NETWORK:
+                    # Selenium 기본 드라이버 탐색(Selenium Manager)은 네트워크에서 드라이버를 내려받으므로 허용된 경우에만 사용
+                    if resolved:
+                        raise
+                    raise Exception(
+                        f"드라이버 캐시 없음: {Config.DRIVER_CACHE_DIR} 또는 PATH에 chromedriver를 준비하거나 "
+                        f"DRIVER_ALLOW_NETWORK=true로 설정하세요"
+                    )
+                # Selenium 기본 드라이버 탐색 사용 시도
                 try:
                     self.driver = webdriver.Chrome(options=chrome_options)
                 except Exception as e2:
                     print(f"시스템 Chrome 드라이버 실패: {e2}")
                     raise Exception(f"Chrome 드라이버 설정 실패: {e1}, {e2}")
             
+            if self.profile['block_resources']:
+                # 폰트/미디어/외부 분석 스크립트는 CDP 요청 차단으로 처리
+                try:
+                    self.driver.execute_cdp_cmd('Network.enable', {})
+                    self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+                except Exception as cdp_error:
+                    print(f"⚠️ CDP 요청 차단 설정 실패: {cdp_error}")
+            
             self.wait = WebDriverWait(self.driver, 10)
             print("✅ Chrome 드라이버 설정 완료!")
             return True
@@ -147,20 +212,40 @@ class BrowserManager:
     
     def _try_firefox(self):
         """Firefox 드라이버 설정을 시도합니다."""
+        resolved = None
         try:
             print("Firefox 드라이버 설정 시도 중...")
             firefox_options = FirefoxOptions()
-            # firefox_options.add_argument('--headless')  # 헤드리스 모드 (필요시 주석 해제)
+            firefox_options.page_load_strategy = self.profile['page_load_strategy']
+            if self.profile['headless']:
+                firefox_options.add_argument('-headless')
+            if self.profile['block_resources']:
+                # Firefox는 CDP 요청 차단이 없으므로 환경설정으로 이미지/폰트/미디어/추적 스크립트 차단
+                firefox_options.set_preference('permissions.default.image', 2)
+                firefox_options.set_preference('gfx.downloadable_fonts.enabled', False)
+                firefox_options.set_preference('media.autoplay.default', 5)
+                firefox_options.set_preference('media.mp4.enabled', False)
+                firefox_options.set_preference('media.webm.enabled', False)
+                firefox_options.set_preference('privacy.trackingprotection.enabled', True)
             
-            # GeckoDriverManager 사용
-            service = FirefoxService(GeckoDriverManager().install())
+            # 로컬 캐시/PATH에서 찾은 드라이버 사용
+            resolved = self.driver_resolver.resolve('firefox')
+            if not resolved:
+                raise Exception("로컬 geckodriver 없음")
+            service = FirefoxService(resolved["path"])
             self.driver = webdriver.Firefox(service=service, options=firefox_options)
             self.wait = WebDriverWait(self.driver, 10)
             print("✅ Firefox 드라이버 설정 완료!")
             return True
             
         except Exception as e:
-            print(f"GeckoDriverManager 오류: {e}")
+            print(f"로컬 geckodriver 사용 실패: {e}")
+            if not Config.DRIVER_ALLOW_NETWORK:
+                # Selenium 기본 드라이버 탐색(Selenium Manager)은 네트워크에서 드라이버를 내려받으므로 허용된 경우에만 사용
+                if not resolved:
+                    print(f"❌ 드라이버 캐시 없음: {Config.DRIVER_CACHE_DIR} 또는 PATH에 geckodriver를 준비하거나 "
+                          f"DRIVER_ALLOW_NETWORK=true로 설정하세요")
+                return False
             print("시스템 Firefox 드라이버 사용 시도...")
             try:
                 # 시스템에 설치된 Firefox 드라이버 사용
@@ -172,18 +257,70 @@ class BrowserManager:
                 print(f"시스템 Firefox 드라이버 오류: {e2}")
                 return False
     
+    def restore_session(self):
+        """저장된 로그인 쿠키를 복원하고, 영농일지 메인 페이지 요청 한 번으로 세션이 유효한지 확인합니다.
+
+        Returns:
+            bool: 세션이 유효해 로그인을 건너뛸 수 있으면 True
+        """
+        cookies = self.session_store.load()
+        if not cookies:
+            return False
+        
+        print("🔐 저장된 로그인 세션 복원 시도 중...")
+        started = time.perf_counter()
+        try:
+            # 쿠키는 같은 도메인의 페이지에서만 추가할 수 있으므로 가벼운 페이지를 먼저 연다
+            self.driver.get(f"{Config.BASE_URL}/robots.txt")
+            for cookie in cookies:
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    # 도메인/SameSite 값이 맞지 않으면 이름과 값만으로 다시 시도
+                    self.driver.add_cookie({"name": cookie["name"], "value": cookie["value"], "path": cookie.get("path", "/")})
+            
+            self.driver.get(Config.DIARY_MAIN_URL)
+            # 세션이 만료되면 로그인 폼으로 이동하므로 메인 페이지/로그인 폼 중 먼저 나타나는 쪽으로 바로 판단
+            report = self.page_waiter.wait_for_first(
+                "로그인 세션 확인",
+                {
+                    "로그인 폼": ((By.ID, "memberId"), None),
+                    "영농일지 메인 페이지": ((By.CSS_SELECTOR, "a[href*='goView'][href*='diaryMain']"), "diaryMain.do"),
+                },
+                timeout=Config.SESSION_CHECK_TIMEOUT,
+            )
+        except Exception as e:
+            print(f"⚠️ 로그인 세션 복원 중 오류 발생: {e}")
+            report = {"matched": None}
+        
+        if report["matched"] == "영농일지 메인 페이지":
+            print(f"🔓 저장된 로그인 세션으로 로그인 생략 ({time.perf_counter() - started:.2f}초)")
+            return True
+        
+        print("⚠️ 저장된 로그인 세션이 만료되었습니다. 다시 로그인합니다.")
+        self.session_store.clear()
+        try:
+            self.driver.delete_all_cookies()
+        except Exception:
+            pass
+        return False
+    
     def login(self):
-        """농업ON 사이트에 로그인합니다."""
+        """농업ON 사이트에 로그인합니다. (저장된 세션이 유효하면 로그인 생략)"""
+        if self.restore_session():
+            return
+        
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 print(f"로그인 시도 중... (시도 {attempt + 1}/{max_retries})")
                 print("로그인 페이지로 이동 중...")
+                started = time.perf_counter()
                 self.driver.get(Config.LOGIN_URL)
-                time.sleep(Config.FAST_WAIT_TIME)
                 
-                # 페이지 로딩 확인
-                self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                # 페이지 로딩 확인 (로그인 폼이 나타나는 즉시 진행)
+                self.require_ready(self.page_waiter.wait_for_page("로그인 페이지", locator=(By.ID, "memberId")))
+                self._record_page_load("로그인 페이지", started)
                 
                 # 아이디 입력
                 username_input = self.wait.until(
@@ -205,8 +342,14 @@ class BrowserManager:
                 login_button = self.driver.find_element(By.CSS_SELECTOR, "div.btnCon > button.login")
                 login_button.click()
                 
-                time.sleep(Config.FAST_LONG_WAIT_TIME)
+                # 로그인 후 리다이렉트 확인
+                report = self.page_waiter.wait_for_login_redirect()
+                if not report["ready"]:
+                    raise Exception("로그인 후 페이지 이동이 확인되지 않았습니다.")
                 print("로그인 완료!")
+                
+                # 다음 실행/재시작 때 로그인을 생략할 수 있도록 세션 쿠키 저장
+                self.session_store.save(self.driver.get_cookies())
                 return
                 
             except Exception as e:
@@ -220,14 +363,23 @@ class BrowserManager:
     
     def navigate_to_diary_main(self):
         """영농일지 메인 페이지로 이동합니다."""
+        # 세션 복원 확인으로 이미 메인 페이지에 있으면 다시 불러오지 않음
+        if "diaryMain.do" in self.driver.current_url and self.driver.find_elements(
+            By.CSS_SELECTOR, "a[href*='goView'][href*='diaryMain']"
+        ):
+            print("이미 영농일지 메인 페이지에 있습니다.")
+            return
+        
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 print(f"영농일지 메인 페이지로 이동 중... (시도 {attempt + 1}/{max_retries})")
+                started = time.perf_counter()
                 self.driver.get(Config.DIARY_MAIN_URL)
-                time.sleep(Config.FAST_WAIT_TIME)
                 
                 # 페이지 로딩 확인
+                self.require_ready(self.wait_for_diary_main())
+                self._record_page_load("영농일지 메인 페이지", started)
                 self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
                 print("영농일지 메인 페이지 이동 완료!")
                 return
@@ -250,9 +402,11 @@ class BrowserManager:
             diary_link = self.wait.until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "div.action_box > a[href*='goView'][href*='diaryMain']"))
             )
+            started = time.perf_counter()
             diary_link.click()
             
-            time.sleep(Config.FAST_WAIT_TIME)
+            self.require_ready(self.wait_for_diary_detail())
+            self._record_page_load("영농일지 작성 페이지", started)
             print("영농일지 작성 페이지 이동 완료!")
             
         except Exception as e:
@@ -261,7 +415,7 @@ class BrowserManager:
             try:
                 print("링크 클릭 실패, 메인 페이지로 이동...")
                 self.driver.get(Config.DIARY_MAIN_URL)
-                time.sleep(Config.FAST_WAIT_TIME)
+                self.require_ready(self.wait_for_diary_main())
                 print("메인 페이지로 이동 완료!")
             except Exception as fallback_error:
                 print(f"메인 페이지 이동도 실패: {fallback_error}")
@@ -271,14 +425,66 @@ class BrowserManager:
         """영농일지 상세 등록 페이지로 이동합니다."""
         try:
             print("영농일지 상세 등록 페이지로 이동 중...")
+            started = time.perf_counter()
             self.driver.get(Config.DIARY_DETAIL_URL)
-            time.sleep(Config.FAST_WAIT_TIME)
+            self.require_ready(self.wait_for_diary_detail())
+            self._record_page_load("영농일지 작성 페이지", started)
             print("영농일지 상세 등록 페이지 이동 완료!")
             
         except Exception as e:
             print(f"영농일지 상세 등록 페이지 이동 중 오류 발생: {e}")
             raise
     
+    def wait_for_diary_main(self):
+        """영농일지 메인 페이지의 등록 링크가 나타날 때까지 대기합니다."""
+        return self.page_waiter.wait_for_page(
+            "영농일지 메인 페이지",
+            locator=(By.CSS_SELECTOR, "a[href*='goView'][href*='diaryMain']"),
+            url_contains="diaryMain.do",
+        )
+    
+    def wait_for_diary_detail(self):
+        """영농일지 작성 페이지의 날짜 입력란이 나타날 때까지 대기합니다."""
+        return self.page_waiter.wait_for_page(
+            "영농일지 작성 페이지",
+            locator=(By.ID, "now_date_s"),
+            url_contains="diaryDetail.do",
+        )
+    
+    def require_ready(self, report):
+        """대기 보고서가 시간 초과면 예외를 발생시킵니다. (호출한 쪽의 재시도/대체 경로로 넘김)"""
+        if not report["ready"]:
+            raise Exception(f"{report['label']} 준비 대기 시간 초과: {', '.join(report['pending'])}")
+        return report
+    
+    def _record_page_load(self, label, started):
+        """이동 시작부터 페이지 준비 완료까지 걸린 시간을 기록합니다."""
+        self.page_load_timings.setdefault(label, []).append(time.perf_counter() - started)
+    
+    def get_page_load_report(self):
+        """현재 프로필의 페이지별 로드 시간 통계를 반환합니다.
+
+        Returns:
+            dict: {"profile": 프로필 이름, "pages": {페이지: {"count", "avg", "max"}}}
+        """
+        pages = {}
+        for label, timings in self.page_load_timings.items():
+            pages[label] = {
+                "count": len(timings),
+                "avg": sum(timings) / len(timings),
+                "max": max(timings),
+            }
+        return {"profile": self.profile_name, "pages": pages}
+    
+    def print_page_load_report(self):
+        """현재 프로필의 페이지별 로드 시간을 출력합니다."""
+        report = self.get_page_load_report()
+        if not report["pages"]:
+            return
+        print(f"\n📊 페이지 로드 시간 (프로필: {report['profile']})")
+        for label, stats in report["pages"].items():
+            print(f"   {label}: 평균 {stats['avg']:.2f}초, 최대 {stats['max']:.2f}초 ({stats['count']}회)")
+    
     def get_driver(self):
         """드라이버 인스턴스를 반환합니다."""
         return self.driver
@@ -286,3 +492,7 @@ class BrowserManager:
     def get_wait(self):
         """WebDriverWait 인스턴스를 반환합니다."""
         return self.wait
+    
+    def get_page_waiter(self):
+        """조건 기반 대기 엔진(PageWaiter) 인스턴스를 반환합니다."""
+        return self.page_waiter
@@ -0,0 +1,151 @@
+import os
+import sys
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from config.settings import Config
+from core.diary_planner import memo_task_name
+
+
+class ContentPrefetcher:
+    """등록 계획의 다음 주차 작업 내용을 브라우저 작업과 동시에 미리 생성하는 클래스
+
+    - 스레드 풀이 계획 행 순서대로 작업 내용(GPT/템플릿)을 생성하고, 결과는 크기 depth의 큐로 넘깁니다.
+    - 큐가 차면 생성을 멈추므로 브라우저보다 최대 depth주만 앞서 생성합니다. (API 호출량/세션 만료 위험 제한)
+    - take()가 timeout 안에 결과를 받지 못하면 로컬 생성기/기본 템플릿을 사용하고, 늦게 끝난 생성 결과는 GPT 캐시에 남습니다.
+    """
+
+    def __init__(self, diary_planner, depth=None, workers=None, timeout=None, logger_manager=None):
+        self.diary_planner = diary_planner
+        self.depth = max(1, depth or Config.CONTENT_PREFETCH_DEPTH)
+        self.workers = max(1, workers or Config.CONTENT_PREFETCH_WORKERS)
+        self.timeout = Config.CONTENT_PREFETCH_TIMEOUT if timeout is None else timeout
+        self.logger_manager = logger_manager
+
+        self.ready_queue = queue.Queue(maxsize=self.depth)
+        self.slots = threading.Semaphore(self.depth)  # 생성 중이거나 큐에서 기다리는 주차 수 제한
+        self.stop_event = threading.Event()
+        self.executor = None
+        self.feeder = None
+        self.stats = {
+            "ready": 0,       # 가져갈 때 이미 생성돼 있던 주차
+            "waited": 0,      # 생성이 끝나기를 기다린 주차
+            "timeouts": 0,    # 제한 시간 초과로 GPT 없이 작성한 주차
+            "failed": 0,      # 생성 오류로 GPT 없이 작성한 주차
+            "wait_seconds": 0.0,
+        }
+
+    def log(self, message):
+        if self.logger_manager:
+            self.logger_manager.log_message(message)
+        else:
+            print(message)
+
+    def start(self, plan_rows):
+        """계획 행 목록의 작업 내용 생성을 시작합니다. (이미 작업 내용이 있는 행은 그대로 넘김)"""
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='agrion-prefetch')
+        self.feeder = threading.Thread(
+            target=self._feed, args=(list(plan_rows),), name='agrion-prefetch-feeder', daemon=True,
+        )
+        self.feeder.start()
+        self.log(f"🧵 작업 내용 미리 생성 시작: {len(plan_rows)}주, 최대 {self.depth}주 앞서 생성 (스레드 {self.workers}개)")
+        return self
+
+    def _feed(self, plan_rows):
+        """계획 행 순서대로 생성 작업을 만들어 큐에 넣습니다. 앞선 주차가 depth개면 take()로 빠질 때까지 기다립니다."""
+        for row in plan_rows:
+            while not self.slots.acquire(timeout=0.2):
+                if self.stop_event.is_set():
+                    return
+            if row["memo"]:
+                future = Future()
+                future.set_result(row["memo"])
+            else:
+                try:
+                    future = self.executor.submit(self.diary_planner.generate_memo, row)
+                except RuntimeError:
+                    # close()로 스레드 풀이 종료됨
+                    return
+            while not self.stop_event.is_set():
+                try:
+                    self.ready_queue.put((row, future), timeout=0.2)
+                    break
+                except queue.Full:
+                    continue
+            if self.stop_event.is_set():
+                future.cancel()
+                return
+
+    def take(self, row):
+        """계획 행의 작업 내용을 가져옵니다. 제한 시간 안에 생성되지 않으면 GPT 없이 작성한 내용을 반환합니다."""
+        started = time.perf_counter()
+        deadline = started + self.timeout
+        future = None
+        while not self.stop_event.is_set():
+            try:
+                queued_row, queued_future = self.ready_queue.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                break
+            self.slots.release()
+            if queued_row is row:
+                future = queued_future
+                break
+            # 건너뛴 주차(순서가 어긋난 경우)의 생성 결과는 버림
+            queued_future.cancel()
+
+        if future is None:
+            return self._fallback(row, 'timeouts', "미리 생성한 작업 내용이 없습니다")
+
+        was_ready = future.done()
+        try:
+            content = future.result(timeout=max(0.0, deadline - time.perf_counter()))
+        except FutureTimeoutError:
+            return self._fallback(row, 'timeouts', f"{self.timeout:g}초 안에 생성되지 않았습니다")
+        except Exception as e:
+            return self._fallback(row, 'failed', f"생성 오류: {e}")
+
+        if not content:
+            return self._fallback(row, 'failed', "생성된 내용이 비어 있습니다")
+        waited = time.perf_counter() - started
+        self.stats["ready" if was_ready else "waited"] += 1
+        self.stats["wait_seconds"] += waited
+        if not was_ready:
+            print(f"⏳ {row['start_date']} 작업 내용 생성 대기 {waited:.2f}초")
+        return content
+
+    def _fallback(self, row, reason, message):
+        content = self.diary_planner.content_generator.fallback_content(memo_task_name(row), Config.CROP_TYPE, row["start_date"])
+        self.stats[reason] += 1
+        self.log(f"⚠️ {row['start_date']} 작업 내용 미리 생성 실패 ({message}) - GPT 없이 작성")
+        return content
+
+    def close(self):
+        """생성을 멈추고 스레드를 정리합니다. (진행 중인 API 호출은 기다리지 않음)"""
+        self.stop_event.set()
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.feeder:
+            self.feeder.join(timeout=1)
+
+    def get_report(self):
+        """미리 생성 통계를 반환합니다."""
+        taken = self.stats["ready"] + self.stats["waited"]
+        return {
+            "ready": self.stats["ready"],
+            "waited": self.stats["waited"],
+            "timeouts": self.stats["timeouts"],
+            "failed": self.stats["failed"],
+            "avg_wait_seconds": self.stats["wait_seconds"] / taken if taken else 0.0,
+        }
+
+    def print_report(self):
+        report = self.get_report()
+        self.log(
+            f"🧵 작업 내용 미리 생성: 바로 사용 {report['ready']}주, 대기 후 사용 {report['waited']}주, "
+            f"GPT 없이 작성 {report['timeouts'] + report['failed']}주 (시간 초과 {report['timeouts']}, 오류 {report['failed']}) | "
+            f"평균 대기 {report['avg_wait_seconds']:.2f}초"
+        )
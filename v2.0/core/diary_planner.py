@@ -0,0 +1,223 @@
+import os
+import sys
+import json
+import time
+import random
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'config'))
+
+# 계획 설정(DIARY_PLAN_PATH)은 v2.0 설정에만 있으므로 shared 설정 대신 config.settings 사용
+from config.settings import Config
+from additional_fields import build_additional_field_values
+
+
+# 계획 파일 형식 버전 (행 구성이 바뀌면 올려서 이전 계획 파일을 다시 만들게 함)
+PLAN_VERSION = 1
+
+# 해당 작업이 없는 주에 등록할 기본 관리 작업단계 (작성 페이지에 있으면 이 이름 그대로 선택)
+BASIC_TASK_STEP = "기타작업"
+
+
+def memo_task_name(row):
+    """계획 행의 작업 내용을 만들 작업명 (스케줄 작업은 스케줄 작업명, 기본 관리는 작업단계)
+
+    task_step은 등록할 때 실제로 선택한 작업단계로 바뀔 수 있으므로 작업 내용은 스케줄 작업명 기준으로 만듭니다.
+    """
+    return row["schedule_task"] or row["task_step"]
+
+
+class DiaryPlanner:
+    """브라우저를 열기 전에 시즌 전체의 주차별 등록 계획을 만드는 클래스
+
+    - 주차마다 스케줄 작업 선택, 예상 작업단계, 추가 필드 값, 작업 내용(GPT/템플릿)을 미리 정해 JSON 파일로 저장합니다.
+    - BrowserManager와 무관하게 동작하므로 드라이런으로 계획만 만들어 확인할 수 있습니다.
+    - 같은 기간의 계획 파일이 있으면 다시 만들지 않고 재사용하며, 등록이 끝난 주차는 다음 실행에서 건너뜁니다.
+    """
+
+    def __init__(self, schedule_processor, content_generator, logger_manager=None, plan_path=None):
+        self.schedule_processor = schedule_processor
+        self.content_generator = content_generator
+        self.logger_manager = logger_manager
+        self.plan_path = plan_path or Config.DIARY_PLAN_PATH
+
+    def log(self, message):
+        if self.logger_manager:
+            self.logger_manager.log_message(message)
+        else:
+            print(message)
+
+    def compile(self, week_ranges, generate_content=True):
+        """주차 목록으로 등록 계획을 만듭니다.
+
+        Args:
+            week_ranges (list): [(주 시작일, 주 종료일), ...]
+            generate_content (bool): 작업 내용을 미리 생성할지 여부 (False면 등록할 때 생성)
+
+        Returns:
+            dict: {"version", "created_at", "start_date", "end_date", "interval_days", "crop_type", "weeks": [행, ...]}
+        """
+        started = time.perf_counter()
+        # 일괄 생성을 쓰면 작업을 모두 정한 뒤 작업 내용을 GPT_BATCH_SIZE주씩 한 번에 생성
+        batch = generate_content and Config.GPT_BATCH_SIZE > 1
+        weeks = []
+        for index, (start_date, end_date) in enumerate(week_ranges, start=1):
+            row = self.compile_week(start_date, end_date, generate_content and not batch)
+            weeks.append(row)
+            print(f"📝 계획 {index}/{len(week_ranges)}: {start_date} ~ {end_date} → {row['task_step']}")
+        if batch:
+            self.generate_memos(weeks)
+
+        plan = {
+            "version": PLAN_VERSION,
+            "created_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "start_date": week_ranges[0][0] if week_ranges else None,
+            "end_date": week_ranges[-1][1] if week_ranges else None,
+            "interval_days": Config.DIARY_INTERVAL_DAYS,
+            "crop_type": Config.CROP_TYPE,
+            "weeks": weeks,
+        }
+        self.log(f"🗂️ 등록 계획 생성 완료: {len(weeks)}주 ({time.perf_counter() - started:.1f}초)")
+        return plan
+
+    def compile_week(self, start_date, end_date, generate_content=True):
+        """한 주의 계획 행을 만듭니다. (작업 선택은 process_single_diary_with_schedule과 같은 규칙)"""
+        matching_tasks = self.schedule_processor.find_matching_tasks_by_date(start_date)
+        if matching_tasks:
+            selected_task = random.choice(matching_tasks)
+            row = {
+                "kind": 'schedule',
+                "schedule_task": selected_task["작업명"],
+                "period": selected_task["기간"],
+                "stage": selected_task["단계"],
+                "task_step": selected_task["작업명"],
+            }
+        else:
+            row = {
+                "kind": 'basic',
+                "schedule_task": None,
+                "period": None,
+                "stage": None,
+                "task_step": BASIC_TASK_STEP,
+            }
+
+        row.update({
+            "start_date": start_date,
+            "end_date": end_date,
+            "additional_fields": build_additional_field_values(row["task_step"]),
+            "memo": None,
+            "status": 'pending',
+        })
+        if generate_content:
+            row["memo"] = self.generate_memo(row)
+        return row
+
+    def generate_memo(self, row):
+        """계획 행의 작업 내용을 생성합니다. 실패하면 None을 돌려 등록할 때 다시 생성합니다."""
+        try:
+            return self.content_generator.generate_diary_content(
+                memo_task_name(row), Config.CROP_TYPE, Config.USE_GPT, row["start_date"]
+            ) or None
+        except Exception as e:
+            print(f"⚠️ {row['start_date']} 작업 내용 미리 생성 실패: {e}")
+            return None
+
+    def generate_memos(self, rows):
+        """작업 내용이 없는 계획 행들의 작업 내용을 일괄 생성합니다. 실패하면 None으로 남겨 등록할 때 다시 생성합니다."""
+        pending = [row for row in rows if not row["memo"]]
+        if not pending:
+            return
+        entries = [{"date": row["start_date"], "task_step": memo_task_name(row)} for row in pending]
+        try:
+            contents = self.content_generator.generate_diary_contents_batch(entries, Config.CROP_TYPE, Config.USE_GPT)
+        except Exception as e:
+            print(f"⚠️ 작업 내용 일괄 생성 실패: {e}")
+            return
+        for row, content in zip(pending, contents):
+            row["memo"] = content or None
+
+    def load_or_compile(self, week_ranges, generate_content=True):
+        """같은 기간/간격/품목의 계획 파일이 있으면 불러오고, 없으면 새로 만들어 저장합니다."""
+        plan = self.load()
+        if plan and self.is_plan_for(plan, week_ranges):
+            done = sum(1 for row in plan["weeks"] if row["status"] == 'success')
+            self.log(f"🗂️ 기존 등록 계획 재사용: {self.plan_path} ({len(plan['weeks'])}주 중 {done}주 완료)")
+            # 이미 등록된 주차의 작업 내용은 로컬 생성기 문장으로 사용
+            for row in plan["weeks"]:
+                if row["status"] == 'success':
+                    self.content_generator.learn_accepted_content(row["memo"], memo_task_name(row), Config.CROP_TYPE)
+            return plan
+
+        plan = self.compile(week_ranges, generate_content)
+        self.save(plan)
+        return plan
+
+    def is_plan_for(self, plan, week_ranges):
+        """계획이 현재 설정으로 만들어졌고 처리할 주차를 모두 포함하는지 확인합니다.
+
+        시작일 자동 업데이트로 앞쪽 주차가 빠진 경우에도 같은 계획을 이어서 사용합니다.
+        """
+        if plan.get("version") != PLAN_VERSION or plan.get("crop_type") != Config.CROP_TYPE:
+            return False
+        if plan.get("interval_days") != Config.DIARY_INTERVAL_DAYS:
+            return False
+        planned = {(row["start_date"], row["end_date"]) for row in plan.get("weeks", [])}
+        return all(week in planned for week in week_ranges)
+
+    def get_pending_rows(self, plan, week_ranges):
+        """처리할 주차 중 아직 등록이 끝나지 않은 계획 행을 주차 순서대로 반환합니다."""
+        wanted = set(week_ranges)
+        return [
+            row for row in plan["weeks"]
+            if (row["start_date"], row["end_date"]) in wanted and row["status"] != 'success'
+        ]
+
+    def load(self):
+        """계획 파일을 불러옵니다. 없거나 읽을 수 없으면 None"""
+        if not os.path.exists(self.plan_path):
+            return None
+        try:
+            with open(self.plan_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 등록 계획 파일을 읽을 수 없습니다 ({e}). 새로 만듭니다.")
+            return None
+
+    def save(self, plan):
+        """계획을 파일로 저장합니다. (임시 파일에 쓴 뒤 교체해 중간에 중단돼도 파일이 깨지지 않음)"""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.plan_path)), exist_ok=True)
+            temp_path = f"{self.plan_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(plan, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.plan_path)
+            return True
+        except Exception as e:
+            print(f"⚠️ 등록 계획 저장 실패: {e}")
+            return False
+
+    def mark_week(self, plan, row, status):
+        """주차 처리 결과를 기록하고 계획 파일에 바로 반영합니다."""
+        row["status"] = status
+        if status == 'success':
+            self.content_generator.learn_accepted_content(row["memo"], memo_task_name(row), Config.CROP_TYPE)
+        self.save(plan)
+
+    def print_summary(self, plan):
+        """계획의 주차별 작업과 작업 내용을 출력합니다. (드라이런 확인용)"""
+        weeks = plan["weeks"]
+        self.log(f"\n🗂️ 등록 계획: {plan['start_date']} ~ {plan['end_date']}, {len(weeks)}주 → {self.plan_path}")
+        for row in weeks:
+            fields = ", ".join(f"{key}={value}" for key, value in row["additional_fields"].items())
+            line = f"   {row['start_date']} ~ {row['end_date']} [{row['status']}] {row['task_step']}"
+            if row["kind"] == 'basic':
+                line += " (기본 관리)"
+            if fields:
+                line += f" | {fields}"
+            self.log(line)
+            if row["memo"]:
+                self.log(f"      📝 {row['memo']}")
+        basic = sum(1 for row in weeks if row["kind"] == 'basic')
+        prepared = sum(1 for row in weeks if row["memo"])
+        self.log(f"   스케줄 작업 {len(weeks) - basic}주, 기본 관리 {basic}주, 작업 내용 준비 {prepared}/{len(weeks)}주")
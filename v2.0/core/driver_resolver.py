@@ -0,0 +1,268 @@
+import os
+import re
+import sys
+import time
+import shutil
+import subprocess
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'config'))
+
+from settings import Config
+
+
+# 브라우저별 드라이버 실행 파일 이름
+DRIVER_NAMES = {
+    'firefox': 'geckodriver',
+    'chrome': 'chromedriver',
+}
+
+# 설치된 브라우저 버전을 확인할 실행 파일 후보 (PATH 또는 절대 경로)
+BROWSER_BINARIES = {
+    'firefox': [
+        'firefox',
+        '/Applications/Firefox.app/Contents/MacOS/firefox',
+    ],
+    'chrome': [
+        'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome',
+        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    ],
+}
+
+# Windows 레지스트리에서 브라우저 버전을 읽을 위치 (실행 파일의 --version 출력이 없음)
+BROWSER_REGISTRY_KEYS = {
+    'firefox': [(r'SOFTWARE\Mozilla\Mozilla Firefox', 'CurrentVersion')],
+    'chrome': [(r'Software\Google\Chrome\BLBeacon', 'version')],
+}
+
+# geckodriver 버전별 지원 최소 Firefox 버전 (geckodriver 지원 표 기준)
+GECKODRIVER_MIN_FIREFOX = {
+    (0, 35): 115,
+    (0, 34): 115,
+    (0, 33): 102,
+    (0, 32): 102,
+    (0, 31): 91,
+    (0, 30): 78,
+}
+
+
+def _parse_version(text):
+    """문자열에서 첫 번째 버전 번호(예: 126.0.6478.126)를 찾아 정수 튜플로 반환합니다."""
+    match = re.search(r'(\d+(?:\.\d+)+)', text or '')
+    if not match:
+        return None
+    return tuple(int(part) for part in match.group(1).split('.'))
+
+
+def _format_version(version):
+    return '.'.join(str(part) for part in version) if version else '알 수 없음'
+
+
+def _run_version_command(command):
+    """`<command> --version` 출력에서 버전을 읽습니다. (네트워크 사용 없음)"""
+    try:
+        output = subprocess.run(
+            [command, '--version'], capture_output=True, text=True, timeout=10,
+        )
+        return _parse_version(output.stdout or output.stderr)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class DriverResolver:
+    """브라우저 드라이버 실행 파일을 로컬 캐시 → PATH → (허용 시) 네트워크 순서로 찾는 클래스
+
+    캐시 구조: <cache_dir>/<드라이버 이름>/<드라이버 버전>/<드라이버 이름>[.exe]
+    """
+
+    def __init__(self, cache_dir=None, allow_network=None):
+        self.cache_dir = cache_dir or Config.DRIVER_CACHE_DIR
+        self.allow_network = Config.DRIVER_ALLOW_NETWORK if allow_network is None else allow_network
+        self.history = []  # 드라이버 확인 결과 보고서 목록
+
+    def resolve(self, browser):
+        """설치된 브라우저에 맞는 드라이버 경로를 찾습니다.
+
+        Args:
+            browser (str): 'firefox' 또는 'chrome'
+
+        Returns:
+            dict: {"browser", "path", "source", "driver_version", "browser_version", "elapsed"}
+                  드라이버를 찾지 못하면 None (Selenium 기본 드라이버 탐색에 맡김)
+        """
+        started = time.perf_counter()
+        browser_version = self.get_browser_version(browser)
+
+        path, source = self._find_cached_driver(browser, browser_version), 'cache'
+        if not path:
+            path, source = self._find_path_driver(browser, browser_version), 'PATH'
+        if not path and self.allow_network:
+            path, source = self._download_driver(browser), 'network'
+
+        report = {
+            "browser": browser,
+            "path": path,
+            "source": source if path else None,
+            "driver_version": self.get_driver_version(path) if path else None,
+            "browser_version": browser_version,
+            "elapsed": time.perf_counter() - started,
+        }
+        self.history.append(report)
+
+        driver_name = DRIVER_NAMES[browser]
+        if path:
+            print(f"🔧 {driver_name} {_format_version(report['driver_version'])} 확인 완료 "
+                  f"({source}, {browser} {_format_version(browser_version)}, {report['elapsed']:.2f}초): {path}")
+            return report
+
+        hint = "" if self.allow_network else " (네트워크 다운로드는 DRIVER_ALLOW_NETWORK=true로 허용)"
+        print(f"⚠️ {driver_name}를 로컬에서 찾지 못했습니다 ({report['elapsed']:.2f}초){hint}")
+        return None
+
+    def get_browser_version(self, browser):
+        """설치된 브라우저 버전을 오프라인으로 확인합니다."""
+        for binary in BROWSER_BINARIES[browser]:
+            if os.path.isabs(binary) and not os.path.exists(binary):
+                continue
+            if not os.path.isabs(binary) and not shutil.which(binary):
+                continue
+            version = _run_version_command(binary)
+            if version:
+                return version
+        return self._get_browser_version_from_registry(browser)
+
+    def _get_browser_version_from_registry(self, browser):
+        try:
+            import winreg
+        except ImportError:
+            return None
+
+        for key_path, value_name in BROWSER_REGISTRY_KEYS[browser]:
+            for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                try:
+                    with winreg.OpenKey(root, key_path) as key:
+                        value, _ = winreg.QueryValueEx(key, value_name)
+                        version = _parse_version(value)
+                        if version:
+                            return version
+                except OSError:
+                    continue
+        return None
+
+    def get_driver_version(self, driver_path):
+        """드라이버 실행 파일의 버전을 확인합니다."""
+        return _run_version_command(driver_path)
+
+    def is_compatible(self, browser, driver_version, browser_version):
+        """드라이버 버전이 설치된 브라우저 버전과 호환되는지 확인합니다.
+
+        버전을 알 수 없으면 호환되는 것으로 간주합니다.
+        """
+        if not driver_version or not browser_version:
+            return True
+        if browser == 'chrome':
+            # chromedriver는 Chrome 메이저 버전과 같아야 함
+            return driver_version[0] == browser_version[0]
+        min_firefox = GECKODRIVER_MIN_FIREFOX.get(tuple(driver_version[:2]))
+        return min_firefox is None or browser_version[0] >= min_firefox
+
+    def _executable_name(self, browser):
+        name = DRIVER_NAMES[browser]
+        return f"{name}.exe" if os.name == 'nt' else name
+
+    def _find_cached_driver(self, browser, browser_version):
+        """캐시에 고정된 드라이버 중 브라우저와 호환되는 가장 최신 버전을 찾습니다."""
+        driver_dir = os.path.join(self.cache_dir, DRIVER_NAMES[browser])
+        if not os.path.isdir(driver_dir):
+            return None
+
+        candidates = []
+        for version_name in os.listdir(driver_dir):
+            path = os.path.join(driver_dir, version_name, self._executable_name(browser))
+            version = _parse_version(version_name)
+            if version and os.path.isfile(path) and self.is_compatible(browser, version, browser_version):
+                candidates.append((version, path))
+
+        if not candidates:
+            return None
+        return max(candidates)[1]
+
+    def _find_path_driver(self, browser, browser_version):
+        """PATH에 있는 드라이버가 브라우저와 호환되면 사용합니다."""
+        path = shutil.which(DRIVER_NAMES[browser])
+        if not path:
+            return None
+        if not self.is_compatible(browser, self.get_driver_version(path), browser_version):
+            print(f"⚠️ PATH의 {DRIVER_NAMES[browser]}가 설치된 {browser} 버전과 맞지 않습니다: {path}")
+            return None
+        return path
+
+    def _download_driver(self, browser):
+        """webdriver_manager로 드라이버를 내려받고 다음 실행을 위해 캐시에 고정합니다."""
+        try:
+            if browser == 'chrome':
+                from webdriver_manager.chrome import ChromeDriverManager
+                downloaded = ChromeDriverManager().install()
+            else:
+                from webdriver_manager.firefox import GeckoDriverManager
+                downloaded = GeckoDriverManager().install()
+        except Exception as e:
+            print(f"⚠️ {DRIVER_NAMES[browser]} 다운로드 실패: {e}")
+            return None
+
+        return self.pin(browser, downloaded) or downloaded
+
+    def pin(self, browser, driver_path):
+        """드라이버 실행 파일을 버전별 캐시 디렉토리에 복사해 고정합니다.
+
+        Returns:
+            str: 캐시에 저장된 경로 (버전을 확인할 수 없으면 None)
+        """
+        version = self.get_driver_version(driver_path)
+        if not version:
+            print(f"⚠️ 드라이버 버전을 확인할 수 없어 캐시에 저장하지 않습니다: {driver_path}")
+            return None
+
+        target_dir = os.path.join(self.cache_dir, DRIVER_NAMES[browser], _format_version(version))
+        target = os.path.join(target_dir, self._executable_name(browser))
+        try:
+            os.makedirs(target_dir, exist_ok=True)
+            shutil.copy2(driver_path, target)
+            print(f"📌 {DRIVER_NAMES[browser]} {_format_version(version)} 캐시에 저장: {target}")
+            return target
+        except OSError as e:
+            print(f"⚠️ 드라이버 캐시 저장 실패: {e}")
+            return None
+
+    def get_total_elapsed(self):
+        """지금까지 드라이버 확인에 걸린 시간의 합계를 반환합니다."""
+        return sum(report["elapsed"] for report in self.history)
+
+
+def main():
+    """드라이버 캐시 관리 도구
+
+    사용법:
+        python v2.0/core/driver_resolver.py --check                 # 브라우저/드라이버 확인
+        python v2.0/core/driver_resolver.py --pin chrome ./chromedriver   # 드라이버를 캐시에 고정
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='브라우저 드라이버 캐시 관리')
+    parser.add_argument('--check', action='store_true', help='브라우저별 드라이버 확인 결과 출력')
+    parser.add_argument('--pin', nargs=2, metavar=('BROWSER', 'DRIVER_PATH'), help='드라이버를 캐시에 고정')
+    parser.add_argument('--cache-dir', default=None, help=f'캐시 디렉토리 (기본값: {Config.DRIVER_CACHE_DIR})')
+    parser.add_argument('--allow-network', action='store_true', help='로컬에 없으면 네트워크에서 다운로드')
+    args = parser.parse_args()
+
+    resolver = DriverResolver(cache_dir=args.cache_dir, allow_network=args.allow_network or None)
+    if args.pin:
+        browser, driver_path = args.pin
+        if browser not in DRIVER_NAMES:
+            parser.error(f"BROWSER는 {', '.join(DRIVER_NAMES)} 중 하나여야 합니다.")
+        resolver.pin(browser, driver_path)
+    if args.check or not args.pin:
+        for browser in DRIVER_NAMES:
+            resolver.resolve(browser)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,40 @@
 import os
 import re
+import time
+import atexit
+import threading
+from collections import deque
 from datetime import datetime
 
 
+LOG_FLUSH_INTERVAL = 0.5                # 백그라운드 기록 주기 (초)
+LOG_FLUSH_BATCH = 200                   # 이 수만큼 메시지가 쌓이면 주기를 기다리지 않고 바로 기록
+LOG_ROTATE_BYTES = 100 * 1024 * 1024    # 로그 파일이 이 크기를 넘으면 새 파일로 로테이션 (100MB)
+
+
 class LoggerManager:
-    """로깅 시스템을 관리하는 클래스"""
+    """로깅 시스템을 관리하는 클래스
     
-    def __init__(self, log_filename=None):
+    log_message는 콘솔 출력 후 (시각, 메시지)를 큐에 넣기만 하고, 파일 기록은 백그라운드 스레드가 모아서 합니다.
+    (deque append는 잠금 없이 스레드 안전, 파일 쓰기/flush/크기 확인은 묶음마다 한 번)
+    close_log_file/flush/프로그램 종료 시에는 큐에 남은 메시지를 모두 기록한 뒤 반환합니다.
+    """
+    
+    def __init__(self, log_filename=None, suffix=None):
         self.log_file = None
         self.log_filename = log_filename
+        self.suffix = suffix  # 병렬 워커별 로그 파일 구분용 (예: "w1")
+        self.pending = deque()  # 파일에 아직 기록하지 않은 (시각, 메시지)
+        self.write_lock = threading.RLock()  # 파일 기록/로테이션/닫기 직렬화 (log_message는 잡지 않음, flush 중 시그널 핸들러가 close_log_file을 불러도 멈추지 않게 재진입 허용)
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.writer = None
         self.setup_log_file()
+        if self.log_file:
+            self.writer = threading.Thread(target=self._writer_loop, name='agrion-log-writer', daemon=True)
+            self.writer.start()
+            # 비정상 종료(처리되지 않은 예외 등)에도 큐에 남은 로그를 기록
+            atexit.register(self.close_log_file)
     
     def setup_log_file(self):
         """로그 파일을 설정합니다."""
@@ -17,7 +42,7 @@ class LoggerManager:
             if not self.log_filename:
                 # log 폴더가 없으면 생성
                 os.makedirs('log', exist_ok=True)
-                self.log_filename = f"log/diary_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+                self.log_filename = self._new_log_filename()
             
             self.log_file = open(self.log_filename, 'w', encoding='utf-8')
             print(f"📝 로그 파일 생성: {self.log_filename}")
@@ -26,27 +51,66 @@ class LoggerManager:
             print(f"❌ 로그 파일 생성 실패: {e}")
             self.log_file = None
     
+    def _new_log_filename(self):
+        """현재 시각(과 워커 구분자)으로 새 로그 파일 이름을 만듭니다."""
+        suffix = f"_{self.suffix}" if self.suffix else ""
+        return f"log/diary_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}.txt"
+    
     def log_message(self, message):
-        """메시지를 콘솔과 로그 파일에 출력합니다."""
+        """메시지를 콘솔에 출력하고 로그 파일 기록 큐에 넣습니다. (파일 기록은 백그라운드 스레드)"""
         print(message)
         if self.log_file:
+            self.pending.append((time.time(), message))
+            if len(self.pending) >= LOG_FLUSH_BATCH:
+                self.wake_event.set()
+    
+    def _writer_loop(self):
+        """LOG_FLUSH_INTERVAL마다(또는 메시지가 많이 쌓이면 바로) 큐의 메시지를 묶어 기록합니다."""
+        while not self.stop_event.is_set():
+            self.wake_event.wait(LOG_FLUSH_INTERVAL)
+            self.wake_event.clear()
+            self.flush()
+    
+    def flush(self):
+        """큐에 쌓인 메시지를 지금 파일에 기록합니다."""
+        with self.write_lock:
+            self._write_pending()
+    
+    def _write_pending(self):
+        """큐의 메시지를 한 번에 쓰고 flush합니다. (write_lock 안에서 호출)"""
+        if not self.pending or not self.log_file:
+            return
+        lines = []
+        while self.pending:
             try:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                log_entry = f"[{timestamp}] {message}\n"
-                self.log_file.write(log_entry)
-                self.log_file.flush()  # 즉시 파일에 쓰기
+                logged_at, message = self.pending.popleft()
+            except IndexError:
+                break
+            timestamp = datetime.fromtimestamp(logged_at).strftime('%Y-%m-%d %H:%M:%S')
+            lines.append(f"[{timestamp}] {message}\n")
+        batch = "".join(lines)
+        
+        try:
+            self.log_file.write(batch)
+            self.log_file.flush()
+            
+            # 로그 파일 크기 확인 (100MB 이상이면 새 파일 생성)
+            if self.log_file.tell() > LOG_ROTATE_BYTES:
+                self.rotate_log_file()
                 
-                # 로그 파일 크기 확인 (100MB 이상이면 새 파일 생성)
-                if self.log_file.tell() > 100 * 1024 * 1024:  # 100MB
-                    self.rotate_log_file()
-                    
-            except Exception as e:
-                print(f"⚠️ 로그 파일 쓰기 실패: {e}")
-                # 로그 파일이 손상된 경우 새로 생성
-                self.recreate_log_file()
+        except Exception as e:
+            print(f"⚠️ 로그 파일 쓰기 실패: {e}")
+            # 로그 파일이 손상된 경우 새로 생성하고 이번 묶음을 다시 기록
+            self.recreate_log_file()
+            try:
+                if self.log_file:
+                    self.log_file.write(batch)
+                    self.log_file.flush()
+            except Exception as retry_error:
+                print(f"⚠️ 로그 파일 다시 쓰기 실패 ({len(lines)}줄): {retry_error}")
     
     def recreate_log_file(self):
-        """로그 파일을 다시 생성합니다."""
+        """로그 파일을 다시 생성합니다. (write_lock 안에서 호출)"""
         try:
             if self.log_file:
                 self.log_file.close()
@@ -59,7 +123,7 @@ class LoggerManager:
             self.log_file = None
     
     def rotate_log_file(self):
-        """로그 파일이 너무 커지면 새 파일로 로테이션합니다."""
+        """로그 파일이 너무 커지면 새 파일로 로테이션합니다. (write_lock 안에서 호출)"""
         try:
             if self.log_file and self.log_filename:
                 self.log_file.close()
@@ -75,7 +139,7 @@ class LoggerManager:
                     print(f"📝 로그 파일이 로테이션되었습니다: {new_filename}")
                 
                 # 새 로그 파일 생성
-                self.log_filename = f"log/diary_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+                self.log_filename = self._new_log_filename()
                 self.log_file = open(self.log_filename, 'w', encoding='utf-8')
                 self.log_message("📝 새 로그 파일이 생성되었습니다.")
                 
@@ -86,13 +150,19 @@ class LoggerManager:
                 self.log_file = open(self.log_filename, 'a', encoding='utf-8')
     
     def close_log_file(self):
-        """로그 파일을 안전하게 닫습니다."""
+        """기록 스레드를 멈추고 큐에 남은 로그를 모두 기록한 뒤 로그 파일을 안전하게 닫습니다."""
+        self.stop_event.set()
+        self.wake_event.set()
+        if self.writer and self.writer is not threading.current_thread():
+            self.writer.join(timeout=5)
         try:
-            if self.log_file:
-                self.log_file.flush()
-                self.log_file.close()
-                self.log_file = None
-                print(f"✅ 로그 파일이 안전하게 저장되었습니다: {self.log_filename}")
+            with self.write_lock:
+                if self.log_file:
+                    self._write_pending()
+                    self.log_file.flush()
+                    self.log_file.close()
+                    self.log_file = None
+                    print(f"✅ 로그 파일이 안전하게 저장되었습니다: {self.log_filename}")
         except Exception as e:
             print(f"⚠️ 로그 파일 닫기 중 오류: {e}")
     
@@ -100,6 +170,7 @@ class LoggerManager:
         """로그 파일에서 마지막으로 처리된 날짜를 찾습니다."""
         try:
             print("🔍 로그에서 마지막 처리 날짜를 찾는 중...")
+            self.flush()  # 아직 기록하지 않은 메시지도 읽히도록 먼저 기록
             
             # 로그 파일들 찾기 (log 폴더에서)
             log_files = []
@@ -0,0 +1,158 @@
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'config'))
+
+from settings import Config
+
+
+class PageWaiter:
+    """고정 sleep 대신 페이지가 실제로 준비되는 즉시 반환하는 조건 기반 대기 엔진"""
+
+    def __init__(self, driver, timeout=None, poll_frequency=None, ready_states=("complete",)):
+        self.driver = driver
+        self.timeout = timeout if timeout is not None else Config.PAGE_READY_TIMEOUT
+        self.poll_frequency = poll_frequency if poll_frequency is not None else Config.PAGE_POLL_INTERVAL
+        # 페이지 준비로 인정할 document.readyState 값 (eager 로딩 시 "interactive" 포함)
+        self.ready_states = tuple(ready_states)
+        self.history = []  # 대기 결과 보고서 목록
+
+    def wait_for_page(self, label, locator=None, absent_locator=None, url_contains=None, url_excludes=None,
+                      timeout=None):
+        """페이지 준비 조건이 모두 충족될 때까지 대기하고 실제 대기 시간을 보고합니다.
+
+        Args:
+            label (str): 보고용 이름 (예: "로그인 페이지")
+            locator (tuple): 존재해야 하는 대상 요소 (예: (By.ID, "memberId"))
+            absent_locator (tuple): 사라져야 하는 요소 (예: 로그인 후 로그인 폼)
+            url_contains (str): 현재 URL에 포함되어야 하는 문자열
+            url_excludes (str): 현재 URL에 포함되면 안 되는 문자열 (로그인 후 리다이렉트 확인용)
+            timeout (float): 최대 대기 시간 (기본값: Config.PAGE_READY_TIMEOUT)
+
+        Returns:
+            dict: {"label", "ready", "waited", "timeout", "pending"} 대기 보고서
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        pending = []
+
+        def page_ready(driver):
+            pending.clear()
+            try:
+                current_url = driver.current_url
+                if url_contains and url_contains not in current_url:
+                    pending.append(f"URL에 '{url_contains}' 없음")
+                    return False
+                if url_excludes and url_excludes in current_url:
+                    pending.append(f"URL에 '{url_excludes}' 남아 있음")
+                    return False
+                if driver.execute_script("return document.readyState") not in self.ready_states:
+                    pending.append(f"document.readyState not in {self.ready_states}")
+                    return False
+                if locator and not driver.find_elements(*locator):
+                    pending.append(f"대상 요소 {locator[1]} 없음")
+                    return False
+                if absent_locator and driver.find_elements(*absent_locator):
+                    pending.append(f"요소 {absent_locator[1]} 남아 있음")
+                    return False
+                return True
+            except WebDriverException as e:
+                # 페이지 전환 도중에는 일시적인 오류가 날 수 있으므로 계속 폴링
+                pending.append(f"페이지 전환 중 ({e.__class__.__name__})")
+                return False
+
+        started = time.perf_counter()
+        ready = True
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(page_ready)
+        except TimeoutException:
+            ready = False
+        waited = time.perf_counter() - started
+
+        report = {
+            "label": label,
+            "ready": ready,
+            "waited": waited,
+            "timeout": timeout,
+            "pending": list(pending),
+        }
+        self.history.append(report)
+
+        if ready:
+            print(f"⏱️ {label} 준비 완료 ({waited:.2f}초)")
+        else:
+            print(f"⚠️ {label} 준비 대기 시간 초과 ({waited:.2f}초/{timeout}초): {', '.join(pending)}")
+        return report
+
+    def wait_for_first(self, label, candidates, timeout=None):
+        """여러 페이지 상태 중 하나가 나타나는 즉시 반환합니다. (예: 세션 확인 시 메인 페이지 또는 로그인 폼)
+
+        Args:
+            label (str): 보고용 이름
+            candidates (dict): 상태 이름 → (locator, url_contains) - url_contains는 None 가능
+            timeout (float): 최대 대기 시간 (기본값: Config.PAGE_READY_TIMEOUT)
+
+        Returns:
+            dict: wait_for_page 보고서 + "matched" (먼저 나타난 상태 이름, 시간 초과면 None)
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        matched = []
+
+        def any_ready(driver):
+            try:
+                if driver.execute_script("return document.readyState") not in self.ready_states:
+                    return False
+                current_url = driver.current_url
+                for name, (locator, url_contains) in candidates.items():
+                    if url_contains and url_contains not in current_url:
+                        continue
+                    if driver.find_elements(*locator):
+                        matched.append(name)
+                        return True
+                return False
+            except WebDriverException:
+                # 페이지 전환 중에는 일시적인 오류가 날 수 있으므로 계속 폴링
+                return False
+
+        started = time.perf_counter()
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(any_ready)
+        except TimeoutException:
+            pass
+        waited = time.perf_counter() - started
+
+        report = {
+            "label": label,
+            "ready": bool(matched),
+            "matched": matched[0] if matched else None,
+            "waited": waited,
+            "timeout": timeout,
+            "pending": [] if matched else [f"{', '.join(candidates)} 중 어느 상태도 나타나지 않음"],
+        }
+        self.history.append(report)
+
+        if matched:
+            print(f"⏱️ {label}: {matched[0]} 확인 ({waited:.2f}초)")
+        else:
+            print(f"⚠️ {label} 대기 시간 초과 ({waited:.2f}초/{timeout}초): {report['pending'][0]}")
+        return report
+
+    def wait_for_login_redirect(self, timeout=None):
+        """로그인 버튼 클릭 후 로그인 폼을 벗어날 때까지 대기합니다.
+
+        로그인 실패 시에도 URL이 바뀔 수 있으므로 로그인 폼(memberId)이 사라졌는지도 함께 확인합니다.
+        """
+        login_path = Config.LOGIN_URL.split('/')[-1]
+        return self.wait_for_page(
+            "로그인 후 리다이렉트",
+            locator=(By.TAG_NAME, "body"),
+            absent_locator=(By.ID, "memberId"),
+            url_excludes=login_path,
+            timeout=timeout,
+        )
+
+    def get_total_waited(self):
+        """지금까지 대기한 시간의 합계를 반환합니다."""
+        return sum(report["waited"] for report in self.history)
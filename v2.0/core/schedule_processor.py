@@ -1,26 +1,133 @@
 import json
 import re
 import os
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime
+
+from .task_matcher import TaskMatcher, MATCH_METHOD_LABELS
+
+
+SCHEDULE_DATA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'data', 'rice_schedule_data.json')
+
+# 기간 비교 시 앞뒤로 허용하는 여유 일수
+DEFAULT_TOLERANCE_DAYS = 15
+
+# 일 년 슬롯 수 (02-29를 포함하도록 윤년 기준)
+DAYS_IN_YEAR = 366
+
+# 월별 1일의 0부터 시작하는 연중 일차 (윤년 기준)
+_MONTH_OFFSETS = [0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335]
+_MONTH_LENGTHS = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+
+def day_of_year(month, day):
+    """월/일을 0~365 연중 일차로 변환합니다. (윤년 기준, 잘못된 날짜면 ValueError)"""
+    if not 1 <= month <= 12 or not 1 <= day <= _MONTH_LENGTHS[month - 1]:
+        raise ValueError(f"잘못된 날짜: {month:02d}-{day:02d}")
+    return _MONTH_OFFSETS[month - 1] + day - 1
+
+
+def parse_period(period_range):
+    """기간 문자열("MM-DD ~ MM-DD")을 (시작 일차, 종료 일차)로 변환합니다."""
+    start_str, end_str = period_range.split("~")
+    start_month, start_day = map(int, start_str.strip().split("-"))
+    end_month, end_day = map(int, end_str.strip().split("-"))
+    return day_of_year(start_month, start_day), day_of_year(end_month, end_day)
+
+
+def period_slots(period_range, tolerance_days):
+    """기간에 여유 일수를 더한 연중 일차 목록을 반환합니다.
+
+    종료일이 시작일보다 앞이면(예: "11-01 ~ 03-01") 해를 넘기는 기간으로 보고 연말에서 연초로 이어 붙입니다.
+    """
+    start, end = parse_period(period_range)
+    length = (end - start) % DAYS_IN_YEAR + 1 + 2 * tolerance_days
+    if length >= DAYS_IN_YEAR:
+        return range(DAYS_IN_YEAR)
+    first = start - tolerance_days
+    return [(first + offset) % DAYS_IN_YEAR for offset in range(length)]
+
+
+class ScheduleIndex:
+    """스케줄을 연중 일차(366칸)별 작업 목록으로 미리 펼쳐 둔 색인
+
+    한 번 만들면 날짜 조회는 배열 접근 한 번이며, 같은 파일/여유 일수의 색인은 인스턴스 간에 공유됩니다.
+    """
+
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, schedule_data, tolerance_days=DEFAULT_TOLERANCE_DAYS):
+        self.tolerance_days = tolerance_days
+        slots = [[] for _ in range(DAYS_IN_YEAR)]
+        for month_key, month_data in schedule_data.items():
+            for stage_key, stage_tasks in month_data.items():
+                for task in stage_tasks:
+                    entry = {
+                        "작업명": task["작업명"],
+                        "기간": task["기간"],
+                        "설명": task["설명"],
+                        "단계": stage_key
+                    }
+                    try:
+                        for slot in period_slots(task["기간"], tolerance_days):
+                            slots[slot].append(entry)
+                    except ValueError as e:
+                        print(f"기간 파싱 오류 ({task.get('작업명')}: {task.get('기간')}): {e}")
+        # 스케줄 순서를 유지한 채 읽기 전용 튜플로 고정
+        self.slots = [tuple(entries) for entries in slots]
+
+    @classmethod
+    def load(cls, data_path=SCHEDULE_DATA_PATH, tolerance_days=DEFAULT_TOLERANCE_DAYS):
+        """파일의 스케줄 데이터와 색인을 반환합니다. 파일이 바뀌지 않았으면 이전에 만든 것을 재사용합니다.
+
+        Returns:
+            tuple: (스케줄 데이터 dict, ScheduleIndex)
+        """
+        path = os.path.abspath(data_path)
+        key = (path, os.path.getmtime(path), tolerance_days)
+        with cls._cache_lock:
+            cached = cls._cache.get(key)
+            if cached is None:
+                with open(path, 'r', encoding='utf-8') as f:
+                    schedule_data = json.load(f)
+                cached = (schedule_data, cls(schedule_data, tolerance_days))
+                cls._cache[key] = cached
+            return cached
+
+    def lookup(self, month, day):
+        """월/일에 해당하는 작업 목록(튜플)을 반환합니다."""
+        return self.slots[day_of_year(month, day)]
 
 
 class ScheduleProcessor:
     """농작업 스케줄 데이터를 처리하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, tolerance_days=DEFAULT_TOLERANCE_DAYS):
         self.schedule_data = None
+        self.schedule_index = None
+        self.task_matcher = None
+        self.tolerance_days = tolerance_days
         self.load_schedule_data()
     
     def load_schedule_data(self):
-        """농작업 일정 데이터를 로드합니다."""
+        """농작업 일정 데이터를 로드하고 날짜 색인을 준비합니다. (같은 파일이면 이미 만든 색인 재사용)"""
         try:
-            data_path = os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'data', 'rice_schedule_data.json')
-            with open(data_path, 'r', encoding='utf-8') as f:
-                self.schedule_data = json.load(f)
+            self.schedule_data, self.schedule_index = ScheduleIndex.load(SCHEDULE_DATA_PATH, self.tolerance_days)
             print("✅ 농작업 일정 데이터 로드 완료")
         except Exception as e:
             print(f"❌ 농작업 일정 데이터 로드 실패: {e}")
             self.schedule_data = None
+            self.schedule_index = None
+        
+        # 스케줄 작업명으로 작업단계 매처 준비 (같은 작업명 집합이면 인스턴스 간 공유)
+        task_names = [
+            task["작업명"]
+            for month_data in (self.schedule_data or {}).values()
+            for stage_tasks in month_data.values()
+            for task in stage_tasks
+        ]
+        self.task_matcher = TaskMatcher.shared(task_names)
     
     def parse_date_to_month_day(self, date_str):
         """날짜 문자열을 월-일 형식으로 변환합니다."""
@@ -32,52 +139,34 @@ class ScheduleProcessor:
             print(f"날짜 파싱 오류: {e}")
             return None
     
-    def is_date_in_period_with_tolerance(self, selected_date, period_range, tolerance_days=15):
-        """선택된 날짜가 기간 범위에 포함되는지 확인 (+-15일 여유)"""
+    def is_date_in_period_with_tolerance(self, selected_date, period_range, tolerance_days=DEFAULT_TOLERANCE_DAYS):
+        """선택된 날짜(MM-DD)가 기간 범위에 포함되는지 확인 (+-tolerance_days일 여유, 해를 넘기는 기간 포함)"""
         try:
-            # 기간 파싱 (예: "03-01 ~ 05-10")
-            start_str, end_str = period_range.split(" ~ ")
-            start_month, start_day = map(int, start_str.split("-"))
-            end_month, end_day = map(int, end_str.split("-"))
-            
-            # 선택된 날짜 파싱
             selected_month, selected_day = map(int, selected_date.split("-"))
-            
-            # 시작일과 종료일 계산 (2025년 기준)
-            start_date = datetime(2025, start_month, start_day) - timedelta(days=tolerance_days)
-            end_date = datetime(2025, end_month, end_day) + timedelta(days=tolerance_days)
-            selected_date_obj = datetime(2025, selected_month, selected_day)
-            
-            return start_date <= selected_date_obj <= end_date
+            selected = day_of_year(selected_month, selected_day)
+            start, end = parse_period(period_range)
+            # 여유 일수만큼 앞당긴 시작일부터 원형(연말→연초)으로 떨어진 거리가 기간 길이 안에 있는지 확인
+            length = (end - start) % DAYS_IN_YEAR + 2 * tolerance_days
+            return length >= DAYS_IN_YEAR - 1 or (selected - (start - tolerance_days)) % DAYS_IN_YEAR <= length
             
         except Exception as e:
             print(f"기간 비교 오류: {e}")
             return False
     
     def find_matching_tasks_by_date(self, selected_date):
-        """선택된 날짜에 해당하는 작업들을 찾습니다."""
-        if not self.schedule_data:
+        """선택된 날짜에 해당하는 작업들을 찾습니다. (미리 만든 연중 일차 색인에서 조회)"""
+        if not self.schedule_index:
             print("❌ 농작업 일정 데이터가 없습니다.")
             return []
         
-        matching_tasks = []
-        month_day = self.parse_date_to_month_day(selected_date)
-        
-        if not month_day:
+        # "2025-03-15" → 3월 15일 (strptime 없이 바로 변환)
+        try:
+            year, month, day = map(int, selected_date.split("-"))
+            matching_tasks = [dict(task) for task in self.schedule_index.lookup(month, day)]
+        except ValueError as e:
+            print(f"날짜 파싱 오류: {e}")
             return []
         
-        # JSON 데이터에서 해당 날짜의 작업들 찾기
-        for month_key, month_data in self.schedule_data.items():
-            for stage_key, stage_tasks in month_data.items():
-                for task in stage_tasks:
-                    if self.is_date_in_period_with_tolerance(month_day, task["기간"]):
-                        matching_tasks.append({
-                            "작업명": task["작업명"],
-                            "기간": task["기간"],
-                            "설명": task["설명"],
-                            "단계": stage_key
-                        })
-        
         print(f"📅 {selected_date}에 해당하는 작업 {len(matching_tasks)}개 발견")
         for task in matching_tasks:
             print(f"  - {task['작업명']} ({task['기간']})")
@@ -132,112 +221,38 @@ class ScheduleProcessor:
             print(f"농작업 일정 파싱 실패: {e}")
             return []
     
+    def match_task(self, json_task_name, available_tasks, fallback=False):
+        """JSON 작업명과 웹페이지 작업단계를 매칭하고 신뢰도와 함께 반환합니다.
+        
+        Returns:
+            dict: {"option": 작업단계 또는 None, "confidence": 0.0~1.0, "method": 매칭 방식}
+        """
+        return self.task_matcher.match(json_task_name, available_tasks, fallback)
+    
     def match_task_with_gpt(self, json_task_name, available_tasks):
-        """GPT를 사용하여 JSON 작업명과 웹페이지 작업단계를 매칭합니다."""
+        """JSON 작업명과 웹페이지 작업단계를 매칭합니다. (GPT 없이 정확/부분/키워드 매칭)"""
         try:
-            # 간단한 매칭 로직 (GPT 없이)
-            # 정확한 매칭 먼저 시도
-            for task in available_tasks:
-                if json_task_name in task or task in json_task_name:
-                    print(f"✅ 정확한 매칭 발견: '{json_task_name}' → '{task}'")
-                    return task
-            
-            # 부분 매칭 시도
-            for task in available_tasks:
-                # 키워드 기반 매칭
-                keywords = {
-                    "논갈이": ["논갈이", "쟁기"],
-                    "비료": ["비료"],
-                    "로터리": ["로터리"],
-                    "볍씨소독": ["소독", "볍씨"],
-                    "파종": ["파종", "씨뿌리기"],
-                    "치상": ["치상"],
-                    "이앙": ["이앙", "모내기"],
-                    "방제": ["방제", "농약"],
-                    "제초": ["제초", "잡초"],
-                    "물떼기": ["물떼기"],
-                    "수확": ["수확"],
-                    "건조": ["건조"],
-                    "출하": ["출하", "판매"]
-                }
-                
-                for keyword, related_terms in keywords.items():
-                    if keyword in json_task_name:
-                        for term in related_terms:
-                            if term in task:
-                                print(f"✅ 키워드 매칭 발견: '{json_task_name}' → '{task}'")
-                                return task
+            result = self.match_task(json_task_name, available_tasks)
+            if not result["option"]:
+                print(f"⚠️ 매칭 실패: '{json_task_name}'에 해당하는 작업단계를 찾을 수 없습니다.")
+                return None
             
-            print(f"⚠️ 매칭 실패: '{json_task_name}'에 해당하는 작업단계를 찾을 수 없습니다.")
-            return None
+            label = MATCH_METHOD_LABELS[result["method"]]
+            print(f"✅ {label} 매칭 발견: '{json_task_name}' → '{result['option']}' (신뢰도 {result['confidence']:.2f})")
+            return result["option"]
             
         except Exception as e:
             print(f"❌ 작업 매칭 중 오류: {e}")
             return None
     
     def find_matching_task_step(self, schedule_task, available_tasks):
-        """일정 텍스트와 사용 가능한 작업 단계를 매칭합니다."""
+        """일정 텍스트와 사용 가능한 작업 단계를 매칭합니다. (매칭이 안 되면 유사도 → 첫 번째 옵션)"""
         try:
-            print(f"작업 단계 매칭: '{schedule_task}' -> {available_tasks}")
-            
-            # 1. 정확한 매칭 시도
-            for available_task in available_tasks:
-                if schedule_task == available_task:
-                    print(f"정확 매칭: {available_task}")
-                    return available_task
-            
-            # 2. 부분 매칭 시도 (포함 관계)
-            for available_task in available_tasks:
-                if schedule_task in available_task or available_task in schedule_task:
-                    print(f"부분 매칭: {available_task}")
-                    return available_task
-            
-            # 3. 유사도 기반 매칭 (품종에 관계없는 일반적인 키워드)
-            general_keywords = {
-                "씨뿌리기": ["파종", "종자", "소독", "씨앗"],
-                "모내기": ["이앙", "모", "심기", "정식"],
-                "비료주기": ["비료", "시비", "영양", "주기"],
-                "농약살포": ["방제", "약제", "병해충", "살포"],
-                "물관리": ["물", "관수", "물떼기", "배수", "관리"],
-                "수확": ["수확", "출하", "판매", "수집"],
-                "건조": ["건조"],
-                "제초": ["제초", "잡초"],
-                "갈이": ["갈이", "쟁기", "로터리", "경운"],
-                "기타": ["기타", "교육", "예찰", "활동"]
-            }
-            
-            # 일반 키워드로 매칭 시도
-            for schedule_key, keywords in general_keywords.items():
-                if schedule_task == schedule_key:
-                    for available_task in available_tasks:
-                        for keyword in keywords:
-                            if keyword in available_task:
-                                print(f"일반 키워드 매칭: {schedule_task} -> {available_task}")
-                                return available_task
-            
-            # 4. 유사도 점수 기반 매칭 (가장 유사한 옵션 선택)
-            best_match = None
-            best_score = 0
-            
-            for available_task in available_tasks:
-                # 간단한 유사도 계산 (공통 문자 수)
-                common_chars = sum(1 for c in schedule_task if c in available_task)
-                score = common_chars / max(len(schedule_task), len(available_task))
-                
-                if score > best_score and score > 0.3:  # 30% 이상 유사도
-                    best_score = score
-                    best_match = available_task
-            
-            if best_match:
-                print(f"유사도 매칭: {schedule_task} -> {best_match} (점수: {best_score:.2f})")
-                return best_match
-            
-            # 5. 매칭 실패 시 첫 번째 유효한 옵션 반환
-            if available_tasks:
-                print(f"매칭 실패, 첫 번째 옵션 선택: {available_tasks[0]}")
-                return available_tasks[0]
-            
-            return None
+            result = self.match_task(schedule_task, available_tasks, fallback=True)
+            if result["option"]:
+                label = MATCH_METHOD_LABELS[result["method"]]
+                print(f"{label} 매칭: {schedule_task} -> {result['option']} (신뢰도: {result['confidence']:.2f})")
+            return result["option"]
             
         except Exception as e:
             print(f"작업 단계 매칭 실패: {e}")
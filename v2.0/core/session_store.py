@@ -0,0 +1,124 @@
+import os
+import sys
+import json
+import time
+import base64
+import hashlib
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'config'))
+
+from settings import Config
+
+
+class SessionStore:
+    """농업ON 로그인 쿠키를 사용자별로 암호화해 디스크에 저장하는 클래스
+
+    - 파일 이름은 AGRION_USERNAME의 해시로 정해 사용자별로 분리합니다. (session_key를 주면 워커별로 다시 분리)
+    - 암호화 키는 AGRION_SESSION_SECRET(없으면 로그인 비밀번호)에서 PBKDF2로 만들고 Fernet으로 암호화합니다.
+    - cryptography 패키지가 없으면 세션 저장을 사용하지 않고 매번 로그인합니다.
+    """
+
+    def __init__(self, username=None, secret=None, store_dir=None, max_age=None, session_key=None):
+        self.username = username if username is not None else Config.USERNAME
+        self.session_key = session_key  # 병렬 워커 번호 등 (워커마다 자기 로그인 세션을 사용)
+        self.secret = secret if secret is not None else (Config.SESSION_SECRET or Config.PASSWORD)
+        self.store_dir = store_dir or Config.SESSION_STORE_DIR
+        self.max_age = max_age if max_age is not None else Config.SESSION_MAX_AGE
+        self.fernet = self._create_fernet()
+
+    def _create_fernet(self):
+        if not Config.SESSION_REUSE:
+            return None
+        if not self.username or not self.secret:
+            return None
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            print("⚠️ cryptography 패키지가 없어 로그인 세션 저장을 사용하지 않습니다. (pip install cryptography)")
+            return None
+
+        key = hashlib.pbkdf2_hmac(
+            'sha256', self.secret.encode('utf-8'), f"agrion-session:{self.username}".encode('utf-8'), 200000,
+        )
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def is_available(self):
+        """세션 저장을 사용할 수 있는지 반환합니다."""
+        return self.fernet is not None
+
+    def get_session_path(self):
+        """사용자별(워커별) 세션 파일 경로를 반환합니다."""
+        user_key = hashlib.sha256(self.username.encode('utf-8')).hexdigest()[:16]
+        if self.session_key:
+            user_key = f"{user_key}_{self.session_key}"
+        return os.path.join(self.store_dir, f"{user_key}.session")
+
+    def save(self, cookies):
+        """브라우저 쿠키 목록을 암호화해 저장합니다.
+
+        Args:
+            cookies (list): driver.get_cookies() 결과
+        """
+        if not self.is_available() or not cookies:
+            return False
+
+        payload = json.dumps({
+            "username": self.username,
+            "base_url": Config.BASE_URL,
+            "saved_at": time.time(),
+            "cookies": cookies,
+        }, ensure_ascii=False).encode('utf-8')
+
+        path = self.get_session_path()
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(self.fernet.encrypt(payload))
+            try:
+                os.chmod(temp_path, 0o600)
+            except OSError:
+                pass
+            os.replace(temp_path, path)
+            print(f"🔐 로그인 세션 저장 완료 (쿠키 {len(cookies)}개)")
+            return True
+        except OSError as e:
+            print(f"⚠️ 로그인 세션 저장 실패: {e}")
+            return False
+
+    def load(self):
+        """저장된 쿠키 목록을 복호화해 반환합니다.
+
+        Returns:
+            list: 쿠키 목록 (없거나 만료/손상/다른 사이트용이면 None)
+        """
+        if not self.is_available():
+            return None
+
+        path = self.get_session_path()
+        if not os.path.exists(path):
+            return None
+
+        try:
+            from cryptography.fernet import InvalidToken
+            with open(path, 'rb') as f:
+                token = f.read()
+            data = json.loads(self.fernet.decrypt(token, ttl=int(self.max_age)).decode('utf-8'))
+        except InvalidToken:
+            print("⚠️ 저장된 로그인 세션이 만료되었거나 복호화할 수 없습니다.")
+            self.clear()
+            return None
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 저장된 로그인 세션 읽기 실패: {e}")
+            self.clear()
+            return None
+
+        if data.get("username") != self.username or data.get("base_url") != Config.BASE_URL:
+            return None
+        return data.get("cookies") or None
+
+    def clear(self):
+        """저장된 세션 파일을 삭제합니다."""
+        try:
+            os.remove(self.get_session_path())
+        except OSError:
+            pass
@@ -0,0 +1,278 @@
+import re
+import threading
+from collections import deque
+
+
+# 작업명에 키워드가 있으면 관련 단어가 들어간 작업단계와 매칭 (match_task_with_gpt 키워드 표)
+TASK_KEYWORD_SYNONYMS = {
+    "논갈이": ["논갈이", "쟁기"],
+    "비료": ["비료"],
+    "로터리": ["로터리"],
+    "볍씨소독": ["소독", "볍씨"],
+    "파종": ["파종", "씨뿌리기"],
+    "치상": ["치상"],
+    "이앙": ["이앙", "모내기"],
+    "방제": ["방제", "농약"],
+    "제초": ["제초", "잡초"],
+    "물떼기": ["물떼기"],
+    "수확": ["수확"],
+    "건조": ["건조"],
+    "출하": ["출하", "판매"]
+}
+
+# 일반 작업명과 같으면 관련 단어가 들어간 작업단계와 매칭 (find_matching_task_step 일반 키워드 표, 품종 무관)
+GENERAL_TASK_SYNONYMS = {
+    "씨뿌리기": ["파종", "종자", "소독", "씨앗"],
+    "모내기": ["이앙", "모", "심기", "정식"],
+    "비료주기": ["비료", "시비", "영양", "주기"],
+    "농약살포": ["방제", "약제", "병해충", "살포"],
+    "물관리": ["물", "관수", "물떼기", "배수", "관리"],
+    "수확": ["수확", "출하", "판매", "수집"],
+    "건조": ["건조"],
+    "제초": ["제초", "잡초"],
+    "갈이": ["갈이", "쟁기", "로터리", "경운"],
+    "기타": ["기타", "교육", "예찰", "활동"]
+}
+
+# 매칭 방식별 신뢰도 (유사도 매칭은 유사도 점수의 절반)
+MATCH_CONFIDENCE = {
+    'exact': 1.0,
+    'contains': 0.9,
+    'keyword': 0.7,
+    'general': 0.5,
+    'first': 0.1,
+}
+
+# 매칭 방식 표시 이름 (로그용)
+MATCH_METHOD_LABELS = {
+    'exact': "정확",
+    'contains': "부분",
+    'keyword': "키워드",
+    'general': "일반 키워드",
+    'similarity': "유사도",
+    'first': "첫 번째 옵션",
+}
+
+SIMILARITY_THRESHOLD = 0.3  # 유사도 매칭 최소 점수 (공통 문자 수 / 긴 쪽 길이)
+OPTION_SET_CACHE_SIZE = 64  # 컴파일해 둘 작업단계 목록 수 (넘으면 캐시를 비우고 다시 채움)
+
+
+def normalize_task_name(text):
+    """공백을 지워 비교용 작업명을 만듭니다. ("출하/판매 작업 " → "출하/판매작업")"""
+    return re.sub(r'\s+', '', text or '')
+
+
+class AhoCorasick:
+    """여러 단어가 문자열에 들어 있는지 한 번의 순회로 찾는 Aho-Corasick 자동자"""
+
+    def __init__(self, words):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [set()]
+        for word in words:
+            if word:
+                self._add(word)
+        self._build_fail_links()
+
+    def _add(self, word):
+        state = 0
+        for char in word:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(set())
+            state = next_state
+        self.output[state].add(word)
+
+    def _build_fail_links(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] |= self.output[self.fail[next_state]]
+
+    def find(self, text):
+        """문자열에 들어 있는 단어 집합을 반환합니다."""
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            if self.output[state]:
+                found |= self.output[state]
+        return found
+
+
+class TaskMatcher:
+    """스케줄 작업명과 작업단계 옵션을 매칭하는 컴파일된 매처
+
+    - 동의어 표의 모든 단어로 Aho-Corasick 자동자를 한 번 만들고, 작업명/작업단계는 각각 한 번씩만 훑습니다.
+    - 작업단계 목록은 처음 볼 때 한 번 컴파일(정확 매칭 dict, 단어 → 첫 옵션, 문자 → 옵션 색인)해 재사용합니다.
+    - 결과는 (작업명, 작업단계 목록)별로 기억하므로 같은 페이지에서 반복되는 매칭은 dict 조회 한 번입니다.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, task_names=()):
+        terms = set()
+        for table in (TASK_KEYWORD_SYNONYMS, GENERAL_TASK_SYNONYMS):
+            for keyword, related_terms in table.items():
+                terms.add(keyword)
+                terms.update(related_terms)
+        self.automaton = AhoCorasick(sorted(terms))
+
+        self.lock = threading.Lock()
+        self.task_names = {}   # 정규화된 작업명 → (키워드 관련 단어, 일반 키워드 관련 단어)
+        self.option_sets = {}  # 작업단계 목록 지문 → 컴파일된 목록
+        self.results = {}      # (작업명, 작업단계 목록 지문, 대체 매칭 여부) → 매칭 결과
+        self.stats = {"hits": 0, "misses": 0}
+        for task_name in task_names:
+            self._compile_task_name(normalize_task_name(task_name))
+
+    @classmethod
+    def shared(cls, task_names=()):
+        """같은 작업명 집합으로 만든 매처를 인스턴스 간에 공유합니다."""
+        key = frozenset(task_names)
+        with cls._shared_lock:
+            matcher = cls._shared.get(key)
+            if matcher is None:
+                matcher = cls(key)
+                cls._shared[key] = matcher
+            return matcher
+
+    def _compile_task_name(self, name):
+        compiled = self.task_names.get(name)
+        if compiled is None:
+            found = self.automaton.find(name)
+            keyword_terms = set()
+            for keyword, related_terms in TASK_KEYWORD_SYNONYMS.items():
+                if keyword in found:
+                    keyword_terms.update(related_terms)
+            compiled = (keyword_terms, set(GENERAL_TASK_SYNONYMS.get(name, [])))
+            self.task_names[name] = compiled
+        return compiled
+
+    def _compile_options(self, options, fingerprint):
+        compiled = self.option_sets.get(fingerprint)
+        if compiled is None or compiled["options"] != options:
+            normalized = [normalize_task_name(option) for option in options]
+            raw = [option or '' for option in options]
+            exact = {}
+            term_first = {}
+            char_index = {}
+            for index, text in enumerate(normalized):
+                exact.setdefault(text, index)
+                for term in self.automaton.find(text):
+                    term_first.setdefault(term, index)
+                for char in set(raw[index]):
+                    char_index.setdefault(char, []).append(index)
+            compiled = {
+                "options": options,
+                "raw": raw,
+                "normalized": normalized,
+                "exact": exact,
+                "term_first": term_first,
+                "char_index": char_index,
+            }
+            if len(self.option_sets) >= OPTION_SET_CACHE_SIZE:
+                self.option_sets.clear()
+                self.results.clear()
+            self.option_sets[fingerprint] = compiled
+        return compiled
+
+    def match(self, task_name, options, fallback=False):
+        """작업명에 맞는 작업단계를 찾습니다.
+
+        Args:
+            task_name (str): 스케줄 작업명
+            options (list): 작업단계 옵션 텍스트 목록
+            fallback (bool): False면 정확 → 부분 → 키워드 매칭 (match_task_with_gpt),
+                True면 정확 → 부분 → 일반 키워드 → 유사도 → 첫 번째 옵션 (find_matching_task_step)
+
+        Returns:
+            dict: {"option": 작업단계 또는 None, "confidence": 0.0~1.0, "method": 매칭 방식}
+        """
+        # 목록 지문은 호출마다 한 번만 계산하고, 결과 조회는 정수 지문으로 해 긴 목록도 다시 비교하지 않음
+        options = tuple(options)
+        fingerprint = (len(options), hash(options))
+        key = (task_name, fingerprint, fallback)
+        result = self.results.get(key)
+        if result is not None:
+            self.stats["hits"] += 1
+            return result
+
+        with self.lock:
+            self.stats["misses"] += 1
+            compiled = self._compile_options(options, fingerprint)
+            name = normalize_task_name(task_name)
+            index, method, confidence = self._find(task_name or '', name, compiled, fallback)
+            result = {
+                "option": options[index] if index is not None else None,
+                "confidence": confidence,
+                "method": method,
+            }
+            self.results[key] = result
+        return result
+
+    def _find(self, raw_name, name, compiled, fallback):
+        """(옵션 번호, 매칭 방식, 신뢰도)를 반환합니다. 같은 방식이면 목록 앞쪽 옵션이 우선입니다."""
+        normalized = compiled["normalized"]
+        if not name or not normalized:
+            return None, None, 0.0
+
+        # 1. 정확 매칭
+        index = compiled["exact"].get(name)
+        if index is not None:
+            return index, 'exact', MATCH_CONFIDENCE['exact']
+
+        # 2. 부분 매칭 (포함 관계)
+        for index, text in enumerate(normalized):
+            if text and (name in text or text in name):
+                return index, 'contains', MATCH_CONFIDENCE['contains']
+
+        # 3. 키워드 매칭 (작업명에 키워드가 있으면 관련 단어가 들어간 첫 옵션)
+        #    일반 키워드 매칭 (작업명이 일반 작업명과 같으면 관련 단어가 들어간 첫 옵션)
+        keyword_terms, general_terms = self._compile_task_name(name)
+        method, terms = ('general', general_terms) if fallback else ('keyword', keyword_terms)
+        candidates = [compiled["term_first"][term] for term in terms if term in compiled["term_first"]]
+        if candidates:
+            return min(candidates), method, MATCH_CONFIDENCE[method]
+
+        if not fallback:
+            return None, None, 0.0
+
+        # 4. 유사도 매칭 (작업명 문자가 옵션에 들어 있는 수 / 긴 쪽 길이, 원래 문자열 기준)
+        common = {}
+        for char in raw_name:
+            for index in compiled["char_index"].get(char, ()):
+                common[index] = common.get(index, 0) + 1
+        best_index, best_score = None, 0.0
+        for index in sorted(common):
+            score = common[index] / max(len(raw_name), len(compiled["raw"][index]))
+            if score > best_score and score > SIMILARITY_THRESHOLD:
+                best_index, best_score = index, score
+        if best_index is not None:
+            return best_index, 'similarity', round(best_score / 2, 2)
+
+        # 5. 첫 번째 옵션
+        return 0, 'first', MATCH_CONFIDENCE['first']
+
+    def get_stats(self):
+        """매칭 결과 재사용 통계를 반환합니다."""
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            "hits": self.stats["hits"],
+            "misses": self.stats["misses"],
+            "hit_rate": self.stats["hits"] / total if total else 0.0,
+            "option_sets": len(self.option_sets),
+        }
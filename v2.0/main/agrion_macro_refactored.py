@@ -9,6 +9,8 @@ from core.browser_manager import BrowserManager
 from core.logger_manager import LoggerManager
 from core.schedule_processor import ScheduleProcessor
 from core.config_manager import ConfigManager
+from core.diary_planner import DiaryPlanner, build_additional_field_values
+from core.content_prefetcher import ContentPrefetcher
 from config.ai_GPT_diary_content_generator import ContentGenerator
 from config.settings import Config
 from selenium.webdriver.common.by import By
@@ -18,13 +20,19 @@ from selenium.webdriver.support import expected_conditions as EC
 class AgrionMacroRefactored:
     """리팩토링된 농업ON 영농일지 자동 등록 매크로"""
     
-    def __init__(self, test_mode=False):
-        # 의존성 주입 패턴 적용
-        self.logger_manager = LoggerManager()
-        self.browser_manager = BrowserManager(self.logger_manager)
+    def __init__(self, test_mode=False, worker_id=None):
+        # 의존성 주입 패턴 적용 (병렬 워커는 워커별 로그 파일/브라우저를 사용하고 시그널 처리는 코디네이터에 맡김)
+        self.worker_id = worker_id
+        self.logger_manager = LoggerManager(suffix=f"w{worker_id}" if worker_id is not None else None)
+        self.browser_manager = BrowserManager(
+            self.logger_manager,
+            register_signals=worker_id is None,
+            session_key=f"w{worker_id}" if worker_id is not None else None,
+        )
         self.schedule_processor = ScheduleProcessor()
         self.config_manager = ConfigManager(self.logger_manager)
-        self.content_generator = ContentGenerator()
+        self.content_generator = ContentGenerator(self.logger_manager)
+        self.diary_planner = DiaryPlanner(self.schedule_processor, self.content_generator, self.logger_manager)
         
         # 테스트 모드 설정
         self.test_mode = test_mode
@@ -37,6 +45,7 @@ class AgrionMacroRefactored:
     
     def run_macro(self):
         """메인 매크로를 실행합니다."""
+        prefetcher = None
         try:
             # 시작일 자동 업데이트 시도
             updated_start_date = self.config_manager.auto_update_start_date()
@@ -44,8 +53,18 @@ class AgrionMacroRefactored:
             # 설정된 날짜부터 시작
             start_date = datetime.strptime(updated_start_date, '%Y-%m-%d')
             end_date = datetime.strptime(Config.END_DATE, '%Y-%m-%d')
-            current_week_start = start_date
-            self.logger_manager.log_message(f"🚀 시작 날짜: {current_week_start.strftime('%Y-%m-%d')}")
+            self.logger_manager.log_message(f"🚀 시작 날짜: {start_date.strftime('%Y-%m-%d')}")
+            
+            # 전체 주차 계산 후 로그인 전에 등록 계획 준비 (작업 선택/추가 필드/작업 내용 생성을 브라우저 작업에서 분리)
+            # 일괄 생성을 쓰면 계획을 만들 때 작업 내용을 여러 주씩 한 번에 생성하고,
+            # 아니면 미리 생성 스레드가 로그인/등록과 동시에 백그라운드로 생성 (일괄 생성에서 빠진 주차도 여기서 채움)
+            week_ranges = self.build_week_ranges(start_date, end_date)
+            generate_content = not Config.CONTENT_PREFETCH_ENABLED or (Config.USE_GPT and Config.GPT_BATCH_SIZE > 1)
+            plan = self.diary_planner.load_or_compile(week_ranges, generate_content=generate_content)
+            plan_rows = self.diary_planner.get_pending_rows(plan, week_ranges)
+            total_weeks = len(plan_rows)
+            if Config.CONTENT_PREFETCH_ENABLED:
+                prefetcher = ContentPrefetcher(self.diary_planner, logger_manager=self.logger_manager).start(plan_rows)
             
             # 로그인
             self.browser_manager.login()
@@ -56,37 +75,14 @@ class AgrionMacroRefactored:
             # 메인 페이지에서 영농일지 작성 페이지로 이동
             self.browser_manager.navigate_to_diary_detail_from_main()
             
-            # 전체 주차 계산
-            total_weeks = ((end_date - start_date).days + Config.DIARY_INTERVAL_DAYS - 1) // Config.DIARY_INTERVAL_DAYS
-            current_week = 0
-            
-            while current_week_start <= end_date:
-                current_week += 1
-                
-                # 현재 주의 시작일과 종료일 계산
-                week_end = min(current_week_start + timedelta(days=Config.DIARY_INTERVAL_DAYS - 1), end_date)
-                week_start_str = current_week_start.strftime('%Y-%m-%d')
-                week_end_str = week_end.strftime('%Y-%m-%d')
-                
+            for current_week, plan_row in enumerate(plan_rows, start=1):
+                week_start_str, week_end_str = plan_row["start_date"], plan_row["end_date"]
                 self.logger_manager.log_message(f"\n📅 진행률: {current_week}/{total_weeks} ({week_start_str} ~ {week_end_str})")
                 
-                try:
-                    success = self.process_single_diary_with_schedule(week_start_str, week_end_str)
-                    if success:
-                        self.logger_manager.log_message(f"✅ {week_start_str} ~ {week_end_str} 영농일지 등록 완료")
-                    else:
-                        self.logger_manager.log_message(f"⚠️ {week_start_str} ~ {week_end_str} 해당 작업 없음 (건너뜀)")
-                except Exception as e:
-                    self.logger_manager.log_message(f"⚠️ {week_start_str} ~ {week_end_str} 등록 중 오류 발생: {e}")
-                    self.logger_manager.log_message("🔄 에러 복구 시도 중...")
-                    
-                    # 에러 복구 시도
-                    recovery_success = self.recover_from_error_with_schedule(week_start_str, week_end_str)
-                    if not recovery_success:
-                        self.logger_manager.log_message(f"❌ {week_start_str} ~ {week_end_str} 복구 실패, 다음 주로 진행...")
-                
-                # 다음 주로 이동
-                current_week_start += timedelta(days=Config.DIARY_INTERVAL_DAYS)
+                if prefetcher:
+                    plan_row["memo"] = prefetcher.take(plan_row)
+                result = self.process_week(week_start_str, week_end_str, plan_row)
+                self.diary_planner.mark_week(plan, plan_row, result)
                 
                 # 진행률 표시 (4주마다)
                 if current_week % 4 == 0:
@@ -101,9 +97,108 @@ class AgrionMacroRefactored:
         except Exception as e:
             self.logger_manager.log_message(f"매크로 실행 중 오류 발생: {e}")
         finally:
+            if prefetcher:
+                prefetcher.close()
+                prefetcher.print_report()
+            self.content_generator.print_cache_report(self.logger_manager)
+            self.content_generator.print_guard_report(self.logger_manager)
             # cleanup_and_exit에서 통합 처리
             self.browser_manager.cleanup_and_exit()
     
+    def run_macro_async(self, concurrency=None, rate_limit=None):
+        """HTTP 일괄 저장 모드 - run_macro와 같은 기간/스케줄로 여러 주를 동시에 저장합니다.
+        
+        브라우저로 로그인한 뒤 쿠키를 HTTP 세션으로 옮기고, asyncio로 주차들을 동시에 제출합니다.
+        
+        Args:
+            concurrency (int): 동시에 처리할 주차 수 (기본값: Config.ASYNC_CONCURRENCY)
+            rate_limit (float): 초당 최대 HTTP 요청 수 (기본값: Config.ASYNC_RATE_LIMIT)
+        """
+        # services 모듈이 이 모듈을 import하므로 순환 import를 피해 여기서 불러옴
+        from services.http_diary_engine import HttpDiaryEngine, PayloadShapeError
+        from services.async_bulk_submitter import AsyncBulkSubmitter
+        
+        try:
+            # 시작일 자동 업데이트 시도
+            updated_start_date = self.config_manager.auto_update_start_date()
+            
+            # 설정된 날짜부터 시작
+            start_date = datetime.strptime(updated_start_date, '%Y-%m-%d')
+            end_date = datetime.strptime(Config.END_DATE, '%Y-%m-%d')
+            week_ranges = self.build_week_ranges(start_date, end_date)
+            self.logger_manager.log_message(f"🚀 시작 날짜: {start_date.strftime('%Y-%m-%d')} (일괄 저장 모드)")
+            
+            # 로그인 후 작성 페이지에서 쿠키와 폼 구성 가져오기
+            self.browser_manager.login()
+            self.browser_manager.navigate_to_diary_main()
+            self.browser_manager.navigate_to_diary_detail_from_main()
+            
+            engine = HttpDiaryEngine(macro=self)
+            try:
+                engine.sync_from_browser()
+            except PayloadShapeError as e:
+                self.logger_manager.log_message(f"⚠️ {e} - 브라우저 방식으로 전체 기간을 처리합니다.")
+                engine.get_browser_fallback().process_weeks(week_ranges)
+                return
+            
+            try:
+                AsyncBulkSubmitter(engine, concurrency=concurrency, rate_limit=rate_limit).run(week_ranges)
+            finally:
+                engine.session.close()
+            
+            self.logger_manager.log_message("모든 영농일지 등록 완료!")
+            
+        except Exception as e:
+            self.logger_manager.log_message(f"일괄 저장 실행 중 오류 발생: {e}")
+        finally:
+            # cleanup_and_exit에서 통합 처리
+            self.browser_manager.cleanup_and_exit()
+    
+    @staticmethod
+    def build_week_ranges(start_date, end_date):
+        """시작일~종료일을 DIARY_INTERVAL_DAYS 단위 주차 목록으로 나눕니다.
+        
+        Args:
+            start_date (datetime): 시작일
+            end_date (datetime): 종료일
+            
+        Returns:
+            list: [(주 시작일 'YYYY-MM-DD', 주 종료일 'YYYY-MM-DD'), ...]
+        """
+        week_ranges = []
+        current_week_start = start_date
+        while current_week_start <= end_date:
+            week_end = min(current_week_start + timedelta(days=Config.DIARY_INTERVAL_DAYS - 1), end_date)
+            week_ranges.append((current_week_start.strftime('%Y-%m-%d'), week_end.strftime('%Y-%m-%d')))
+            current_week_start += timedelta(days=Config.DIARY_INTERVAL_DAYS)
+        return week_ranges
+    
+    def process_week(self, week_start_str, week_end_str, plan_row=None):
+        """한 주의 영농일지를 등록하고, 실패하면 복구를 시도합니다.
+        
+        Args:
+            plan_row (dict): 등록 계획 행 (있으면 계획된 작업/추가 필드/작업 내용 사용)
+        
+        Returns:
+            str: 'success' (등록 완료), 'skipped' (해당 작업 없음), 'failed' (복구 실패)
+        """
+        try:
+            success = self.process_single_diary_with_schedule(week_start_str, week_end_str, plan_row)
+            if success:
+                self.logger_manager.log_message(f"✅ {week_start_str} ~ {week_end_str} 영농일지 등록 완료")
+                return 'success'
+            self.logger_manager.log_message(f"⚠️ {week_start_str} ~ {week_end_str} 해당 작업 없음 (건너뜀)")
+            return 'skipped'
+        except Exception as e:
+            self.logger_manager.log_message(f"⚠️ {week_start_str} ~ {week_end_str} 등록 중 오류 발생: {e}")
+            self.logger_manager.log_message("🔄 에러 복구 시도 중...")
+            
+            # 에러 복구 시도
+            if self.recover_from_error_with_schedule(week_start_str, week_end_str, plan_row):
+                return 'success'
+            self.logger_manager.log_message(f"❌ {week_start_str} ~ {week_end_str} 복구 실패, 다음 주로 진행...")
+            return 'failed'
+    
     def run_test_mode(self):
         """테스트 모드 - 스케줄 기반 영농일지 1개 등록"""
         try:
@@ -146,18 +241,28 @@ class AgrionMacroRefactored:
             # cleanup_and_exit에서 통합 처리
             self.browser_manager.cleanup_and_exit()
     
-    def process_single_diary_with_schedule(self, start_date, end_date):
-        """JSON 스케줄 데이터를 기반으로 주간 영농일지를 처리합니다."""
+    def process_single_diary_with_schedule(self, start_date, end_date, plan_row=None):
+        """JSON 스케줄 데이터를 기반으로 주간 영농일지를 처리합니다.
+        
+        plan_row가 있으면 스케줄 조회/작업 선택/작업 내용 생성 없이 등록 계획에 정해 둔 값을 사용합니다.
+        """
         try:
             print(f"\n=== {start_date} ~ {end_date} 영농일지 등록 시작 (스케줄 기반) ===")
             
-            # 1. JSON에서 해당 주의 작업들 찾기 (시작일 기준)
-            matching_tasks = self.schedule_processor.find_matching_tasks_by_date(start_date)
+            # 1. 해당 주의 작업 정하기 (계획이 있으면 계획된 작업, 없으면 JSON에서 시작일 기준으로 찾기)
+            if plan_row:
+                matching_tasks = [] if plan_row["kind"] == 'basic' else [{
+                    "작업명": plan_row["schedule_task"],
+                    "기간": plan_row["period"],
+                    "단계": plan_row["stage"],
+                }]
+            else:
+                matching_tasks = self.schedule_processor.find_matching_tasks_by_date(start_date)
             
             if not matching_tasks:
                 print(f"⚠️ {start_date} ~ {end_date}에 해당하는 작업이 없습니다. 기본 관리 작업으로 등록합니다.")
                 # 기본 관리 작업으로 등록
-                return self.process_basic_diary(start_date, end_date)
+                return self.process_basic_diary(start_date, end_date, plan_row)
             
             # 2. 현재 페이지가 영농일지 작성 페이지인지 확인
             current_url = self.browser_manager.get_driver().current_url
@@ -198,11 +303,14 @@ class AgrionMacroRefactored:
                 print(f"❌ 작업단계 목록 가져오기 실패: {e}")
                 return False
             
-            # 6. 랜덤으로 작업 선택하여 매칭 시도
-            import random
+            # 6. 랜덤으로 작업 선택하여 매칭 시도 (계획된 작업단계가 목록에 있으면 그대로 사용)
             selected_task = random.choice(matching_tasks)
-            print(f"🎲 랜덤 선택된 작업: {selected_task['작업명']} ({selected_task['기간']})")
-            matched_task = self.schedule_processor.match_task_with_gpt(selected_task["작업명"], available_tasks)
+            if plan_row and plan_row["task_step"] in available_tasks:
+                print(f"🗂️ 계획된 작업: {selected_task['작업명']} ({selected_task['기간']})")
+                matched_task = plan_row["task_step"]
+            else:
+                print(f"🎲 랜덤 선택된 작업: {selected_task['작업명']} ({selected_task['기간']})")
+                matched_task = self.schedule_processor.match_task_with_gpt(selected_task["작업명"], available_tasks)
             
             if not matched_task:
                 print(f"❌ '{selected_task['작업명']}'에 해당하는 작업단계를 찾을 수 없습니다.")
@@ -211,18 +319,24 @@ class AgrionMacroRefactored:
             # 7. 작업단계 선택
             self.select_task_step(matched_task)
             
-            # 8. 작업 단계별 추가 필드 처리
-            self.handle_additional_fields(matched_task)
+            # 8. 작업 단계별 추가 필드 처리 (계획 행은 실제로 선택한 작업단계로 갱신하고, 바뀌었으면 추가 필드를 다시 정함)
+            if plan_row and plan_row["task_step"] != matched_task:
+                plan_row["task_step"] = matched_task
+                plan_row["additional_fields"] = build_additional_field_values(matched_task)
+            self.handle_additional_fields(matched_task, plan_row["additional_fields"] if plan_row else None)
             
             # 9. 날씨 정보 수집
             weather_data = self.get_weather_data()
             
-            # 10. 날씨를 고려한 작업 내용 생성
-            content = self.generate_weather_aware_content(
-                selected_task["작업명"], 
-                start_date, 
-                weather_data
-            )
+            # 10. 날씨를 고려한 작업 내용 생성 (계획 내용은 스케줄 작업명으로 만들었으므로 작업단계 이름과 무관하게 사용)
+            if plan_row and plan_row["memo"]:
+                content = plan_row["memo"]
+            else:
+                content = self.generate_weather_aware_content(
+                    selected_task["작업명"], 
+                    start_date, 
+                    weather_data
+                )
             
             # 날짜 정보를 포함한 내용 생성
             if not content:
@@ -265,10 +379,10 @@ class AgrionMacroRefactored:
         except Exception as e:
             self.logger_manager.log_message(f"❌ {start_date} 영농일지 등록 중 오류 발생: {e}")
             self.logger_manager.log_message("🔄 에러 복구 시도: 메인 페이지로 돌아가서 영농일지 등록 재시작...")
-            return self.recover_from_error_with_schedule(start_date, end_date)
+            return self.recover_from_error_with_schedule(start_date, end_date, plan_row)
     
-    def process_basic_diary(self, start_date, end_date):
-        """작업이 없는 주의 기본 관리 영농일지를 등록합니다."""
+    def process_basic_diary(self, start_date, end_date, plan_row=None):
+        """작업이 없는 주의 기본 관리 영농일지를 등록합니다. (plan_row가 있으면 계획된 작업단계/작업 내용 사용)"""
         try:
             print(f"\n=== {start_date} ~ {end_date} 기본 관리 영농일지 등록 시작 ===")
             
@@ -311,9 +425,11 @@ class AgrionMacroRefactored:
                 print(f"❌ 작업단계 목록 가져오기 실패: {e}")
                 return False
             
-            # 5. 기본 관리 작업 선택 (기타작업 또는 비료작업)
+            # 5. 기본 관리 작업 선택 (계획된 작업단계 → 기타작업 또는 비료작업)
             basic_task = None
-            for task in available_tasks:
+            if plan_row and plan_row["task_step"] in available_tasks:
+                basic_task = plan_row["task_step"]
+            for task in ([] if basic_task else available_tasks):
                 if "기타작업" in task or "비료작업" in task or "관찰" in task:
                     basic_task = task
                     break
@@ -328,13 +444,17 @@ class AgrionMacroRefactored:
             self.select_task_step(basic_task)
             
             # 7. 작업 단계별 추가 필드 처리
-            self.handle_additional_fields(basic_task)
+            planned = plan_row is not None and plan_row["task_step"] == basic_task
+            self.handle_additional_fields(basic_task, plan_row["additional_fields"] if planned else None)
             
             # 8. 날씨 정보 수집
             weather_data = self.get_weather_data()
             
-            # 9. 기본 관리 내용 생성
-            content = self.generate_basic_diary_content(start_date, weather_data)
+            # 9. 기본 관리 내용 생성 (계획에 미리 만든 내용이 있으면 그대로 사용)
+            if planned and plan_row["memo"]:
+                content = plan_row["memo"]
+            else:
+                content = self.generate_basic_diary_content(start_date, weather_data)
             
             # 10. 작업 내용 입력
             self.enter_memo_with_content(content)
@@ -369,7 +489,7 @@ class AgrionMacroRefactored:
             print(f"❌ {start_date} 기본 관리 영농일지 등록 중 오류 발생: {e}")
             return False
     
-    def recover_from_error_with_schedule(self, start_date, end_date=None):
+    def recover_from_error_with_schedule(self, start_date, end_date=None, plan_row=None):
         """스케줄 기반 에러 발생 시 메인 페이지로 돌아가서 영농일지 등록을 재시작합니다."""
         try:
             print("🔄 스케줄 기반 에러 복구 프로세스 시작...")
@@ -377,7 +497,7 @@ class AgrionMacroRefactored:
             # 1. 메인 페이지로 이동 (강제로 URL 이동)
             print("📄 메인 페이지로 이동 중...")
             self.browser_manager.get_driver().get(Config.DIARY_MAIN_URL)
-            time.sleep(Config.FAST_WAIT_TIME)
+            self.browser_manager.require_ready(self.browser_manager.wait_for_diary_main())
             print("✅ 메인 페이지 이동 완료")
             
             # 2. 영농일지 등록 링크 찾기 및 클릭
@@ -421,12 +541,12 @@ class AgrionMacroRefactored:
                 print("🔄 직접 URL 이동으로 대체...")
                 self.browser_manager.get_driver().get(Config.DIARY_DETAIL_URL)
             
-            time.sleep(Config.FAST_WAIT_TIME)
+            self.browser_manager.require_ready(self.browser_manager.wait_for_diary_detail())
             
             # 3. 영농일지 등록 재시작
             if end_date:
                 print(f"🔄 {start_date} ~ {end_date} 영농일지 등록 재시작 (스케줄 기반)...")
-                return self.process_single_diary_with_schedule(start_date, end_date)
+                return self.process_single_diary_with_schedule(start_date, end_date, plan_row)
             else:
                 print(f"🔄 {start_date} 영농일지 등록 재시작 (스케줄 기반)...")
                 return self.process_single_diary_with_schedule(start_date, start_date)
@@ -466,8 +586,8 @@ class AgrionMacroRefactored:
         # 기존 코드에서 가져와서 수정 필요
         pass
     
-    def handle_additional_fields(self, task_step):
-        """작업 단계별 추가 입력 필드를 처리합니다."""
+    def handle_additional_fields(self, task_step, field_values=None):
+        """작업 단계별 추가 입력 필드를 처리합니다. (field_values가 있으면 등록 계획에 정해 둔 값 입력)"""
         # 기존 코드에서 가져와서 수정 필요
         pass
     
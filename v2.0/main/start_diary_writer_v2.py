@@ -12,7 +12,38 @@ import os
 # v2.0 모듈 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+from datetime import datetime
+
 from main.agrion_macro_refactored import AgrionMacroRefactored
+from core.logger_manager import LoggerManager
+from core.config_manager import ConfigManager
+from core.schedule_processor import ScheduleProcessor
+from core.diary_planner import DiaryPlanner
+from config.ai_GPT_diary_content_generator import ContentGenerator
+from services.worker_pool import DiaryWorkerPool
+from services.tab_multiplexer import DiaryTabMultiplexer
+from services.http_diary_engine import HttpDiaryEngine
+from config.settings import Config
+
+
+def run_plan_dry_run():
+    """브라우저 없이 등록 계획만 만들어 저장하고 내용을 출력합니다. (전체 모드가 이 계획을 그대로 실행)"""
+    logger_manager = LoggerManager(suffix="plan")
+    try:
+        config_manager = ConfigManager(logger_manager)
+        start_date = datetime.strptime(config_manager.auto_update_start_date(), '%Y-%m-%d')
+        end_date = datetime.strptime(Config.END_DATE, '%Y-%m-%d')
+        week_ranges = AgrionMacroRefactored.build_week_ranges(start_date, end_date)
+        
+        content_generator = ContentGenerator(logger_manager)
+        planner = DiaryPlanner(ScheduleProcessor(), content_generator, logger_manager)
+        plan = planner.compile(week_ranges)
+        planner.save(plan)
+        planner.print_summary(plan)
+        content_generator.print_cache_report(logger_manager)
+        content_generator.print_guard_report(logger_manager)
+    finally:
+        logger_manager.close_log_file()
 
 
 def main():
@@ -24,12 +55,40 @@ def main():
     print("\n실행 모드를 선택하세요:")
     print("1. 테스트 모드 (1개 일지 등록)")
     print("2. 전체 모드 (전체 기간 일지 등록)")
+    print(f"3. 병렬 모드 (브라우저 {Config.WORKER_COUNT}개로 전체 기간 나눠 등록)")
+    print(f"4. 멀티탭 모드 (브라우저 1개의 탭 {Config.TAB_COUNT}개로 전체 기간 등록)")
+    print("5. HTTP 모드 (브라우저는 로그인만, 일지는 HTTP 요청으로 직접 저장)")
+    print(f"6. 일괄 저장 모드 (HTTP 요청으로 {Config.ASYNC_CONCURRENCY}주씩 동시 저장)")
+    print("7. 계획 모드 (브라우저 없이 주차별 작업/작업 내용 계획만 생성)")
     
     while True:
-        mode = input("\n모드를 선택하세요 (1 또는 2): ").strip()
-        if mode in ['1', '2']:
+        mode = input("\n모드를 선택하세요 (1~7): ").strip()
+        if mode in ['1', '2', '3', '4', '5', '6', '7']:
             break
-        print("⚠️ 1 또는 2를 입력해주세요.")
+        print("⚠️ 1~7 중 하나를 입력해주세요.")
+    
+    if mode == '7':
+        # 계획 모드 - 브라우저를 열지 않고 계획 파일만 생성 (전체 모드에서 그대로 실행)
+        print("\n=== 계획 모드 시작 ===")
+        try:
+            run_plan_dry_run()
+        except KeyboardInterrupt:
+            print("\n\n⚠️ 사용자에 의해 계획 생성이 중단되었습니다.")
+        finally:
+            print("\n✅ 매크로가 종료되었습니다.")
+        return
+    
+    if mode == '3':
+        # 병렬 모드 - 워커별 브라우저/로그는 워커 풀이 정리
+        print("\n=== 병렬 모드 시작 ===")
+        try:
+            DiaryWorkerPool().run()
+        except KeyboardInterrupt:
+            print("\n\n⚠️ 사용자에 의해 매크로가 중단되었습니다.")
+            print("📝 로그 파일이 안전하게 저장되었습니다.")
+        finally:
+            print("\n✅ 매크로가 종료되었습니다.")
+        return
     
     # 매크로 인스턴스 생성
     macro = None
@@ -38,7 +97,19 @@ def main():
         test_mode = (mode == '1')
         macro = AgrionMacroRefactored(test_mode=test_mode)
         
-        if test_mode:
+        if mode == '4':
+            # 멀티탭 모드 - 로그인된 브라우저 하나에서 탭을 번갈아 처리
+            print("\n=== 멀티탭 모드 시작 ===")
+            DiaryTabMultiplexer(macro=macro).run()
+        elif mode == '5':
+            # HTTP 모드 - 폼 구성이 바뀌었거나 응답이 예상과 다르면 브라우저 방식으로 처리
+            print("\n=== HTTP 모드 시작 ===")
+            HttpDiaryEngine(macro=macro).run()
+        elif mode == '6':
+            # 일괄 저장 모드 - 동시 처리 수와 초당 요청 수를 제한해 여러 주를 동시에 저장
+            print("\n=== 일괄 저장 모드 시작 ===")
+            macro.run_macro_async()
+        elif test_mode:
             # 테스트 모드 - 글 등록 1개만
             print("\n=== 테스트 모드 시작 ===")
             macro.run_test_mode()
@@ -2,10 +2,23 @@
 v2.0 Services 모듈
 
 서비스 레이어를 담당하는 모듈들:
+- DiaryWorkerPool: 여러 브라우저 세션으로 기간을 나눠 처리하는 병렬 워커 풀
+- DiaryTabMultiplexer: 브라우저 하나의 여러 탭을 번갈아 처리하는 멀티탭 모드
+- HttpDiaryEngine: 브라우저 로그인 후 requests.Session으로 일지를 직접 저장하는 HTTP 모드
+- AsyncBulkSubmitter: 동시 처리 수/초당 요청 수를 제한해 여러 주를 동시에 저장하는 asyncio 일괄 처리기
 - ContentGeneratorWrapper: AI 내용 생성 래퍼
 - ErrorHandler: 에러 처리
 - DiaryProcessor: 일지 처리 로직
 """
 
-# 향후 서비스 모듈들이 추가될 예정
-__all__ = []
+from .worker_pool import DiaryWorkerPool
+from .tab_multiplexer import DiaryTabMultiplexer
+from .http_diary_engine import HttpDiaryEngine
+from .async_bulk_submitter import AsyncBulkSubmitter
+
+__all__ = [
+    'DiaryWorkerPool',
+    'DiaryTabMultiplexer',
+    'HttpDiaryEngine',
+    'AsyncBulkSubmitter'
+]
@@ -0,0 +1,201 @@
+import time
+import random
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import requests
+
+from services.http_diary_engine import (
+    RateLimiter, SessionExpiredError, TransientSubmitError, PayloadShapeError, SaveRequestError,
+)
+from config.settings import Config
+
+
+# 다시 시도하면 성공할 수 있는 오류 (목록/날씨 조회의 연결 오류/시간 초과/429/5xx, 서버가 일시적이라고 답한 저장 실패)
+# 저장 요청(POST)을 보낸 뒤의 오류는 SaveRequestError로 바뀌어 재시도하지 않음 (서버가 이미 저장했을 수 있음)
+TRANSIENT_ERRORS = (
+    TransientSubmitError,
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.RetryError,
+)
+
+
+class AsyncBulkSubmitter:
+    """asyncio로 여러 주의 영농일지를 동시에 HTTP 저장하는 일괄 처리기
+
+    - 동시 처리 주차 수는 세마포어(ASYNC_CONCURRENCY)로, 초당 HTTP 요청 수는 RateLimiter(ASYNC_RATE_LIMIT)로 제한합니다.
+    - HTTP 요청은 HttpDiaryEngine(requests)을 스레드 풀에서 실행합니다. (이벤트 루프는 대기/재시도/결과 수집 담당)
+    - 일시적 오류는 지수 backoff + 무작위 흔들기(jitter)로 재시도하고, 완료되는 순서대로 결과를 로그에 남깁니다.
+    """
+
+    def __init__(self, engine, concurrency=None, rate_limit=None, max_retries=None):
+        self.engine = engine
+        self.concurrency = max(1, concurrency or Config.ASYNC_CONCURRENCY)
+        self.rate_limit = Config.ASYNC_RATE_LIMIT if rate_limit is None else rate_limit
+        self.max_retries = Config.ASYNC_MAX_RETRIES if max_retries is None else max_retries
+        self.engine.rate_limiter = RateLimiter(self.rate_limit)
+        self.logger_manager = engine.macro.logger_manager
+
+        self.session_generation = 0  # 쿠키를 다시 가져올 때마다 증가 (중복 재로그인 방지)
+        self.resync_lock = None
+        self.results = []
+        self.elapsed = 0.0
+
+    def run(self, week_ranges):
+        """주차 목록을 동시에 저장하고, HTTP로 처리할 수 없는 주차는 브라우저 방식으로 처리합니다.
+
+        Args:
+            week_ranges (list): [(주 시작일, 주 종료일), ...]
+
+        Returns:
+            list: 주차별 결과 [{"start_date", "end_date", "status", "task", "seconds", "attempts", "error"}, ...]
+        """
+        started = time.perf_counter()
+        self.results = asyncio.run(self.submit_all(week_ranges))
+        self.elapsed = time.perf_counter() - started
+
+        fallback_weeks = [(r["start_date"], r["end_date"]) for r in self.results if r["status"] == 'fallback']
+        if fallback_weeks and self.engine.macro.browser_manager:
+            self.logger_manager.log_message(f"🔁 HTTP로 처리하지 못한 {len(fallback_weeks)}주를 브라우저 방식으로 처리합니다.")
+            self.engine.get_browser_fallback().process_weeks(fallback_weeks)
+
+        self.print_report()
+        return self.results
+
+    async def submit_all(self, week_ranges):
+        """모든 주차를 동시에 제출하고 완료되는 순서대로 결과를 기록합니다."""
+        self.resync_lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+        total = len(week_ranges)
+        self.logger_manager.log_message(
+            f"🚀 일괄 저장 시작: {total}주, 동시 {self.concurrency}개, 초당 최대 {self.rate_limit or '무제한'} 요청"
+        )
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='agrion-submit') as executor:
+            tasks = [
+                asyncio.ensure_future(self.submit_week(loop, executor, semaphore, start_date, end_date))
+                for start_date, end_date in week_ranges
+            ]
+            for done, future in enumerate(asyncio.as_completed(tasks), start=1):
+                result = await future
+                results.append(result)
+                self._log_result(result, done, total)
+        return results
+
+    async def submit_week(self, loop, executor, semaphore, start_date, end_date):
+        """한 주를 제출합니다. 일시적 오류는 backoff 후 재시도하고, 세션 만료 시 한 번만 다시 로그인합니다."""
+        result = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "status": 'failed',
+            "task": None,
+            "seconds": 0.0,
+            "attempts": 0,
+            "error": None,
+        }
+        resynced = False
+
+        while True:
+            result["attempts"] += 1
+            generation = self.session_generation
+            try:
+                # 재시도 대기 중에는 자리를 비워 다른 주차가 진행되도록 시도할 때만 세마포어를 잡음
+                async with semaphore:
+                    started = time.perf_counter()
+                    try:
+                        result["task"] = await loop.run_in_executor(executor, self.engine.submit_week, start_date, end_date)
+                    finally:
+                        # 일지당 시간은 대기열/backoff 시간을 빼고 실제 제출에 걸린 시간만 합산
+                        result["seconds"] += time.perf_counter() - started
+                result["status"] = 'success'
+                break
+            except SessionExpiredError as e:
+                result["error"] = str(e)
+                if resynced or not await self._resync(loop, generation):
+                    break
+                resynced = True
+            except TRANSIENT_ERRORS as e:
+                result["error"] = str(e)
+                if result["attempts"] > self.max_retries:
+                    break
+                delay = min(Config.ASYNC_BACKOFF_MAX, Config.ASYNC_BACKOFF_BASE * (2 ** (result["attempts"] - 1)))
+                delay *= random.uniform(0.5, 1.5)
+                print(f"⏳ {start_date} 일시적 오류 ({e}) - {delay:.1f}초 후 재시도 {result['attempts']}/{self.max_retries}")
+                await asyncio.sleep(delay)
+            except PayloadShapeError as e:
+                result["status"] = 'fallback'
+                result["error"] = str(e)
+                break
+            except SaveRequestError as e:
+                # 중복 저장을 막기 위해 재시도하지 않고 실패로 기록
+                result["error"] = str(e)
+                break
+            except Exception as e:
+                result["error"] = str(e)
+                break
+
+        return result
+
+    async def _resync(self, loop, generation):
+        """세션이 만료되면 브라우저로 다시 로그인합니다. 다른 주차가 이미 다시 로그인했으면 그 쿠키를 사용합니다.
+
+        엔진은 새 requests.Session을 채운 뒤 교체하므로 그동안 다른 주차의 요청은 기존 세션으로 계속 진행됩니다.
+        """
+        async with self.resync_lock:
+            if generation != self.session_generation:
+                return True
+            if not self.engine.macro.browser_manager:
+                return False
+            try:
+                await loop.run_in_executor(None, self.engine.resync_session)
+            except Exception as e:
+                self.logger_manager.log_message(f"⚠️ 다시 로그인 실패: {e}")
+                return False
+            self.session_generation += 1
+            return True
+
+    def _log_result(self, result, done, total):
+        prefix = f"[{done}/{total}] {result['start_date']} ~ {result['end_date']}"
+        retry = f", 시도 {result['attempts']}회" if result["attempts"] > 1 else ""
+        if result["status"] == 'success':
+            self.logger_manager.log_message(f"✅ {prefix} {result['task']} 영농일지 등록 완료 ({result['seconds']:.2f}초{retry})")
+        elif result["status"] == 'fallback':
+            self.logger_manager.log_message(f"🔁 {prefix} 브라우저 방식으로 처리 예정: {result['error']}")
+        else:
+            self.logger_manager.log_message(f"❌ {prefix} 등록 실패{retry}: {result['error']}")
+
+    def get_report(self):
+        """처리량, 일지당 지연 시간, 재시도 통계를 반환합니다."""
+        latencies = sorted(r["seconds"] for r in self.results if r["status"] == 'success')
+        succeeded = len(latencies)
+
+        def percentile(pct):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * pct / 100))] if latencies else 0.0
+
+        return {
+            "weeks": len(self.results),
+            "success": succeeded,
+            "failed": sum(1 for r in self.results if r["status"] == 'failed'),
+            "fallback": sum(1 for r in self.results if r["status"] == 'fallback'),
+            "retries": sum(r["attempts"] - 1 for r in self.results),
+            "elapsed": self.elapsed,
+            "per_hour": succeeded / self.elapsed * 3600 if self.elapsed > 0 else 0.0,
+            "p50_seconds": percentile(50),
+            "p95_seconds": percentile(95),
+            "http_calls": self.engine.stats["http_calls"],
+        }
+
+    def print_report(self):
+        report = self.get_report()
+        self.logger_manager.log_message(
+            f"\n📈 일괄 저장 결과: {report['success']}/{report['weeks']}주 완료 "
+            f"(실패 {report['failed']}, 브라우저 처리 {report['fallback']}, 재시도 {report['retries']}회) | "
+            f"{report['elapsed']:.1f}초, 시간당 {report['per_hour']:.1f}건 | "
+            f"일지당 p50 {report['p50_seconds']:.2f}초, p95 {report['p95_seconds']:.2f}초 | HTTP 요청 {report['http_calls']}회"
+        )
@@ -0,0 +1,417 @@
+import time
+import threading
+from datetime import datetime
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'config'))
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from main.agrion_macro_refactored import AgrionMacroRefactored
+from services.tab_multiplexer import DiaryTabMultiplexer, choose_task_option
+from config.settings import Config
+from additional_fields import build_additional_field_values
+
+
+# 저장 요청에 보내는 작성 폼 필드 (upsert_diary가 보내는 폼과 같은 구성)
+# 작성 페이지에 이 필드 중 하나라도 없으면 payload 형식이 바뀐 것으로 보고 브라우저 방식으로 처리합니다.
+# 페이지에만 있는 추가 필드는 페이지 기본값 그대로 함께 보냅니다.
+DIARY_FORM_FIELDS = [
+    'startDate', 'endDate',
+    'wfKor', 'lowTemp', 'highTemp', 'r12', 'reh',
+    'cropCode', 'taskCode',
+    'amount2', 'amount3', 'perPyeongAmount', 'seedbedAmount', 'unit',
+    'memo',
+]
+
+# 선택한 필지/품종 코드 (체크박스이므로 같은 이름으로 여러 번 전송)
+DIARY_LIST_FIELDS = ['landCode', 'scropCode']
+
+# 날씨 조회 응답 키 → 작성 폼 필드
+WEATHER_FIELDS = {
+    'wfKor': 'wfKor',
+    'lowTemp': 'lowTemp',
+    'highTemp': 'highTemp',
+    'r12': 'r12',
+    'reh': 'reh',
+}
+
+# 작성 페이지에서 품목 옵션과 폼 필드 기본값(체크박스 제외)을 한 번에 읽어옵니다.
+FORM_SCHEMA_SCRIPT = """
+var form = document.getElementById('diaryForm') || document.forms[0];
+if (!form) { return null; }
+var fields = {};
+for (var i = 0; i < form.elements.length; i++) {
+    var element = form.elements[i];
+    if (!element.name || element.type === 'checkbox' || element.type === 'button' || element.type === 'submit') {
+        continue;
+    }
+    fields[element.name] = element.value;
+}
+var crops = [];
+var cropSelect = document.getElementById('selectCrops');
+if (cropSelect) {
+    for (var j = 0; j < cropSelect.options.length; j++) {
+        crops.push({text: cropSelect.options[j].text.trim(), value: cropSelect.options[j].value});
+    }
+}
+return {fields: fields, crops: crops};
+"""
+
+
+class SessionExpiredError(Exception):
+    """HTTP 세션(쿠키)이 만료되어 다시 로그인이 필요한 경우"""
+
+
+class TransientSubmitError(Exception):
+    """서버 과부하/일시적 오류로 잠시 후 다시 시도하면 성공할 수 있는 경우"""
+
+
+class PayloadShapeError(Exception):
+    """서버 응답이나 작성 폼 구성이 예상과 달라 HTTP 방식으로 처리할 수 없는 경우"""
+
+
+class SaveRequestError(Exception):
+    """저장 요청(POST)을 보낸 뒤 결과를 확인하지 못한 경우 (서버가 이미 저장했을 수 있으므로 재시도/브라우저 처리하지 않음)"""
+
+
+class RateLimiter:
+    """초당 요청 수를 제한하는 스레드 안전 제한기 (요청 시작 시각을 1/rate초 간격으로 배치)"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_time)
+            self.next_time = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class HttpDiaryEngine:
+    """로그인만 브라우저로 하고 영농일지는 requests.Session으로 직접 저장하는 엔진
+
+    - 브라우저로 로그인한 뒤 쿠키를 연결 풀을 쓰는 requests.Session으로 복사합니다.
+    - 작성 페이지가 호출하는 XHR(필지/품종/작업단계 목록, 날씨)을 그대로 호출하고
+      upsert_diary와 같은 폼 payload를 저장 엔드포인트로 POST합니다. (일지 하나에 HTTP 요청 5번)
+    - 폼 구성이 바뀌었거나 응답 형식이 예상과 다르면 멀티탭 브라우저 방식으로 대신 처리합니다.
+    """
+
+    def __init__(self, macro=None):
+        self.macro = macro
+        self.session = None
+        self.form_defaults = None
+        self.crop_option = None
+        self.browser_fallback = None
+        self.rate_limiter = None  # 설정하면 모든 HTTP 요청 전에 wait() 호출
+        self.stats_lock = threading.Lock()
+        self.stats = {
+            "success": 0,
+            "failed": 0,
+            "fallback": 0,
+            "http_calls": 0,
+            "latencies": [],
+        }
+
+    def run(self):
+        """설정된 기간 전체를 HTTP 방식으로 처리합니다."""
+        if self.macro is None:
+            self.macro = AgrionMacroRefactored()
+        logger = self.macro.logger_manager
+        try:
+            # 시작일 자동 업데이트 시도
+            updated_start_date = self.macro.config_manager.auto_update_start_date()
+            start_date = datetime.strptime(updated_start_date, '%Y-%m-%d')
+            end_date = datetime.strptime(Config.END_DATE, '%Y-%m-%d')
+            week_ranges = AgrionMacroRefactored.build_week_ranges(start_date, end_date)
+            logger.log_message(f"🚀 HTTP 모드 시작: {start_date.strftime('%Y-%m-%d')} ~ {Config.END_DATE}, {len(week_ranges)}주")
+
+            # 로그인 (브라우저)
+            self.macro.browser_manager.login()
+            self.macro.browser_manager.navigate_to_diary_main()
+            self.macro.browser_manager.navigate_to_diary_detail_from_main()
+
+            try:
+                self.sync_from_browser()
+            except PayloadShapeError as e:
+                logger.log_message(f"⚠️ {e} - 브라우저 방식으로 전체 기간을 처리합니다.")
+                self.get_browser_fallback().process_weeks(week_ranges)
+                with self.stats_lock:
+                    self.stats["fallback"] += len(week_ranges)
+                return
+
+            for current_week, (week_start_str, week_end_str) in enumerate(week_ranges, start=1):
+                logger.log_message(f"\n📅 진행률: {current_week}/{len(week_ranges)} ({week_start_str} ~ {week_end_str})")
+                self.process_week(week_start_str, week_end_str)
+
+                # 서버 부하 방지를 위한 대기
+                time.sleep(Config.HTTP_SUBMIT_DELAY)
+
+            logger.log_message("모든 영농일지 등록 완료!")
+
+        except Exception as e:
+            logger.log_message(f"HTTP 매크로 실행 중 오류 발생: {e}")
+        finally:
+            self.print_report()
+            if self.session:
+                self.session.close()
+            self.macro.browser_manager.cleanup_and_exit()
+
+    def create_session(self):
+        """연결 풀과 재시도를 설정한 requests.Session을 만듭니다."""
+        session = requests.Session()
+        retry = Retry(
+            total=Config.HTTP_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),  # 저장(POST)은 중복 저장을 막기 위해 재시도하지 않음
+        )
+        adapter = HTTPAdapter(pool_connections=Config.HTTP_POOL_SIZE, pool_maxsize=Config.HTTP_POOL_SIZE, max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def sync_from_browser(self):
+        """브라우저의 로그인 쿠키와 작성 폼 구성을 HTTP 세션으로 가져옵니다.
+
+        Raises:
+            PayloadShapeError: 작성 폼에 DIARY_FORM_FIELDS 중 없는 필드가 있을 때
+        """
+        driver = self.macro.browser_manager.get_driver()
+        schema = driver.execute_script(FORM_SCHEMA_SCRIPT)
+        if not schema:
+            raise PayloadShapeError("작성 폼을 찾을 수 없습니다")
+
+        page_fields = set(schema["fields"])
+        removed = set(DIARY_FORM_FIELDS) - page_fields
+        if removed:
+            raise PayloadShapeError(f"작성 폼 구성이 바뀌었습니다 (없는 필드: {', '.join(sorted(removed))})")
+        added = page_fields - set(DIARY_FORM_FIELDS) - set(DIARY_LIST_FIELDS)
+        if added:
+            print(f"ℹ️ 작성 폼의 추가 필드는 페이지 기본값으로 함께 보냅니다: {', '.join(sorted(added))}")
+
+        crops = [option for option in schema["crops"] if option["value"]]
+        self.crop_option = next((option for option in crops if Config.CROP_TYPE in option["text"]), None)
+        if not self.crop_option and crops:
+            self.crop_option = crops[0]
+        if not self.crop_option:
+            raise PayloadShapeError("품목 목록을 찾을 수 없습니다")
+        self.form_defaults = schema["fields"]
+
+        # 일괄 저장 중에는 다른 스레드가 기존 세션으로 요청 중일 수 있으므로 쿠키 저장소를 비우지 않고
+        # 새 세션을 모두 채운 뒤 한 번에 교체 (기존 세션의 진행 중인 요청은 그대로 끝남)
+        session = self.create_session()
+        session.headers.update({
+            'User-Agent': driver.execute_script("return navigator.userAgent;"),
+            'X-Requested-With': 'XMLHttpRequest',
+            'Referer': Config.DIARY_DETAIL_URL,
+        })
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        previous_session, self.session = self.session, session
+        if previous_session is not None:
+            # 유휴 연결만 닫힘 (사용 중인 연결은 요청이 끝난 뒤 정리)
+            previous_session.close()
+        print(f"🍪 브라우저 쿠키 {len(session.cookies)}개를 HTTP 세션으로 복사했습니다. (품목: {self.crop_option['text']})")
+
+    def resync_session(self):
+        """HTTP 세션이 만료되면 브라우저로 다시 로그인하고 쿠키를 가져옵니다."""
+        print("🔄 HTTP 세션 만료 - 브라우저로 다시 로그인합니다...")
+        self.macro.browser_manager.login()
+        self.macro.browser_manager.navigate_to_diary_main()
+        self.macro.browser_manager.navigate_to_diary_detail_from_main()
+        self.sync_from_browser()
+
+    def get_browser_fallback(self):
+        if self.browser_fallback is None:
+            self.browser_fallback = DiaryTabMultiplexer(tab_count=1, macro=self.macro)
+        return self.browser_fallback
+
+    def process_week(self, start_date, end_date):
+        """한 주를 HTTP로 저장하고, 세션 만료 시 한 번 재시도하며, 형식이 다르면 브라우저로 처리합니다.
+
+        Returns:
+            str: 'success', 'fallback' 또는 'failed'
+        """
+        logger = self.macro.logger_manager
+        for attempt in range(2):
+            try:
+                started = time.perf_counter()
+                task_name = self.submit_week(start_date, end_date)
+                elapsed = time.perf_counter() - started
+                with self.stats_lock:
+                    self.stats["success"] += 1
+                    self.stats["latencies"].append(elapsed)
+                logger.log_message(f"✅ {start_date} ~ {end_date} {task_name} 영농일지 등록 완료 ({elapsed:.2f}초)")
+                return 'success'
+            except SessionExpiredError:
+                if attempt == 0:
+                    try:
+                        self.resync_session()
+                        continue
+                    except Exception as e:
+                        logger.log_message(f"⚠️ 다시 로그인 실패: {e}")
+                break
+            except (PayloadShapeError, TransientSubmitError, requests.RequestException) as e:
+                # 저장 요청 전(목록/날씨 조회)의 실패와 서버가 일시적 실패라고 답한 저장만 여기로 옴
+                # 결과를 알 수 없는 저장 요청 실패는 SaveRequestError로 아래에서 실패 처리
+                logger.log_message(f"⚠️ {start_date} ~ {end_date} HTTP 저장 불가 ({e}) - 브라우저 방식으로 처리합니다.")
+                break
+            except Exception as e:
+                with self.stats_lock:
+                    self.stats["failed"] += 1
+                logger.log_message(f"❌ {start_date} ~ {end_date} 등록 실패: {e}")
+                return 'failed'
+
+        # 브라우저 방식으로 대신 처리
+        with self.stats_lock:
+            self.stats["fallback"] += 1
+        self.get_browser_fallback().process_weeks([(start_date, end_date)])
+        return 'fallback'
+
+    def submit_week(self, start_date, end_date):
+        """필지/품종/작업단계/날씨를 조회하고 영농일지를 저장합니다.
+
+        Returns:
+            str: 등록한 작업명
+        """
+        crop_code = self.crop_option["value"]
+        lands = self.get_list(Config.DIARY_LAND_LIST_URL, {'cropCode': crop_code})
+        land_codes = [item['code'] for item in lands]
+        scrops = self.get_list(Config.DIARY_SCROP_LIST_URL, {'cropCode': crop_code, 'landCode': land_codes})
+        scrop_codes = [item['code'] for item in scrops]
+        tasks = self.get_list(Config.DIARY_TASK_LIST_URL, {'cropCode': crop_code, 'scropCode': scrop_codes})
+        weather = self.request_json('GET', Config.DIARY_WEATHER_URL, params={'date': start_date})
+        if not land_codes or not scrop_codes:
+            raise Exception("필지 또는 품종 목록이 비어 있습니다")
+
+        task_options = [{"text": item['name'].strip(), "value": item['code']} for item in tasks]
+        task_option, task_name = choose_task_option(self.macro.schedule_processor, start_date, task_options)
+        content = self.macro.content_generator.generate_diary_content(
+            task_name, Config.CROP_TYPE, Config.USE_GPT, start_date
+        )
+        if not content:
+            raise Exception("작업 내용 생성 실패")
+
+        payload = self.build_payload(
+            start_date, end_date, land_codes, scrop_codes, task_option["value"], content, weather,
+            build_additional_field_values(task_option["text"]),
+        )
+        result = self.request_json('POST', Config.DIARY_SAVE_URL, data=payload)
+        if result.get('result') != 'success':
+            message = result.get('message', '알 수 없는 응답')
+            if any(keyword in message for keyword in Config.TRANSIENT_SAVE_MESSAGES):
+                raise TransientSubmitError(f"영농일지 저장 실패: {message}")
+            raise Exception(f"영농일지 저장 실패: {message}")
+        return task_option["text"]
+
+    def build_payload(self, start_date, end_date, land_codes, scrop_codes, task_code, memo, weather,
+                      additional_fields=None):
+        """upsert_diary가 보내는 것과 같은 폼 payload를 만듭니다. (필지/품종은 같은 이름으로 여러 번 전송)
+
+        additional_fields는 작업 단계별 추가 필드 값입니다. (수확량 amount3, 파종량 amount2, 단위 unit, 이앙 perPyeongAmount/seedbedAmount)
+        작성 페이지에만 있는 추가 필드는 DIARY_FORM_FIELDS 뒤에 페이지 기본값으로 붙입니다.
+        """
+        fields = dict(self.form_defaults)
+        fields.update(additional_fields or {})
+        fields.update({
+            'startDate': start_date,
+            'endDate': end_date,
+            'cropCode': self.crop_option["value"],
+            'taskCode': task_code,
+            'memo': memo,
+        })
+        for response_key, field in WEATHER_FIELDS.items():
+            if weather.get(response_key) is not None:
+                fields[field] = weather[response_key]
+
+        payload = [(name, fields.get(name, '')) for name in DIARY_FORM_FIELDS]
+        payload += [
+            (name, value) for name, value in self.form_defaults.items()
+            if name not in DIARY_FORM_FIELDS and name not in DIARY_LIST_FIELDS
+        ]
+        payload += [('landCode', code) for code in land_codes]
+        payload += [('scropCode', code) for code in scrop_codes]
+        return payload
+
+    def get_list(self, url, params):
+        """목록 XHR을 호출해 [{"code", "name"}] 목록을 돌려줍니다."""
+        data = self.request_json('GET', url, params=params)
+        items = data.get('list')
+        if data.get('result') != 'success' or not isinstance(items, list):
+            raise PayloadShapeError(f"목록 응답 형식이 다릅니다: {url}")
+        if any(not isinstance(item, dict) or 'code' not in item or 'name' not in item for item in items):
+            raise PayloadShapeError(f"목록 항목 형식이 다릅니다: {url}")
+        return items
+
+    def request_json(self, method, url, **kwargs):
+        """요청을 보내고 JSON 응답을 돌려줍니다.
+
+        Raises:
+            SessionExpiredError: 401 응답 또는 로그인 페이지로 이동된 경우
+            TransientSubmitError: 조회 요청(GET)의 429/5xx 응답
+            PayloadShapeError: JSON이 아닌 응답
+            SaveRequestError: 저장 요청(POST)의 연결 오류/시간 초과/429/5xx/JSON이 아닌 응답
+        """
+        if self.rate_limiter:
+            self.rate_limiter.wait()
+        with self.stats_lock:
+            self.stats["http_calls"] += 1
+        try:
+            response = self.session.request(method, url, timeout=Config.HTTP_TIMEOUT, **kwargs)
+        except requests.RequestException as e:
+            if method == 'POST':
+                # 서버가 이미 저장했을 수 있으므로 저장 요청은 재시도/브라우저 처리 대상에서 제외
+                raise SaveRequestError(f"저장 요청 실패 (중복 저장 방지를 위해 재시도하지 않음): {e}")
+            raise
+        if response.status_code == 401 or 'mberLoginForm' in response.url:
+            raise SessionExpiredError("세션이 만료되었습니다")
+        if response.status_code == 429 or response.status_code >= 500:
+            if method == 'POST':
+                # 오류 응답이어도 저장이 끝났을 수 있으므로 다시 보내지 않음 (서버가 일시적 실패라고 답한 경우만 재시도)
+                raise SaveRequestError(f"저장 요청 서버 응답 {response.status_code} (중복 저장 방지를 위해 재시도하지 않음)")
+            raise TransientSubmitError(f"서버 응답 {response.status_code}: {url}")
+        try:
+            data = response.json()
+        except ValueError:
+            if method == 'POST':
+                raise SaveRequestError(f"저장 응답을 확인할 수 없습니다 ({response.status_code}, 중복 저장 방지를 위해 재시도하지 않음)")
+            raise PayloadShapeError(f"JSON이 아닌 응답 ({response.status_code}): {url}")
+        if not isinstance(data, dict):
+            if method == 'POST':
+                raise SaveRequestError("저장 응답 형식이 다릅니다 (중복 저장 방지를 위해 재시도하지 않음)")
+            raise PayloadShapeError(f"응답 형식이 다릅니다: {url}")
+        return data
+
+    def get_report(self):
+        """처리 결과와 일지당 지연 시간 통계를 반환합니다."""
+        with self.stats_lock:
+            stats = dict(self.stats)
+            latencies = sorted(self.stats["latencies"])
+        return {
+            "success": stats["success"],
+            "failed": stats["failed"],
+            "fallback": stats["fallback"],
+            "http_calls": stats["http_calls"],
+            "avg_seconds": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50_seconds": latencies[len(latencies) // 2] if latencies else 0.0,
+            "max_seconds": latencies[-1] if latencies else 0.0,
+        }
+
+    def print_report(self):
+        """처리 결과를 출력합니다."""
+        report = self.get_report()
+        self.macro.logger_manager.log_message(
+            f"\n📈 HTTP 모드 결과: 완료 {report['success']}, 실패 {report['failed']}, 브라우저 처리 {report['fallback']} | "
+            f"일지당 평균 {report['avg_seconds']:.2f}초 (p50 {report['p50_seconds']:.2f}초, 최대 {report['max_seconds']:.2f}초) | "
+            f"HTTP 요청 {report['http_calls']}회"
+        )
@@ -0,0 +1,576 @@
+import time
+import random
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'config'))
+
+from main.agrion_macro_refactored import AgrionMacroRefactored
+from config.settings import Config
+from additional_fields import build_additional_field_values
+from selenium.common.exceptions import WebDriverException
+
+
+# 작업단계 목록에서 제외할 작업들
+EXCLUDED_TASK_KEYWORDS = ["출하/판매작업", "병해충 피해"]
+
+# 기본 관리 일지에 우선 사용할 작업단계
+BASIC_TASK_KEYWORDS = ["기타작업", "비료작업", "관찰"]
+
+# 페이지의 XHR/fetch 진행 상태를 추적하는 추적기 설치 코드 (페이지마다 한 번만 설치됨)
+AJAX_TRACKER_INSTALL_JS = """
+if (!window.__agrionAjaxTracker) {
+    var tracker = window.__agrionAjaxTracker = {pending: 0};
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        tracker.pending++;
+        this.addEventListener('loadend', function () { tracker.pending--; });
+        return originalSend.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            tracker.pending++;
+            return originalFetch.apply(this, arguments).finally(function () { tracker.pending--; });
+        };
+    }
+}
+function agrionPendingRequests() {
+    return window.__agrionAjaxTracker.pending + ((window.jQuery && window.jQuery.active) || 0);
+}
+"""
+
+# datepicker API로 날짜를 설정하고 사이트가 의존하는 onSelect/change 훅을 직접 호출합니다.
+DATEPICKER_JS = """
+function agrionSetPickerDate(id, dateText) {
+    var $ = window.jQuery;
+    var input = document.getElementById(id);
+    if (!input || !$ || !$(input).datepicker) {
+        return null;
+    }
+    var parts = dateText.split('-');
+    $(input).datepicker('setDate', new Date(+parts[0], +parts[1] - 1, +parts[2]));
+    var onSelect = $(input).datepicker('option', 'onSelect');
+    if (typeof onSelect === 'function') {
+        var inst = $.datepicker && $.datepicker._getInst ? $.datepicker._getInst(input) : undefined;
+        onSelect.call(input, input.value, inst);
+    }
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+    var date = $(input).datepicker('getDate');
+    if (!date) {
+        return null;
+    }
+    function pad(number) { return (number < 10 ? '0' : '') + number; }
+    return date.getFullYear() + '-' + pad(date.getMonth() + 1) + '-' + pad(date.getDate());
+}
+"""
+
+# 1단계: 날짜와 품목을 설정해 필지 목록 요청을 보냅니다. (응답은 기다리지 않음)
+TAB_PREPARE_SCRIPT = AJAX_TRACKER_INSTALL_JS + DATEPICKER_JS + """
+var startDate = arguments[0], endDate = arguments[1], cropType = arguments[2];
+if (agrionSetPickerDate('now_date_s', startDate) !== startDate ||
+        agrionSetPickerDate('now_date_e', endDate) !== endDate) {
+    return {ok: false, stage: '날짜'};
+}
+var cropSelect = document.getElementById('selectCrops');
+var cropOption = null;
+for (var i = 0; i < cropSelect.options.length; i++) {
+    var option = cropSelect.options[i];
+    if (option.value && option.text.indexOf(cropType) >= 0) { cropOption = option; break; }
+    if (option.value && !cropOption) { cropOption = option; }
+}
+if (!cropOption) {
+    return {ok: false, stage: '품목'};
+}
+cropSelect.value = cropOption.value;
+cropSelect.dispatchEvent(new Event('change', {bubbles: true}));
+return {ok: true, crop: cropOption.text};
+"""
+
+# 진행 중인 요청이 없고 selector에 해당하는 요소가 나타났는지 확인합니다. (탭 전환 후 한 번 호출)
+TAB_CASCADE_READY_SCRIPT = AJAX_TRACKER_INSTALL_JS + """
+return agrionPendingRequests() === 0 && document.querySelectorAll(arguments[0]).length > 0;
+"""
+
+# selector에 해당하는 체크박스를 모두 체크해 다음 목록 요청을 보냅니다.
+TAB_CHECK_ALL_SCRIPT = """
+var boxes = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < boxes.length; i++) {
+    if (!boxes[i].checked) {
+        boxes[i].click();
+    }
+}
+return boxes.length;
+"""
+
+# 작업단계 옵션 목록과 날씨 정보를 한 번에 읽어옵니다.
+TAB_TASK_SNAPSHOT_SCRIPT = """
+function value(id) {
+    var element = document.getElementById(id);
+    return element ? element.value : '';
+}
+var options = document.querySelectorAll('#selectTask option');
+var tasks = [];
+for (var i = 0; i < options.length; i++) {
+    tasks.push({text: options[i].text.trim(), value: options[i].value});
+}
+return {
+    tasks: tasks,
+    weather: {
+        weather: value('wfKor'),
+        low_temp: value('low_temp'),
+        high_temp: value('high_temp'),
+        rainfall: value('r12'),
+        humidity: value('reh')
+    }
+};
+"""
+
+# 작업단계, 작업 단계별 추가 필드(수확량/파종량/모판 수 등), 작업 내용을 입력하고 입력된 값을 돌려줍니다.
+TAB_FILL_SCRIPT = """
+function fire(element, eventName) {
+    element.dispatchEvent(new Event(eventName, {bubbles: true}));
+}
+var taskSelect = document.getElementById('selectTask');
+taskSelect.value = arguments[0];
+fire(taskSelect, 'change');
+var fields = arguments[2] || {};
+var missing = [];
+Object.keys(fields).forEach(function (id) {
+    var field = document.getElementById(id);
+    if (!field) {
+        missing.push(id);
+        return;
+    }
+    field.value = fields[id];
+    fire(field, 'input');
+    fire(field, 'change');
+});
+var memoInput = document.getElementById('memo');
+memoInput.value = arguments[1];
+['input', 'change', 'keyup'].forEach(function (eventName) { fire(memoInput, eventName); });
+return {
+    task: taskSelect.selectedIndex >= 0 ? taskSelect.options[taskSelect.selectedIndex].text.trim() : '',
+    memo: memoInput.value,
+    missing: missing
+};
+"""
+
+# 저장 버튼을 누릅니다.
+# 네이티브 확인창/알럿은 탭 전환을 막으므로 이 탭의 confirm/alert를 기록용 함수로 바꿔 둡니다. (페이지 이동 시 원래대로 돌아옴)
+TAB_SAVE_SCRIPT = """
+window.__agrionDialogs = [];
+window.confirm = function (message) {
+    window.__agrionDialogs.push({type: 'confirm', message: String(message)});
+    return true;
+};
+window.alert = function (message) {
+    window.__agrionDialogs.push({type: 'alert', message: String(message)});
+};
+var button = document.getElementById('upsert_diary');
+if (!button) {
+    return false;
+}
+button.click();
+return true;
+"""
+
+# 저장 결과 알럿이 기록되었는지 확인합니다. 이미 새 페이지로 이동했으면 navigated를 돌려줍니다.
+TAB_SAVE_RESULT_SCRIPT = """
+var dialogs = window.__agrionDialogs;
+if (!dialogs) {
+    return {navigated: true};
+}
+for (var i = 0; i < dialogs.length; i++) {
+    if (dialogs[i].type === 'alert') {
+        return {message: dialogs[i].message};
+    }
+}
+return null;
+"""
+
+# 저장 후 새 작성 페이지가 다시 준비되었는지 확인합니다.
+TAB_PAGE_RELOADED_SCRIPT = """
+return document.readyState === 'complete' && !window.__agrionDialogs &&
+    location.pathname.indexOf('diaryDetail.do') >= 0 && !!document.getElementById('now_date_s');
+"""
+
+
+def choose_task_option(schedule_processor, start_date, task_options, week_plan=None):
+    """스케줄과 작업단계 목록으로 선택할 옵션과 내용 생성에 쓸 작업명을 정합니다.
+
+    Args:
+        schedule_processor (ScheduleProcessor): 스케줄 처리기
+        start_date (str): 주 시작일 (YYYY-MM-DD)
+        task_options (list): [{"text", "value"}, ...] 작업단계 옵션 목록
+        week_plan (dict): 미리 고른 {"schedule_task", "memo_task"} (있으면 스케줄 작업을 다시 고르지 않음)
+
+    Returns:
+        tuple: (작업단계 옵션 {"text", "value"}, 작업명)
+    """
+    options = [
+        option for option in task_options
+        if option["value"] and not any(keyword in option["text"] for keyword in EXCLUDED_TASK_KEYWORDS)
+    ]
+    if not options:
+        raise Exception("사용 가능한 작업단계가 없습니다")
+    by_text = {option["text"]: option for option in options}
+
+    if week_plan:
+        matching_tasks = [{"작업명": week_plan["schedule_task"]}] if week_plan["schedule_task"] else []
+    else:
+        matching_tasks = schedule_processor.find_matching_tasks_by_date(start_date)
+    if matching_tasks:
+        selected_task = random.choice(matching_tasks)
+        matched = schedule_processor.match_task_with_gpt(selected_task["작업명"], list(by_text))
+        if matched:
+            return by_text[matched], selected_task["작업명"]
+
+    # 해당 작업이 없으면 기본 관리 작업으로 등록 (작업 내용을 미리 만든 기본 작업단계가 있으면 우선)
+    if week_plan and week_plan["memo_task"] in by_text:
+        return by_text[week_plan["memo_task"]], week_plan["memo_task"]
+    for option in options:
+        if any(keyword in option["text"] for keyword in BASIC_TASK_KEYWORDS):
+            return option, option["text"]
+    return options[0], options[0]["text"]
+
+
+class DiaryTabMultiplexer:
+    """로그인된 브라우저 하나에 영농일지 작성 탭을 여러 개 열어 번갈아 처리하는 클래스
+
+    - 탭마다 한 주의 작성 과정을 제너레이터로 실행하고, 서버 응답(목록 XHR, 저장 결과)을 기다리는 지점에서 양보합니다.
+    - 한 탭이 응답을 기다리는 동안 switch_to.window로 다른 탭의 다음 단계를 진행합니다.
+    - 쿠키 세션을 공유하므로 로그인은 한 번이며, 브라우저 프로세스를 여러 개 띄우는 워커 풀보다 메모리를 적게 씁니다.
+    - 작업 내용은 주차를 탭에 넣을 때 스레드 풀에서 미리 생성하므로 GPT 응답을 기다리는 동안에도 다른 탭이 진행됩니다.
+    """
+
+    def __init__(self, tab_count=None, macro=None):
+        self.tab_count = max(1, tab_count or Config.TAB_COUNT)
+        self.macro = macro
+        self.tabs = []
+        self.current_handle = None
+        self.switch_count = 0
+        self.total_weeks = 0
+        self.started_at = None
+        self.memo_executor = None
+        self.memo_jobs = {}  # 주 시작일 → {"schedule_task", "memo_task", "future": 작업 내용 생성 결과}
+        self.memo_stats = {"ready": 0, "waited": 0, "fallback": 0}
+
+    def run(self):
+        """설정된 기간 전체를 멀티탭으로 처리합니다."""
+        if self.macro is None:
+            self.macro = AgrionMacroRefactored()
+        logger = self.macro.logger_manager
+        try:
+            # 시작일 자동 업데이트 시도
+            updated_start_date = self.macro.config_manager.auto_update_start_date()
+            start_date = datetime.strptime(updated_start_date, '%Y-%m-%d')
+            end_date = datetime.strptime(Config.END_DATE, '%Y-%m-%d')
+            week_ranges = AgrionMacroRefactored.build_week_ranges(start_date, end_date)
+            logger.log_message(
+                f"🚀 멀티탭 모드 시작: {start_date.strftime('%Y-%m-%d')} ~ {Config.END_DATE}, "
+                f"{len(week_ranges)}주, 탭 {min(self.tab_count, len(week_ranges))}개"
+            )
+
+            # 로그인 후 첫 번째 탭을 작성 페이지로 이동
+            self.macro.browser_manager.login()
+            self.macro.browser_manager.navigate_to_diary_main()
+            self.macro.browser_manager.navigate_to_diary_detail_from_main()
+
+            self.process_weeks(week_ranges)
+            logger.log_message("모든 영농일지 등록 완료!")
+
+        except Exception as e:
+            logger.log_message(f"멀티탭 매크로 실행 중 오류 발생: {e}")
+        finally:
+            self.print_tab_report()
+            self.macro.browser_manager.cleanup_and_exit()
+
+    def process_weeks(self, week_ranges):
+        """주차 목록을 탭들에 나눠 번갈아 처리합니다.
+
+        Args:
+            week_ranges (list): [(주 시작일, 주 종료일), ...]
+        """
+        pending_weeks = deque(week_ranges)
+        self.total_weeks = len(week_ranges)
+        self.open_tabs(min(self.tab_count, len(pending_weeks)))
+        self.started_at = time.perf_counter()
+        self.memo_executor = ThreadPoolExecutor(
+            max_workers=max(1, Config.TAB_MEMO_WORKERS), thread_name_prefix='agrion-tab-memo',
+        )
+
+        try:
+            for tab in self.tabs:
+                self._start_next_week(tab, pending_weeks)
+
+            while any(tab["job"] for tab in self.tabs):
+                progressed = False
+                for tab in self.tabs:
+                    if tab["job"]:
+                        progressed = self._step(tab, pending_weeks) or progressed
+                if not progressed:
+                    # 모든 탭이 서버 응답(또는 작업 내용 생성)을 기다리는 중
+                    time.sleep(Config.TAB_POLL_INTERVAL)
+        finally:
+            self.memo_executor.shutdown(wait=False, cancel_futures=True)
+
+    def open_tabs(self, tab_count):
+        """현재 탭(작성 페이지)에 더해 작성 페이지 탭을 tab_count개까지 엽니다."""
+        driver = self.macro.browser_manager.get_driver()
+        self.current_handle = driver.current_window_handle
+        self.tabs = [self._new_tab_state(1, self.current_handle)]
+
+        for index in range(2, tab_count + 1):
+            driver.switch_to.new_window('tab')
+            self.current_handle = driver.current_window_handle
+            self.macro.browser_manager.navigate_to_diary_detail()
+            self.tabs.append(self._new_tab_state(index, self.current_handle))
+
+        print(f"🗂️ 영농일지 작성 탭 {len(self.tabs)}개 준비 완료")
+
+    def _new_tab_state(self, index, handle):
+        return {
+            "index": index,
+            "handle": handle,
+            "job": None,       # 진행 중인 주차 작성 제너레이터
+            "wait": None,      # 제너레이터가 기다리는 조건
+            "week": None,
+            "week_started": None,
+            "weeks": 0,
+            "success": 0,
+            "failed": 0,
+            "busy_seconds": 0.0,
+        }
+
+    def _switch_to(self, tab):
+        """필요할 때만 탭을 전환합니다. (전환도 WebDriver 왕복 1회)"""
+        if self.current_handle != tab["handle"]:
+            self.macro.browser_manager.get_driver().switch_to.window(tab["handle"])
+            self.current_handle = tab["handle"]
+            self.switch_count += 1
+
+    def _start_next_week(self, tab, pending_weeks):
+        if not pending_weeks:
+            tab["job"] = None
+            tab["wait"] = None
+            return
+        tab["week"] = pending_weeks.popleft()
+        tab["week_started"] = time.perf_counter()
+        # 이 주차와 뒤이어 탭에 들어갈 주차들의 작업 내용을 미리 생성
+        for week in [tab["week"]] + list(pending_weeks)[:self.tab_count]:
+            self._queue_memo(*week)
+        tab["job"] = self._week_job(tab["index"], *tab["week"])
+        tab["wait"] = None
+
+    def _queue_memo(self, start_date, end_date):
+        """주차의 스케줄 작업을 미리 고르고 작업 내용 생성을 스레드 풀에 맡깁니다."""
+        if start_date in self.memo_jobs:
+            return
+        matching_tasks = self.macro.schedule_processor.find_matching_tasks_by_date(start_date)
+        schedule_task = random.choice(matching_tasks)["작업명"] if matching_tasks else None
+        # 해당 작업이 없는 주는 첫 번째 기본 관리 작업단계의 내용을 만들어 둠
+        memo_task = schedule_task or BASIC_TASK_KEYWORDS[0]
+        self.memo_jobs[start_date] = {
+            "schedule_task": schedule_task,
+            "memo_task": memo_task,
+            "future": self.memo_executor.submit(
+                self.macro.content_generator.generate_diary_content,
+                memo_task, Config.CROP_TYPE, Config.USE_GPT, start_date,
+            ),
+        }
+
+    def _step(self, tab, pending_weeks):
+        """탭의 대기 조건이 충족되었으면 다음 단계를 진행합니다.
+
+        Returns:
+            bool: 진행했으면 True, 아직 서버 응답을 기다리는 중이면 False
+        """
+        self._switch_to(tab)
+        driver = self.macro.browser_manager.get_driver()
+        wait = tab["wait"]
+        value = None
+
+        if wait:
+            if "future" in wait:
+                # 작업 내용 생성 대기는 브라우저를 거치지 않음
+                value = wait["future"] if wait["future"].done() else None
+            else:
+                try:
+                    value = driver.execute_script(wait["script"], *wait["args"])
+                except WebDriverException:
+                    value = None  # 페이지 이동 중에는 스크립트를 실행할 수 없음
+            if not value:
+                if time.perf_counter() < wait["deadline"]:
+                    return False
+                if not wait.get("optional"):
+                    self._finish_week(tab, pending_weeks, 'failed', f"{wait['label']} 대기 시간 초과")
+                    return True
+
+        try:
+            tab["wait"] = tab["job"].send(value)
+            tab["wait"]["deadline"] = time.perf_counter() + tab["wait"].get("timeout", Config.TAB_WAIT_TIMEOUT)
+        except StopIteration:
+            self._finish_week(tab, pending_weeks, 'success')
+        except Exception as e:
+            self._finish_week(tab, pending_weeks, 'failed', e)
+        return True
+
+    def _wait_for(self, label, script, *args):
+        """제너레이터가 양보할 대기 조건을 만듭니다."""
+        return {"label": label, "script": script, "args": args}
+
+    def _wait_for_reload(self):
+        """저장 후 새 작성 페이지를 기다리는 조건 (시간 초과면 None을 받아 다음 주차 전에 작성 페이지를 다시 엶)"""
+        wait = self._wait_for("작성 페이지 재로딩", TAB_PAGE_RELOADED_SCRIPT)
+        wait["optional"] = True
+        return wait
+
+    def _wait_for_memo(self, future):
+        """작업 내용 생성이 끝나기를 기다리는 조건 (시간 초과면 None을 받아 GPT 없이 작성)"""
+        return {"label": "작업 내용 생성", "future": future, "optional": True, "timeout": Config.TAB_MEMO_TIMEOUT}
+
+    def _take_memo(self, job, done_future, task_name, start_date):
+        """미리 생성한 작업 내용을 가져오고, 없거나 다른 작업명으로 만든 내용이면 GPT 없이 작성합니다."""
+        content = None
+        if done_future is not None:
+            try:
+                content = done_future.result()
+            except Exception as e:
+                print(f"⚠️ {start_date} 작업 내용 미리 생성 실패: {e}")
+        elif task_name == job["memo_task"]:
+            self.macro.logger_manager.log_message(
+                f"⚠️ {start_date} 작업 내용이 {Config.TAB_MEMO_TIMEOUT:g}초 안에 생성되지 않아 GPT 없이 작성"
+            )
+        if content:
+            return content
+        self.memo_stats["fallback"] += 1
+        return self.macro.content_generator.generate_diary_content(task_name, Config.CROP_TYPE, False, start_date)
+
+    def _week_job(self, tab_index, start_date, end_date):
+        """한 주의 영농일지 작성 과정 - 서버 응답을 기다리는 지점마다 대기 조건을 양보합니다."""
+        driver = self.macro.browser_manager.get_driver()
+
+        # 1. 날짜/품목 설정 → 필지 목록 로딩 대기
+        prepared = driver.execute_script(TAB_PREPARE_SCRIPT, start_date, end_date, Config.CROP_TYPE)
+        if not prepared or not prepared.get("ok"):
+            raise Exception(f"{(prepared or {}).get('stage', '날짜/품목')} 설정 실패")
+        yield self._wait_for("필지 목록", TAB_CASCADE_READY_SCRIPT, "#checkLand input[type='checkbox']")
+
+        # 2. 필지 전체 선택 → 품종 목록 로딩 대기
+        driver.execute_script(TAB_CHECK_ALL_SCRIPT, "#checkLand input[type='checkbox']")
+        yield self._wait_for("품종 목록", TAB_CASCADE_READY_SCRIPT, "#checkScrop input[type='checkbox']")
+
+        # 3. 품종 전체 선택 → 작업단계 목록 로딩 대기
+        driver.execute_script(TAB_CHECK_ALL_SCRIPT, "#checkScrop input[type='checkbox']")
+        yield self._wait_for("작업단계 목록", TAB_CASCADE_READY_SCRIPT, "#selectTask option:not([value=''])")
+
+        # 4. 작업단계 선택, 추가 필드와 작업 내용 입력 (작업 내용은 주차를 넣을 때 생성 시작)
+        job = self.memo_jobs.pop(start_date)
+        snapshot = driver.execute_script(TAB_TASK_SNAPSHOT_SCRIPT)
+        task_option, task_name = choose_task_option(self.macro.schedule_processor, start_date, snapshot["tasks"], job)
+        done_future = None
+        # 미리 만든 내용은 같은 작업명(스케줄 작업명 또는 기본 작업단계)으로 등록할 때만 사용
+        if task_name == job["memo_task"]:
+            if job["future"].done():
+                self.memo_stats["ready"] += 1
+                done_future = job["future"]
+            else:
+                done_future = yield self._wait_for_memo(job["future"])
+                if done_future is not None:
+                    self.memo_stats["waited"] += 1
+        content = self._take_memo(job, done_future, task_name, start_date)
+        additional_fields = build_additional_field_values(task_option["text"])
+        filled = driver.execute_script(TAB_FILL_SCRIPT, task_option["value"], content, additional_fields)
+        if filled["memo"] != content:
+            raise Exception("작업 내용 입력 실패")
+        if filled["missing"]:
+            print(f"⚠️ [탭 {tab_index}] 추가 필드를 찾을 수 없습니다: {', '.join(filled['missing'])}")
+        print(f"📝 [탭 {tab_index}] {start_date} 작업단계: {filled['task']}")
+
+        # 5. 저장 → 결과 알럿 대기
+        if not driver.execute_script(TAB_SAVE_SCRIPT):
+            raise Exception("저장 버튼을 찾을 수 없습니다")
+        result = yield self._wait_for("저장 결과", TAB_SAVE_RESULT_SCRIPT)
+        message = result.get("message")
+        if message is not None and not any(keyword in message for keyword in Config.SAVE_SUCCESS_MESSAGES):
+            raise Exception(f"영농일지 저장 실패: {message}")
+
+        # 6. 저장 후 새 작성 페이지 로딩 대기 (저장은 확인되었으므로 시간 초과여도 성공으로 기록하고 작성 페이지만 다시 엶)
+        reloaded = yield self._wait_for_reload()
+        if not reloaded:
+            print(f"⚠️ [탭 {tab_index}] 저장 후 작성 페이지가 다시 로드되지 않아 새로 엽니다")
+            try:
+                self.macro.browser_manager.navigate_to_diary_detail()
+            except Exception as e:
+                self.macro.logger_manager.log_message(f"⚠️ [탭 {tab_index}] 작성 페이지 재진입 실패: {e}")
+
+    def _finish_week(self, tab, pending_weeks, result, error=None):
+        """탭의 주차 처리 결과를 기록하고 다음 주차를 시작합니다."""
+        start_date, end_date = tab["week"]
+        self.memo_jobs.pop(start_date, None)
+        elapsed = time.perf_counter() - tab["week_started"]
+        tab["weeks"] += 1
+        tab[result] += 1
+        tab["busy_seconds"] += elapsed
+
+        logger = self.macro.logger_manager
+        if result == 'success':
+            logger.log_message(f"✅ [탭 {tab['index']}] {start_date} ~ {end_date} 영농일지 등록 완료 ({elapsed:.1f}초)")
+        else:
+            logger.log_message(f"❌ [탭 {tab['index']}] {start_date} ~ {end_date} 등록 실패: {error}")
+            # 작성 페이지를 다시 열어 다음 주차를 깨끗한 상태에서 시작
+            try:
+                self.macro.browser_manager.navigate_to_diary_detail()
+            except Exception as e:
+                logger.log_message(f"⚠️ [탭 {tab['index']}] 작성 페이지 재진입 실패: {e}")
+
+        done = sum(item["weeks"] for item in self.tabs)
+        logger.log_message(f"📊 진행률: {done}/{self.total_weeks} ({done / self.total_weeks * 100:.1f}%)")
+
+        self._start_next_week(tab, pending_weeks)
+
+    def get_tab_report(self):
+        """탭별 처리량 통계를 반환합니다.
+
+        Returns:
+            dict: {"tabs": [{"index", "weeks", "success", "failed", "avg_seconds"}, ...],
+                   "weeks", "elapsed", "per_hour", "switches", "memo"}
+        """
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        weeks = sum(tab["weeks"] for tab in self.tabs)
+        return {
+            "tabs": [
+                {
+                    "index": tab["index"],
+                    "weeks": tab["weeks"],
+                    "success": tab["success"],
+                    "failed": tab["failed"],
+                    "avg_seconds": tab["busy_seconds"] / tab["weeks"] if tab["weeks"] else 0.0,
+                }
+                for tab in self.tabs
+            ],
+            "weeks": weeks,
+            "elapsed": elapsed,
+            "per_hour": weeks / elapsed * 3600 if elapsed > 0 else 0.0,
+            "switches": self.switch_count,
+            "memo": dict(self.memo_stats),
+        }
+
+    def print_tab_report(self):
+        """탭별 처리량과 전체 처리량을 출력합니다."""
+        if not self.tabs:
+            return
+        report = self.get_tab_report()
+        logger = self.macro.logger_manager
+        logger.log_message("\n📈 탭별 처리량")
+        for tab in report["tabs"]:
+            logger.log_message(f"   탭 {tab['index']}: {tab['weeks']}주 (완료 {tab['success']}, 실패 {tab['failed']}) | "
+                               f"주당 평균 {tab['avg_seconds']:.1f}초")
+        logger.log_message(f"   전체: {report['weeks']}주, {report['elapsed'] / 60:.1f}분, "
+                           f"시간당 {report['per_hour']:.1f}건, 탭 전환 {report['switches']}회")
+        logger.log_message(f"   작업 내용: 바로 사용 {report['memo']['ready']}주, 대기 후 사용 {report['memo']['waited']}주, "
+                           f"GPT 없이 작성 {report['memo']['fallback']}주")
@@ -0,0 +1,237 @@
+import time
+import queue
+import random
+import threading
+from datetime import datetime
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from core.logger_manager import LoggerManager
+from core.config_manager import ConfigManager
+from main.agrion_macro_refactored import AgrionMacroRefactored
+from config.settings import Config
+
+
+class DiaryWorkerPool:
+    """여러 브라우저 세션으로 전체 기간의 영농일지를 나눠 등록하는 코디네이터
+
+    - 전체 주차 목록을 WORKER_SHARD_WEEKS 단위 묶음(shard)으로 나눠 공유 큐에 넣습니다.
+    - 워커마다 자신의 BrowserManager/LoggerManager와 로그인 세션을 가지고 큐에서 묶음을 가져갑니다.
+    - 빨리 끝난 워커가 다음 묶음을 가져가므로 워커 간 작업량이 자동으로 맞춰집니다.
+    """
+
+    def __init__(self, worker_count=None, shard_weeks=None):
+        self.worker_count = max(1, worker_count or Config.WORKER_COUNT)
+        self.shard_weeks = max(1, shard_weeks or Config.WORKER_SHARD_WEEKS)
+        self.logger_manager = LoggerManager(suffix="pool")
+        self.config_manager = ConfigManager(self.logger_manager)
+
+        self.shard_queue = queue.Queue()
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.macros = {}        # 워커 번호 → AgrionMacroRefactored
+        self.worker_stats = {}  # 워커 번호 → 처리 통계
+        self.total_weeks = 0
+        self.completed_weeks = 0
+        self.started_at = None
+
+    def build_shards(self, week_ranges):
+        """주차 목록을 연속된 주차 묶음으로 나눕니다."""
+        return [week_ranges[i:i + self.shard_weeks] for i in range(0, len(week_ranges), self.shard_weeks)]
+
+    def run(self):
+        """설정된 기간 전체를 워커 풀로 처리합니다."""
+        try:
+            # 시작일 자동 업데이트 시도
+            updated_start_date = self.config_manager.auto_update_start_date()
+            start_date = datetime.strptime(updated_start_date, '%Y-%m-%d')
+            end_date = datetime.strptime(Config.END_DATE, '%Y-%m-%d')
+
+            week_ranges = AgrionMacroRefactored.build_week_ranges(start_date, end_date)
+            shards = self.build_shards(week_ranges)
+            for shard in shards:
+                self.shard_queue.put(shard)
+
+            self.total_weeks = len(week_ranges)
+            worker_count = min(self.worker_count, len(shards)) or 1
+            self.logger_manager.log_message(
+                f"🚀 병렬 모드 시작: {start_date.strftime('%Y-%m-%d')} ~ {Config.END_DATE}, "
+                f"{self.total_weeks}주 → {len(shards)}개 묶음, 워커 {worker_count}개"
+            )
+
+            self.started_at = time.perf_counter()
+            threads = []
+            for worker_id in range(1, worker_count + 1):
+                thread = threading.Thread(
+                    target=self.run_worker, args=(worker_id,), name=f"agrion-worker-{worker_id}", daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+                # 워커마다 따로 로그인하므로 로그인 요청이 한꺼번에 몰리지 않게 간격을 둠
+                if worker_id < worker_count and self.stop_event.wait(Config.WORKER_START_STAGGER):
+                    break
+
+            # join(timeout)으로 대기해야 메인 스레드에서 Ctrl+C를 받을 수 있음
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(timeout=0.5)
+
+            self.logger_manager.log_message("모든 영농일지 등록 완료!")
+
+        except KeyboardInterrupt:
+            self.logger_manager.log_message("\n⚠️ 사용자에 의해 병렬 작업이 중단되었습니다. 워커를 정리합니다...")
+            self.stop_event.set()
+            self.cleanup_workers()
+            raise
+        except Exception as e:
+            self.logger_manager.log_message(f"병렬 매크로 실행 중 오류 발생: {e}")
+        finally:
+            self.print_worker_report()
+            self.logger_manager.close_log_file()
+
+    def run_worker(self, worker_id):
+        """워커 스레드 - 자신의 브라우저 세션으로 큐의 주차 묶음을 처리합니다."""
+        stats = {
+            "worker_id": worker_id,
+            "weeks": 0,
+            "success": 0,
+            "skipped": 0,
+            "failed": 0,
+            "busy_seconds": 0.0,
+            "started_at": time.perf_counter(),
+            "finished_at": None,
+            "error": None,
+        }
+        with self.lock:
+            self.worker_stats[worker_id] = stats
+
+        macro = None
+        try:
+            macro = AgrionMacroRefactored(worker_id=worker_id)
+            with self.lock:
+                self.macros[worker_id] = macro
+
+            macro.browser_manager.login()
+            macro.browser_manager.navigate_to_diary_main()
+            macro.browser_manager.navigate_to_diary_detail_from_main()
+
+            while not self.stop_event.is_set():
+                try:
+                    shard = self.shard_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                for week_start_str, week_end_str in shard:
+                    if self.stop_event.is_set():
+                        break
+
+                    macro.logger_manager.log_message(f"\n📅 [워커 {worker_id}] {week_start_str} ~ {week_end_str}")
+                    week_started = time.perf_counter()
+                    result = macro.process_week(week_start_str, week_end_str)
+                    self._record_week(stats, result, time.perf_counter() - week_started)
+
+                    # 서버 부하 방지를 위한 대기 (워커별)
+                    self.stop_event.wait(random.uniform(3, 8))
+
+        except Exception as e:
+            stats["error"] = str(e)
+            self.logger_manager.log_message(f"❌ [워커 {worker_id}] 실행 중 오류 발생: {e}")
+        finally:
+            stats["finished_at"] = time.perf_counter()
+            if macro:
+                self._cleanup_macro(macro)
+
+    def _record_week(self, stats, result, elapsed):
+        """워커 통계를 갱신하고 전체 진행률을 한 줄로 출력합니다."""
+        with self.lock:
+            stats["weeks"] += 1
+            stats[result] += 1
+            stats["busy_seconds"] += elapsed
+            self.completed_weeks += 1
+
+            elapsed_total = time.perf_counter() - self.started_at
+            percent = self.completed_weeks / self.total_weeks * 100 if self.total_weeks else 100.0
+            remaining = self.total_weeks - self.completed_weeks
+            eta = elapsed_total / self.completed_weeks * remaining if self.completed_weeks else 0
+            per_worker = ", ".join(
+                f"w{worker_id} {worker['weeks']}건" for worker_id, worker in sorted(self.worker_stats.items())
+            )
+            self.logger_manager.log_message(
+                f"📊 전체 진행률: {self.completed_weeks}/{self.total_weeks} ({percent:.1f}%) | "
+                f"{per_worker} | 남은 예상 시간 {eta / 60:.1f}분"
+            )
+
+    def _cleanup_macro(self, macro):
+        """워커 브라우저를 종료하고 로그 파일을 닫습니다.
+
+        cleanup_and_exit는 응답 없는 브라우저 프로세스를 모두 종료하므로 다른 워커에 영향이 없도록 따로 정리합니다.
+        """
+        with self.lock:
+            if macro.browser_manager.is_cleanup_done:
+                return
+            macro.browser_manager.is_cleanup_done = True
+        try:
+            macro.browser_manager.print_page_load_report()
+        except Exception:
+            pass
+        try:
+            if macro.browser_manager.driver:
+                macro.browser_manager.driver.quit()
+                macro.browser_manager.driver = None
+        except Exception as e:
+            print(f"⚠️ [워커 {macro.worker_id}] 브라우저 종료 중 오류: {e}")
+        macro.logger_manager.close_log_file()
+
+    def cleanup_workers(self):
+        """실행 중인 모든 워커의 브라우저를 정리합니다."""
+        with self.lock:
+            macros = list(self.macros.values())
+        for macro in macros:
+            self._cleanup_macro(macro)
+
+    def get_worker_report(self):
+        """워커별 처리량 통계를 반환합니다.
+
+        Returns:
+            list: [{"worker_id", "weeks", "success", "skipped", "failed", "elapsed", "avg_seconds", "per_hour", "error"}, ...]
+        """
+        now = time.perf_counter()
+        report = []
+        with self.lock:
+            for worker_id, stats in sorted(self.worker_stats.items()):
+                elapsed = (stats["finished_at"] or now) - stats["started_at"]
+                report.append({
+                    "worker_id": worker_id,
+                    "weeks": stats["weeks"],
+                    "success": stats["success"],
+                    "skipped": stats["skipped"],
+                    "failed": stats["failed"],
+                    "elapsed": elapsed,
+                    "avg_seconds": stats["busy_seconds"] / stats["weeks"] if stats["weeks"] else 0.0,
+                    "per_hour": stats["weeks"] / elapsed * 3600 if elapsed > 0 else 0.0,
+                    "error": stats["error"],
+                })
+        return report
+
+    def print_worker_report(self):
+        """워커별 처리량과 전체 처리량을 출력합니다."""
+        report = self.get_worker_report()
+        if not report:
+            return
+
+        self.logger_manager.log_message("\n📈 워커별 처리량")
+        for worker in report:
+            line = (f"   워커 {worker['worker_id']}: {worker['weeks']}주 "
+                    f"(완료 {worker['success']}, 건너뜀 {worker['skipped']}, 실패 {worker['failed']}) | "
+                    f"주당 평균 {worker['avg_seconds']:.1f}초 | 시간당 {worker['per_hour']:.1f}건")
+            if worker["error"]:
+                line += f" | 오류: {worker['error']}"
+            self.logger_manager.log_message(line)
+
+        elapsed_total = time.perf_counter() - self.started_at if self.started_at else 0
+        total_weeks = sum(worker["weeks"] for worker in report)
+        per_hour = total_weeks / elapsed_total * 3600 if elapsed_total > 0 else 0.0
+        self.logger_manager.log_message(
+            f"   전체: {total_weeks}/{self.total_weeks}주, {elapsed_total / 60:.1f}분, 시간당 {per_hour:.1f}건"
+        )
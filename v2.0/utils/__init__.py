@@ -2,9 +2,21 @@
 v2.0 Utils 모듈
 
 유틸리티 기능들을 담당하는 모듈:
+- LLMResponseCache: GPT 응답 SQLite 캐시
+- LLMCallGuard: GPT 호출 제한 시간/예비 요청/회로 차단기
+- LocalDiaryGenerator: 네트워크 없는 로컬 작업 내용 생성기
 - constants: 상수 정의
 - helpers: 헬퍼 함수들
 """
 
-# 향후 유틸리티 모듈들이 추가될 예정
-__all__ = []
+from .llm_cache import LLMResponseCache
+from .llm_guard import LLMCallGuard, LLMCallTimeout, LLMCircuitOpen
+from .local_diary_generator import LocalDiaryGenerator
+
+__all__ = [
+    'LLMResponseCache',
+    'LLMCallGuard',
+    'LLMCallTimeout',
+    'LLMCircuitOpen',
+    'LocalDiaryGenerator'
+]
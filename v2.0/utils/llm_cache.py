@@ -0,0 +1,184 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    cache_key TEXT NOT NULL,
+    variant INTEGER NOT NULL,
+    model TEXT NOT NULL,
+    crop TEXT NOT NULL,
+    temperature REAL NOT NULL,
+    prompt TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    uses INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (cache_key, variant)
+)
+"""
+
+
+class LLMResponseCache:
+    """GPT 응답을 SQLite 파일에 저장해 재실행/복구/재입력 때 API를 다시 호출하지 않게 하는 캐시
+
+    - 키는 (모델, 프롬프트, 온도 구간, 작물)의 해시이며, 키마다 응답을 최대 variants개까지 저장합니다.
+    - 저장된 응답이 variants개보다 적으면 새로 생성하고, 다 차면 가장 적게 쓴 응답을 돌려가며 사용합니다.
+    - TTL이 지난 응답은 지우고, 전체 개수가 max_entries를 넘으면 오래 쓰지 않은 것부터 지웁니다.
+    - 여러 스레드/프로세스가 같은 파일을 써도 되도록 WAL 모드와 잠금을 사용하며, 파일을 열 수 없으면 캐시 없이 동작합니다.
+    """
+
+    def __init__(self, path, max_entries=5000, ttl_seconds=30 * 24 * 60 * 60, variants=1, temperature_step=0.1):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.variants = max(1, variants)
+        self.temperature_step = temperature_step
+        self.lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "hit_seconds": 0.0,
+            "miss_seconds": 0.0,  # 캐시에 없어 API를 호출한 시간 합계
+        }
+        self.connection = self._connect()
+
+    def _connect(self):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(CREATE_TABLE_SQL)
+            connection.commit()
+            return connection
+        except Exception as e:
+            print(f"⚠️ GPT 응답 캐시를 열 수 없어 캐시 없이 실행합니다 ({self.path}): {e}")
+            return None
+
+    def is_available(self):
+        """캐시를 사용할 수 있는지 반환합니다."""
+        return self.connection is not None
+
+    def make_key(self, model, prompt, temperature, crop):
+        """(모델, 프롬프트, 온도 구간, 작물)로 캐시 키를 만듭니다.
+
+        Returns:
+            tuple: (캐시 키, 온도 구간 대표값)
+        """
+        bucket = round(round(temperature / self.temperature_step) * self.temperature_step, 3)
+        raw = json.dumps([model, prompt, bucket, crop], ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest(), bucket
+
+    def get(self, model, prompt, temperature, crop):
+        """캐시된 응답을 반환합니다. 응답이 없거나 아직 variants개가 안 차서 새로 만들어야 하면 None"""
+        if not self.is_available():
+            return None
+        started = time.perf_counter()
+        key, _ = self.make_key(model, prompt, temperature, crop)
+        now = time.time()
+        try:
+            with self.lock:
+                rows = self.connection.execute(
+                    "SELECT variant, content FROM llm_responses WHERE cache_key = ? AND created_at >= ? "
+                    "ORDER BY uses, last_used LIMIT ?",
+                    (key, now - self.ttl_seconds, self.variants),
+                ).fetchall()
+                count = self.connection.execute(
+                    "SELECT COUNT(*) FROM llm_responses WHERE cache_key = ? AND created_at >= ?",
+                    (key, now - self.ttl_seconds),
+                ).fetchone()[0]
+                if not rows or count < self.variants:
+                    self.stats["misses"] += 1
+                    return None
+
+                variant, content = rows[0]
+                self.connection.execute(
+                    "UPDATE llm_responses SET uses = uses + 1, last_used = ? WHERE cache_key = ? AND variant = ?",
+                    (now, key, variant),
+                )
+                self.connection.commit()
+                self.stats["hits"] += 1
+                self.stats["hit_seconds"] += time.perf_counter() - started
+                return content
+        except sqlite3.Error as e:
+            print(f"⚠️ GPT 응답 캐시 조회 실패: {e}")
+            return None
+
+    def put(self, model, prompt, temperature, crop, content, api_seconds=0.0):
+        """새로 생성한 응답을 저장하고 만료/초과 항목을 정리합니다."""
+        self.stats["miss_seconds"] += api_seconds
+        if not self.is_available() or not content:
+            return False
+        key, bucket = self.make_key(model, prompt, temperature, crop)
+        now = time.time()
+        try:
+            with self.lock:
+                # 만료된 응답 자리는 새 응답으로 바꿔 씀
+                self.connection.execute(
+                    "DELETE FROM llm_responses WHERE cache_key = ? AND created_at < ?", (key, now - self.ttl_seconds),
+                )
+                variant = self.connection.execute(
+                    "SELECT COALESCE(MAX(variant), -1) + 1 FROM llm_responses WHERE cache_key = ?", (key,),
+                ).fetchone()[0]
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO llm_responses "
+                    "(cache_key, variant, model, crop, temperature, prompt, content, created_at, last_used, uses) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)",
+                    (key, variant, model, crop, bucket, prompt, content, now, now),
+                )
+                self.stats["stores"] += 1
+                self._evict(now)
+                self.connection.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"⚠️ GPT 응답 캐시 저장 실패: {e}")
+            return False
+
+    def _evict(self, now):
+        """TTL이 지난 응답과 max_entries를 넘는 오래된 응답을 지웁니다. (lock 안에서 호출)"""
+        removed = self.connection.execute(
+            "DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,),
+        ).rowcount
+        total = self.connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        if total > self.max_entries:
+            removed += self.connection.execute(
+                "DELETE FROM llm_responses WHERE rowid IN "
+                "(SELECT rowid FROM llm_responses ORDER BY last_used LIMIT ?)",
+                (total - self.max_entries,),
+            ).rowcount
+        self.stats["evictions"] += max(removed, 0)
+
+    def get_stats(self):
+        """적중/실패 횟수와 지연 시간 통계를 반환합니다."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        entries = 0
+        if self.is_available():
+            try:
+                with self.lock:
+                    entries = self.connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+            except sqlite3.Error:
+                pass
+        return {
+            "hits": self.stats["hits"],
+            "misses": self.stats["misses"],
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "stores": self.stats["stores"],
+            "evictions": self.stats["evictions"],
+            "entries": entries,
+            "avg_hit_ms": self.stats["hit_seconds"] / self.stats["hits"] * 1000 if self.stats["hits"] else 0.0,
+            "avg_miss_ms": self.stats["miss_seconds"] / self.stats["stores"] * 1000 if self.stats["stores"] else 0.0,
+            "saved_seconds": (self.stats["miss_seconds"] / self.stats["stores"] * self.stats["hits"])
+            if self.stats["stores"] else 0.0,
+        }
+
+    def close(self):
+        if self.connection:
+            with self.lock:
+                self.connection.close()
+                self.connection = None
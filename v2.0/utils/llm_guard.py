@@ -0,0 +1,223 @@
+import time
+import math
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+# 회로 차단기 상태
+BREAKER_CLOSED = 'closed'        # 정상 - API 호출
+BREAKER_OPEN = 'open'            # 차단 - cooldown 동안 API를 호출하지 않고 기본 템플릿 사용
+BREAKER_HALF_OPEN = 'half_open'  # 시험 - cooldown이 끝나 호출 하나만 허용, 성공하면 정상으로 복귀
+
+BREAKER_STATE_LABELS = {
+    BREAKER_CLOSED: "정상",
+    BREAKER_OPEN: "차단",
+    BREAKER_HALF_OPEN: "시험 호출",
+}
+
+LATENCY_WINDOW_SIZE = 50  # p95 계산에 쓰는 최근 성공 호출 수
+HEDGE_MIN_SAMPLES = 10    # 이 수만큼 표본이 모이기 전에는 예비 요청을 보내지 않음
+
+
+class LLMCallTimeout(Exception):
+    """제한 시간 안에 GPT 응답을 받지 못함"""
+
+
+class LLMCircuitOpen(Exception):
+    """회로 차단기가 열려 있어 GPT를 호출하지 않음"""
+
+
+class LLMCallGuard:
+    """GPT 호출에 제한 시간, 예비(hedged) 요청, 회로 차단기를 적용하는 클래스
+
+    - 호출마다 deadline을 두고, 넘으면 LLMCallTimeout을 발생시켜 브라우저 세션이 멈추지 않게 합니다.
+    - 최근 성공 호출의 p95보다 오래 걸리면 같은 요청을 한 번 더 보내 먼저 도착한 응답을 사용합니다. (hedge 사용 시)
+    - 연속 실패/느린 호출이 failure_threshold번이면 cooldown 동안 차단하고, 이후 시험 호출 하나로 복구를 확인합니다.
+    """
+
+    def __init__(self, deadline=20.0, slow_call_seconds=10.0, failure_threshold=3, cooldown_seconds=120.0,
+                 hedge=False, log=print):
+        self.deadline = deadline
+        self.slow_call_seconds = slow_call_seconds
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self.hedge = hedge
+        self.log = log
+
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='agrion-llm')
+        self.latencies = deque(maxlen=LATENCY_WINDOW_SIZE)
+        self.state = BREAKER_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.stats = {
+            "calls": 0,
+            "successes": 0,
+            "failures": 0,
+            "timeouts": 0,
+            "slow_calls": 0,
+            "hedged": 0,      # 예비 요청을 보낸 호출
+            "hedge_wins": 0,  # 예비 요청 응답이 먼저 도착한 호출
+            "rejected": 0,    # 차단 중이라 호출하지 않은 횟수
+            "opened": 0,      # 차단으로 바뀐 횟수
+            "total_seconds": 0.0,
+        }
+
+    def allow(self):
+        """지금 GPT를 호출해도 되는지 확인합니다. (차단 중이면 False, cooldown이 끝났으면 시험 호출 하나만 허용)"""
+        with self.lock:
+            if self.state == BREAKER_OPEN:
+                if time.monotonic() - self.opened_at < self.cooldown_seconds:
+                    self.stats["rejected"] += 1
+                    return False
+                self._set_state(BREAKER_HALF_OPEN, "cooldown 종료")
+            if self.state == BREAKER_HALF_OPEN:
+                if self.probe_in_flight:
+                    self.stats["rejected"] += 1
+                    return False
+                self.probe_in_flight = True
+            return True
+
+    def call(self, function, deadline=None, slow_call_seconds=None, hedge=None):
+        """function()을 제한 시간 안에 실행하고 결과를 회로 차단기에 기록합니다.
+
+        Args:
+            function: 인자 없이 호출하는 GPT 요청 함수
+            deadline (float): 제한 시간 (초, 기본값: 생성 시 지정한 값)
+            slow_call_seconds (float): 이보다 오래 걸린 성공 호출은 실패로 셉니다.
+            hedge (bool): 예비 요청 사용 여부 (False인 호출은 p95 표본에도 넣지 않음 - 일괄 요청 등)
+
+        Raises:
+            LLMCircuitOpen: 차단 중
+            LLMCallTimeout: 제한 시간 초과
+        """
+        if not self.allow():
+            raise LLMCircuitOpen(f"GPT 호출 차단 중 ({self.remaining_cooldown():.1f}초 남음)")
+
+        deadline = self.deadline if deadline is None else deadline
+        slow_call_seconds = self.slow_call_seconds if slow_call_seconds is None else slow_call_seconds
+        hedge = self.hedge if hedge is None else hedge
+        started = time.monotonic()
+        self.stats["calls"] += 1
+
+        futures = [self.executor.submit(function)]
+        try:
+            hedge_after = self.hedge_threshold() if hedge else None
+            if hedge_after is not None and hedge_after < deadline:
+                done, _ = wait(futures, timeout=hedge_after)
+                if not done:
+                    futures.append(self.executor.submit(function))
+                    self.stats["hedged"] += 1
+                    print(f"🔁 GPT 응답이 p95({hedge_after:.1f}초)보다 늦어 예비 요청을 보냅니다.")
+
+            result = None
+            completed = False  # None을 돌려준 성공 호출도 성공으로 기록
+            error = None
+            pending = list(futures)
+            while pending:
+                remaining = deadline - (time.monotonic() - started)
+                if remaining <= 0:
+                    break
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    pending.remove(future)
+                    if future.exception() is None:
+                        result = future.result()
+                        completed = True
+                        if future is not futures[0]:
+                            self.stats["hedge_wins"] += 1
+                        pending = []
+                        break
+                    error = future.exception()
+                if completed:
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+
+        seconds = time.monotonic() - started
+        self.stats["total_seconds"] += seconds
+        if completed:
+            if hedge:
+                with self.lock:
+                    self.latencies.append(seconds)
+            slow = seconds > slow_call_seconds
+            self._record(success=not slow, seconds=seconds, reason=f"느린 응답 {seconds:.1f}초" if slow else None)
+            return result
+        if error is not None and not pending:
+            self._record(success=False, seconds=seconds, reason=f"오류: {error}")
+            raise error
+        self.stats["timeouts"] += 1
+        self._record(success=False, seconds=seconds, reason=f"{deadline:g}초 제한 시간 초과")
+        raise LLMCallTimeout(f"GPT 응답이 {deadline:g}초 안에 오지 않았습니다.")
+
+    def hedge_threshold(self):
+        """최근 성공 호출 지연 시간의 p95 (표본이 부족하면 None)"""
+        with self.lock:
+            samples = sorted(self.latencies)
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, math.ceil(len(samples) * 0.95) - 1)]
+
+    def _record(self, success, seconds, reason=None):
+        with self.lock:
+            self.probe_in_flight = False
+            if success:
+                self.stats["successes"] += 1
+                self.consecutive_failures = 0
+                if self.state != BREAKER_CLOSED:
+                    self._set_state(BREAKER_CLOSED, f"시험 호출 성공 {seconds:.1f}초")
+                return
+
+            if reason and reason.startswith("느린 응답"):
+                self.stats["slow_calls"] += 1
+            else:
+                self.stats["failures"] += 1
+            self.consecutive_failures += 1
+            if self.state == BREAKER_OPEN:
+                # 차단 전에 시작한 호출의 실패는 cooldown을 늘리지 않음
+                return
+            if self.state == BREAKER_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self.stats["opened"] += 1
+                self._set_state(
+                    BREAKER_OPEN,
+                    f"연속 실패 {self.consecutive_failures}회, 마지막: {reason} - {self.cooldown_seconds:g}초 동안 기본 템플릿 사용",
+                )
+
+    def _set_state(self, state, reason):
+        """상태를 바꾸고 로그에 남깁니다. (lock 안에서 호출)"""
+        if state == self.state:
+            return
+        previous, self.state = self.state, state
+        self.log(f"⚡ GPT 회로 차단기: {BREAKER_STATE_LABELS[previous]} → {BREAKER_STATE_LABELS[state]} ({reason})")
+
+    def remaining_cooldown(self):
+        if self.state != BREAKER_OPEN:
+            return 0.0
+        return max(0.0, self.cooldown_seconds - (time.monotonic() - self.opened_at))
+
+    def get_stats(self):
+        """호출 수, 실패/시간 초과/예비 요청/차단 횟수와 지연 시간 통계를 반환합니다."""
+        with self.lock:
+            samples = sorted(self.latencies)
+        finished = self.stats["successes"] + self.stats["failures"] + self.stats["slow_calls"]
+        return {
+            "state": self.state,
+            "calls": self.stats["calls"],
+            "successes": self.stats["successes"],
+            "failures": self.stats["failures"],
+            "timeouts": self.stats["timeouts"],
+            "slow_calls": self.stats["slow_calls"],
+            "hedged": self.stats["hedged"],
+            "hedge_wins": self.stats["hedge_wins"],
+            "rejected": self.stats["rejected"],
+            "opened": self.stats["opened"],
+            "avg_seconds": self.stats["total_seconds"] / finished if finished else 0.0,
+            "p50_seconds": samples[len(samples) // 2] if samples else 0.0,
+            "p95_seconds": samples[min(len(samples) - 1, math.ceil(len(samples) * 0.95) - 1)] if samples else 0.0,
+        }
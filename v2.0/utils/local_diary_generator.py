@@ -0,0 +1,281 @@
+import re
+import random
+import threading
+
+
+DIARY_MAX_LENGTH = 200        # 작업 내용 최대 길이 (자)
+MAX_LEARNED_SENTENCES = 300   # 작업별로 기억할 승인된 일지 문장 수 (넘으면 오래된 문장부터 버림)
+NGRAM_MIN_SENTENCES = 3       # 이 수만큼 문장이 모여야 n-gram 문장 생성을 사용
+NGRAM_MAX_WORDS = 20          # n-gram 문장 최대 어절 수
+GENERAL_TASK = "기타작업"     # 문장이 없는 작업은 이 작업의 문장을 사용
+
+# 월별 계절 (v1 generate_basic_diary_content와 같은 구분)
+MONTH_SEASONS = {
+    12: "겨울", 1: "겨울", 2: "겨울",
+    3: "봄", 4: "봄",
+    5: "초여름", 6: "초여름",
+    7: "여름", 8: "여름",
+    9: "가을", 10: "가을",
+    11: "늦가을",
+}
+
+# 계절별 관리 문장
+SEASON_NOTES = {
+    "겨울": [
+        "겨울철 토양 상태를 점검했습니다.",
+        "논둑과 배수로가 얼지 않았는지 살펴봤습니다.",
+        "다음 작기를 위해 농자재를 정리했습니다.",
+    ],
+    "봄": [
+        "파종 준비를 위해 토양 상태를 점검했습니다.",
+        "봄철 물 대기 전에 논둑을 정비했습니다.",
+        "육묘 준비 상황을 확인했습니다.",
+    ],
+    "초여름": [
+        "모내기 후 생육 상태를 점검했습니다.",
+        "물 깊이를 조절하며 새끼치기를 도왔습니다.",
+        "초기 병해충 발생 여부를 살펴봤습니다.",
+    ],
+    "여름": [
+        "생육 상태와 병해충 발생을 점검했습니다.",
+        "무더위에 대비해 물 관리를 꼼꼼히 했습니다.",
+        "장마철 배수 상태를 확인했습니다.",
+    ],
+    "가을": [
+        "이삭 여문 정도를 보며 수확 시기를 가늠했습니다.",
+        "완숙도를 점검하고 수확 준비를 했습니다.",
+        "쓰러진 포기가 없는지 살펴봤습니다.",
+    ],
+    "늦가을": [
+        "수확 후 논을 정리했습니다.",
+        "볏짚과 농기계를 정리했습니다.",
+        "내년 작기를 위해 토양 상태를 확인했습니다.",
+    ],
+}
+
+# 날씨별 문장 (작성 페이지 wfKor 값)
+WEATHER_NOTES = {
+    "맑음": ["맑은 날씨 덕분에 작업이 순조로웠습니다.", "날씨가 맑아 작업하기 좋았습니다."],
+    "구름많음": ["구름이 많았지만 작업에는 지장이 없었습니다.", "구름 낀 날씨라 햇볕이 덜해 작업이 수월했습니다."],
+    "흐림": ["흐린 날씨라 작업 중 하늘을 살피며 진행했습니다.", "날이 흐려 비 소식에 대비했습니다."],
+    "비": ["비가 와서 배수로를 점검했습니다.", "비 소식이 있어 물꼬를 조절했습니다."],
+    "눈": ["눈이 내려 시설물 피해가 없는지 확인했습니다.", "눈이 와서 농로와 논둑 상태를 살폈습니다."],
+}
+HOT_NOTE = "한낮 더위를 피해 이른 오전에 작업했습니다."
+COLD_NOTE = "기온이 낮아 작업 중 동해 여부도 살폈습니다."
+HOT_TEMPERATURE = 30   # 최고 기온이 이 값 이상이면 더위 문장 (°C)
+COLD_TEMPERATURE = 0   # 최저 기온이 이 값 이하면 추위 문장 (°C)
+
+INTRO_VERBS = ["진행했습니다", "실시했습니다", "마쳤습니다"]
+PURPOSE_FRAMES = ["{description}{object_particle} 목표로 작업했습니다.", "{description}에 중점을 두었습니다."]
+CLOSING_NOTES = [
+    "다음 주에도 상태를 계속 확인할 예정입니다.",
+    "작업 후 주변을 정리했습니다.",
+    "작업 내용을 기록해 다음 작업에 참고하겠습니다.",
+]
+
+DATE_PATTERN = re.compile(r'\d{4}[-./]\d{1,2}[-./]\d{1,2}\s*|\d{1,2}월\s*\d{1,2}일\s*')
+SENTENCE_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+
+def normalize_task(task_step):
+    """공백을 지워 작업 비교용 이름을 만듭니다."""
+    return re.sub(r'\s+', '', task_step or '')
+
+
+def object_particle(word):
+    """단어 끝 글자 받침에 맞는 목적격 조사(을/를)를 반환합니다."""
+    if not word:
+        return "를"
+    last = word[-1]
+    if '가' <= last <= '힣':
+        return "을" if (ord(last) - ord('가')) % 28 else "를"
+    return "를"
+
+
+def split_sentences(text):
+    """일지 문장 목록을 반환합니다. (날짜 표현은 지우고 '다.'로 끝나는 문장만 사용)"""
+    sentences = []
+    for sentence in SENTENCE_PATTERN.split(DATE_PATTERN.sub('', text or '').strip()):
+        sentence = sentence.strip()
+        if sentence.endswith('다.') and len(sentence) >= 8:
+            sentences.append(sentence)
+    return sentences
+
+
+class LocalDiaryGenerator:
+    """네트워크 없이 영농일지 작업 내용을 만드는 로컬 생성기 (작물별로 하나)
+
+    - 기본 템플릿, 스케줄 설명, 등록에 성공한 일지 문장으로 작업별 문장 모음과 어절 3-gram을 만들어 둡니다.
+    - 도입(작업) → 목적(스케줄 설명) → 세부(문장 모음/3-gram) → 날씨 → 계절 → 마무리 순서로 칸을 채우고 200자를 넘지 않게 자릅니다.
+    - 생성은 미리 만든 목록에서 무작위로 고르는 것뿐이라 한 건에 1ms도 걸리지 않습니다.
+    """
+
+    def __init__(self, crop_type, task_texts, schedule_data=None, seed=None):
+        self.crop_type = crop_type
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.intros = {}        # 작업 → 도입 문장
+        self.details = {}       # 작업 → 세부 문장
+        self.descriptions = {}  # 작업 → 스케줄 설명 (명사구)
+        self.ngrams = {}        # 작업 → {(앞 어절, 앞 어절): [다음 어절, ...]}
+        self.learned = {}       # 작업 → 승인된 일지 문장 수
+
+        for task_step, text in task_texts.items():
+            sentences = split_sentences(text)
+            if sentences:
+                self._add_unique(self.intros, task_step, sentences[0])
+                for sentence in sentences[1:]:
+                    self._add_detail(task_step, sentence)
+        for month_data in (schedule_data or {}).values():
+            for stage_tasks in month_data.values():
+                for task in stage_tasks:
+                    description = (task.get("설명") or '').strip().rstrip('.')
+                    if description:
+                        self._add_unique(self.descriptions, task["작업명"], description)
+
+    def _add_unique(self, table, task_step, value):
+        values = table.setdefault(normalize_task(task_step), [])
+        if value not in values:
+            values.append(value)
+            return True
+        return False
+
+    def _add_detail(self, task_step, sentence):
+        if not self._add_unique(self.details, task_step, sentence):
+            return
+        key = normalize_task(task_step)
+        details = self.details[key]
+        if len(details) > MAX_LEARNED_SENTENCES:
+            del details[0]
+        chain = self.ngrams.setdefault(key, {})
+        words = ['<s>', '<s>'] + sentence.split() + ['</s>']
+        for index in range(len(words) - 2):
+            chain.setdefault((words[index], words[index + 1]), []).append(words[index + 2])
+
+    def learn(self, text, task_step):
+        """등록에 성공한 일지 내용을 문장 모음과 3-gram에 추가합니다."""
+        key = normalize_task(task_step)
+        with self.lock:
+            for index, sentence in enumerate(split_sentences(text)):
+                if index == 0 and key in normalize_task(sentence):
+                    # 작업 이름이 들어간 첫 문장은 도입 문장 (작물 이름으로 시작하지 않으면 도입과 겹치므로 버림)
+                    if sentence.startswith(self.crop_type):
+                        self._add_unique(self.intros, task_step, sentence)
+                    continue
+                self._add_detail(task_step, sentence)
+                self.learned[key] = self.learned.get(key, 0) + 1
+
+    def _pool(self, table, task_step):
+        """작업에 맞는 목록 (정확히 같은 작업 → 이름이 포함된 작업 → 기타작업 순서)"""
+        key = normalize_task(task_step)
+        if table.get(key):
+            return table[key]
+        for other, values in table.items():
+            if values and (other in key or key in other):
+                return values
+        return table.get(GENERAL_TASK, [])
+
+    def _intro(self, task_step, month, day):
+        if self.rng.random() < 0.5 and self._pool(self.intros, task_step):
+            intro = self.rng.choice(self._pool(self.intros, task_step))
+        else:
+            work = task_step if task_step.endswith("작업") else f"{task_step} 작업"
+            intro = f"{self.crop_type} {work}{object_particle(work)} {self.rng.choice(INTRO_VERBS)}."
+        if month and day and self.rng.random() < 0.5:
+            intro = f"{month}월 {day}일 {intro}"
+        return intro
+
+    def _ngram_sentence(self, task_step):
+        chain = self._pool(self.ngrams, task_step)
+        if not chain or len(self._pool(self.details, task_step)) < NGRAM_MIN_SENTENCES:
+            return None
+        state, words = ('<s>', '<s>'), []
+        while len(words) < NGRAM_MAX_WORDS:
+            next_word = self.rng.choice(chain.get(state, ['</s>']))
+            if next_word == '</s>':
+                break
+            words.append(next_word)
+            state = (state[1], next_word)
+        sentence = " ".join(words)
+        return sentence if sentence.endswith('다.') else None
+
+    def _weather_notes(self, weather_data):
+        if not weather_data:
+            return []
+        if isinstance(weather_data, str):
+            weather_data = {"weather": weather_data}
+        notes = []
+        for weather, sentences in WEATHER_NOTES.items():
+            if weather in (weather_data.get("weather") or ''):
+                notes.append(self.rng.choice(sentences))
+                break
+        try:
+            if float(weather_data.get("high_temp")) >= HOT_TEMPERATURE:
+                notes.append(HOT_NOTE)
+            elif float(weather_data.get("low_temp")) <= COLD_TEMPERATURE:
+                notes.append(COLD_NOTE)
+        except (TypeError, ValueError):
+            pass
+        return notes
+
+    def generate(self, task_step, current_date=None, weather_data=None):
+        """작업/날짜(월, 계절)/날씨에 맞는 영농일지 작업 내용을 만듭니다. (200자 이내)
+
+        Args:
+            task_step (str): 작업 단계 (예: "비료작업")
+            current_date (str): 날짜 (예: "2024-05-04")
+            weather_data (dict|str): 작성 페이지 날씨 ({"weather", "low_temp", "high_temp"}) 또는 날씨 이름
+        """
+        month = day = None
+        if current_date:
+            try:
+                _, month, day = (int(part) for part in current_date.split('-')[:3])
+            except ValueError:
+                month = day = None
+
+        with self.lock:
+            rng = self.rng
+            intro = self._intro(task_step, month, day)
+
+            # 우선순위 순서로 (출력 위치, 문장) 후보를 만든 뒤 200자 안에 들어가는 것만 사용
+            candidates = []
+            details = self._pool(self.details, task_step)
+            detail = self._ngram_sentence(task_step) if rng.random() < 0.5 else None
+            if not detail and details:
+                detail = rng.choice(details)
+            if detail:
+                candidates.append((2, detail))
+            for note in self._weather_notes(weather_data):
+                candidates.append((3, note))
+            descriptions = self._pool(self.descriptions, task_step)
+            if descriptions and rng.random() < 0.6:
+                description = rng.choice(descriptions)
+                frame = rng.choice(PURPOSE_FRAMES)
+                candidates.append((1, frame.format(description=description, object_particle=object_particle(description))))
+            if month and rng.random() < 0.5:
+                candidates.append((4, rng.choice(SEASON_NOTES[MONTH_SEASONS[month]])))
+            if rng.random() < 0.4:
+                candidates.append((5, rng.choice(CLOSING_NOTES)))
+
+        chosen = [(0, intro)]
+        length = len(intro)
+        for position, sentence in candidates:
+            if sentence in (text for _, text in chosen):
+                continue
+            if length + 1 + len(sentence) <= DIARY_MAX_LENGTH:
+                chosen.append((position, sentence))
+                length += 1 + len(sentence)
+        content = " ".join(text for _, text in sorted(chosen, key=lambda item: item[0]))
+        if len(content) > DIARY_MAX_LENGTH:
+            content = content[:DIARY_MAX_LENGTH - 3] + "..."
+        return content
+
+    def get_stats(self):
+        """작업별 문장 모음 크기를 반환합니다."""
+        with self.lock:
+            return {
+                "tasks": len(set(self.intros) | set(self.details)),
+                "sentences": sum(len(values) for values in self.details.values()),
+                "learned": sum(self.learned.values()),
+            }